@@ -0,0 +1,87 @@
+"""
+Benchmark: agent assignment cost vs registered agent count
+
+Compares the capability index used by PMCoordinator._find_best_agent against the
+original linear scan over agent_capabilities, including the +0.1 load update
+applied after every assignment.
+
+Usage: python benchmarks/bench_agent_assignment.py
+"""
+
+import random
+import time
+from datetime import datetime
+
+from common import quiet_logging
+
+from intercept.agent_index import AgentCapabilityIndex
+from intercept.pm_coordinator import AgentCapability
+
+CAPABILITIES = ['task_breakdown', 'coordination', 'system_design', 'technical_architecture',
+                'code_implementation', 'debugging', 'testing', 'quality_validation',
+                'user_experience', 'accessibility', 'research', 'documentation']
+ASSIGNMENTS = 2000
+
+
+def make_agents(count: int, rng: random.Random):
+    return [
+        AgentCapability(
+            agent_name=f"agent_{i}",
+            capabilities=rng.sample(CAPABILITIES, rng.randint(1, 4)),
+            current_load=0.0,
+            avg_response_time=rng.uniform(0.5, 4.0),
+            success_rate=rng.uniform(0.8, 1.0),
+            last_activity=datetime.now()
+        )
+        for i in range(count)
+    ]
+
+
+def linear_best_agent(agents, required_capabilities):
+    best_agent, best_score = None, -1
+    for agent in agents.values():
+        match_score = len(set(required_capabilities) & set(agent.capabilities))
+        if match_score == 0:
+            continue
+        performance_score = agent.success_rate - (agent.avg_response_time / 10)
+        total_score = match_score + (performance_score - agent.current_load * 0.5)
+        if total_score > best_score:
+            best_score, best_agent = total_score, agent.agent_name
+    return best_agent
+
+
+def bench(agent_count: int):
+    rng = random.Random(agent_count)
+    queries = [rng.sample(CAPABILITIES, rng.choice([1, 1, 1, 2])) for _ in range(ASSIGNMENTS)]
+
+    linear_agents = {a.agent_name: a for a in make_agents(agent_count, random.Random(1))}
+    started = time.perf_counter()
+    for required in queries:
+        best = linear_best_agent(linear_agents, required)
+        if best:
+            linear_agents[best].current_load += 0.1
+    linear_us = (time.perf_counter() - started) / ASSIGNMENTS * 1e6
+
+    indexed_agents = {a.agent_name: a for a in make_agents(agent_count, random.Random(1))}
+    index = AgentCapabilityIndex(indexed_agents.values())
+    started = time.perf_counter()
+    for required in queries:
+        best = index.best_agent(required)
+        if best:
+            indexed_agents[best].current_load += 0.1
+            index.update(indexed_agents[best])
+    indexed_us = (time.perf_counter() - started) / ASSIGNMENTS * 1e6
+
+    return linear_us, indexed_us
+
+
+def run():
+    quiet_logging()
+    print(f"{'agents':>8} {'linear us/assign':>18} {'index us/assign':>17}")
+    for agent_count in (10, 100, 1000, 10000):
+        linear_us, indexed_us = bench(agent_count)
+        print(f"{agent_count:>8} {linear_us:>18.1f} {indexed_us:>17.1f}")
+
+
+if __name__ == "__main__":
+    run()
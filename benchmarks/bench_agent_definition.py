@@ -0,0 +1,53 @@
+"""
+Benchmark: "which tasks does this agent depend on" by re-parsing the
+base_definition YAML block versus the loader's indexed AgentDefinition
+
+Usage: python benchmarks/bench_agent_definition.py [lookups]
+"""
+
+import re
+import sys
+
+import yaml
+
+from common import REPO_ROOT, percentiles, quiet_logging, timed
+
+from intercept.agent_loader import AgentExtensionLoader
+
+AGENTS = sorted(path.stem for path in (REPO_ROOT / ".bmad-core" / "agents").glob("*.md"))
+YAML_BLOCK = re.compile(r'```ya?ml\n(.*?)\n```', re.DOTALL)
+
+
+def run(lookups: int = 2000) -> None:
+    quiet_logging()
+    loader = AgentExtensionLoader(str(REPO_ROOT / ".bmad-core"), str(REPO_ROOT))
+
+    def reparsed(agent_name):
+        # What consumers did with the raw blob before definitions were indexed
+        text = loader.load_agent_with_extensions(agent_name)['base_definition']
+        return yaml.safe_load(YAML_BLOCK.search(text).group(1))['dependencies'].get('tasks', [])
+
+    results = [
+        ('reparse', [timed(lambda: reparsed(AGENTS[i % len(AGENTS)])) for i in range(lookups // 10)]),
+        ('indexed', [
+            timed(lambda: loader.agent_definition(AGENTS[i % len(AGENTS)]).depends_on('tasks')) for i in range(lookups)
+        ]),
+    ]
+    loader.watch(use_inotify=False)
+    try:
+        results.append(('watched', [
+            timed(lambda: loader.agent_definition(AGENTS[i % len(AGENTS)]).depends_on('tasks')) for i in range(lookups)
+        ]))
+    finally:
+        loader.unwatch()
+
+    print(f"agents: {len(AGENTS)}, lookups: {lookups}")
+    for name, samples in results:
+        stats = percentiles(samples)
+        mean_us = sum(samples) / len(samples) * 1e6
+        print(f"{name:8} mean {mean_us:.1f}us  p50 {stats['p50_ms'] * 1000:.1f}us  p99 {stats['p99_ms'] * 1000:.1f}us")
+    print(f"definition cache: {loader.cache_stats()['definition']}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,55 @@
+"""
+Benchmark: agent loads per dispatch without a cache, with the stat-keyed cache
+and with a file watcher vouching for unchanged agents
+
+Usage: python benchmarks/bench_agent_loader.py [loads]
+"""
+
+import sys
+
+from common import REPO_ROOT, percentiles, quiet_logging, timed
+
+from intercept.agent_loader import AgentExtensionLoader
+
+AGENTS = sorted(path.stem for path in (REPO_ROOT / ".bmad-core" / "agents").glob("*.md"))
+
+
+def run(loads: int = 5000) -> None:
+    quiet_logging()
+    loader = AgentExtensionLoader(str(REPO_ROOT / ".bmad-core"), str(REPO_ROOT))
+
+    def uncached(agent_name):
+        loader.clear_cache()  # the pre-cache behaviour: read, hash and parse on every load
+        loader.load_agent_with_extensions(agent_name)
+
+    cold_samples = [timed(lambda: uncached(AGENTS[i % len(AGENTS)])) for i in range(loads // 10)]
+    loader.clear_cache()
+    warm_samples = [
+        timed(lambda: loader.load_agent_with_extensions(AGENTS[i % len(AGENTS)], {'task': i})) for i in range(loads)
+    ]
+    hit_rates = loader.cache_stats()
+
+    loader.watch(poll_interval=1.0, use_inotify=False)
+    try:
+        watched_samples = [
+            timed(lambda: loader.load_agent_with_extensions(AGENTS[i % len(AGENTS)], {'task': i}))
+            for i in range(loads)
+        ]
+    finally:
+        loader.unwatch()
+
+    results = []
+    for name, samples in (('uncached', cold_samples), ('cached', warm_samples), ('watched', watched_samples)):
+        stats = percentiles(samples)
+        stats['mean_ms'] = sum(samples) / len(samples) * 1000
+        results.append((name, stats))
+
+    print(f"agents: {len(AGENTS)}, loads: {loads}")
+    for name, stats in results:
+        print(f"{name:9} mean {stats['mean_ms'] * 1000:.0f}us  p50 {stats['p50_ms'] * 1000:.0f}us  "
+              f"p99 {stats['p99_ms'] * 1000:.0f}us")
+    print(f"hit rates (cached): {hit_rates}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,58 @@
+"""
+Benchmark: time to first dispatch in a fresh process
+
+Each scenario runs in a new interpreter, timed from importing the loader until
+an agent configuration is ready; 'all agents' is until every agent is loaded.
+
+Usage: python benchmarks/bench_agent_preload.py [runs]
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from common import REPO_ROOT
+
+SCENARIO = r'''
+import json, sys, time
+sys.path.insert(0, {root!r})
+started = time.perf_counter()
+from intercept.agent_loader import AgentExtensionLoader
+loader = AgentExtensionLoader({core!r}, {auto!r}, snapshot_path={snapshot!r})
+mode = {mode!r}
+if mode != 'lazy':
+    loader.preload_all()
+loader.load_agent_with_extensions('pm')
+first = time.perf_counter() - started
+for agent_name in loader.discover_agents():
+    loader.load_agent_with_extensions(agent_name)
+print(json.dumps({{'first': first, 'all': time.perf_counter() - started}}))
+'''
+
+
+def scenario(mode: str, snapshot) -> dict:
+    code = SCENARIO.format(root=str(REPO_ROOT), core=str(REPO_ROOT / ".bmad-core"), auto=str(REPO_ROOT),
+                           snapshot=snapshot, mode=mode)
+    return json.loads(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout)
+
+
+def run(runs: int = 10) -> None:
+    snapshot = str(Path(tempfile.mkdtemp(prefix="bmad_snapshot_")) / "agents.snapshot")
+    scenario('preload', snapshot)  # write the snapshot once
+    cases = {
+        'lazy load on dispatch': ('lazy', None),
+        'preload_all, no snapshot': ('preload', None),
+        'preload_all from snapshot': ('preload', snapshot),
+    }
+    for name, (mode, path) in cases.items():
+        samples = [scenario(mode, path) for _ in range(runs)]
+        first = statistics.median(s['first'] for s in samples) * 1000
+        every = statistics.median(s['all'] for s in samples) * 1000
+        print(f"{name:27} first dispatch {first:6.1f}ms   all agents {every:6.1f}ms")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,83 @@
+"""
+Benchmark: coordinate_task_async vs coordinate_task latency and event-loop stalls
+
+Reports p50/p99 per-call latency for both paths and the worst event-loop lag seen
+by a heartbeat task while coordinations run inside the loop.
+
+Usage: python benchmarks/bench_async_coordination.py [calls] [concurrency]
+"""
+
+import asyncio
+import sys
+import time
+
+from common import create_coordination_db, percentiles, quiet_logging
+
+from intercept.pm_coordinator import PMCoordinator
+
+PROMPT = "Design and implement the system architecture to integrate multiple payment providers"
+
+
+async def heartbeat(lags, stop, interval=0.001):
+    """Record how late the loop wakes us up"""
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - expected)
+
+
+async def run_sync_in_loop(coordinator, calls):
+    latencies = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        coordinator.coordinate_task(PROMPT)
+        latencies.append(time.perf_counter() - started)
+        await asyncio.sleep(0)
+    return latencies
+
+
+async def run_async(coordinator, calls, concurrency):
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            await coordinator.coordinate_task_async(PROMPT)
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(one() for _ in range(calls)))
+    return latencies
+
+
+async def measure(label, runner):
+    lags, stop = [], asyncio.Event()
+    beat = asyncio.create_task(heartbeat(lags, stop))
+    started = time.perf_counter()
+    latencies = await runner()
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await beat
+
+    stats = percentiles(latencies)
+    print(f"{label:<28} p50 {stats['p50_ms']:7.2f}ms  p99 {stats['p99_ms']:7.2f}ms  "
+          f"max loop lag {max(lags, default=0) * 1000:7.2f}ms  {len(latencies) / elapsed:7.0f} calls/s")
+
+
+async def main(calls, concurrency):
+    sync_coordinator = PMCoordinator(create_coordination_db(), load_flush_interval=None)
+    await measure("coordinate_task (sync)", lambda: run_sync_in_loop(sync_coordinator, calls))
+    sync_coordinator.close()
+
+    async_coordinator = PMCoordinator(create_coordination_db(), load_flush_interval=None)
+    await measure("coordinate_task_async (1)", lambda: run_async(async_coordinator, calls, 1))
+    await measure(f"coordinate_task_async ({concurrency})", lambda: run_async(async_coordinator, calls, concurrency))
+    async_coordinator.close()
+
+
+if __name__ == "__main__":
+    quiet_logging()
+    asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 300,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    ))
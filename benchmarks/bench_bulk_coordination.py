@@ -0,0 +1,37 @@
+"""
+Benchmark: PMCoordinator.coordinate_tasks_bulk vs looping coordinate_task
+
+Usage: python benchmarks/bench_bulk_coordination.py [prompt_count]
+"""
+
+import sys
+
+from common import create_coordination_db, quiet_logging, timed
+
+from intercept.pm_coordinator import PMCoordinator
+
+
+def run(prompt_count: int = 500) -> None:
+    quiet_logging()
+    prompts = [f"Implement and test feature {i} for the billing system" for i in range(prompt_count)]
+
+    loop_coordinator = PMCoordinator(create_coordination_db())
+
+    def loop():
+        for prompt in prompts:
+            loop_coordinator.coordinate_task(prompt)
+
+    loop_seconds = timed(loop)
+
+    bulk_coordinator = PMCoordinator(create_coordination_db())
+    summary = bulk_coordinator.coordinate_tasks_bulk(prompts)
+
+    print(f"prompts:               {prompt_count}")
+    print(f"loop coordinate_task:  {loop_seconds:.3f}s ({prompt_count / loop_seconds:,.0f} prompts/s)")
+    print(f"coordinate_tasks_bulk: {summary['elapsed_seconds']:.3f}s ({summary['prompts_per_second']:,.0f} prompts/s)")
+    print(f"speedup:               {loop_seconds / summary['elapsed_seconds']:.1f}x")
+    print(f"bulk failures:         {summary['failed']}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
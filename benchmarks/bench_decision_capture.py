@@ -0,0 +1,64 @@
+"""
+Benchmark: PMDecisionCapture per-call commits vs group-commit durability modes
+
+Modes are interleaved within each run; throughput and speedup are medians
+over the runs, each speedup against the same run's per-call baseline.
+
+Usage: python benchmarks/bench_decision_capture.py [decision_count] [threads] [runs]
+"""
+
+import statistics
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from common import create_coordination_db, quiet_logging, timed
+
+from intercept.decision_capture import DecisionContext, DecisionType, PMDecisionCapture
+
+
+def make_decision(i: int) -> DecisionContext:
+    return DecisionContext(
+        decision_id='',
+        decision_type=DecisionType.TASK_ASSIGNMENT,
+        context_data={'user_prompt': f"Implement feature {i}", 'task_breakdown_hash': f"{i:032x}"},
+        reasoning_process="Capability matching and load balancing",
+        outcome="Task decomposed into 4 subtasks",
+        confidence_score=8,
+        agent_assignments={'subtask_0': 'james_developer'}
+    )
+
+
+def measure(durability, decisions, threads: int) -> float:
+    capture = PMDecisionCapture(create_coordination_db(), durability=durability)
+
+    def run():
+        with ThreadPoolExecutor(threads) as pool:
+            list(pool.map(capture.capture_decision, decisions))
+        capture.flush()
+
+    seconds = timed(run)
+    capture.close()
+    return len(decisions) / seconds
+
+
+def run(decision_count: int = 2000, threads: int = 32, runs: int = 5) -> None:
+    quiet_logging()
+    decisions = [make_decision(i) for i in range(decision_count)]
+
+    modes = (None, 'sync', 'group', 'async')
+    samples = [{mode: measure(mode, decisions, threads) for mode in modes} for _ in range(runs)]
+    print(f"decisions: {decision_count}  threads: {threads}  runs: {runs}")
+    print(f"per-call commit: {statistics.median(s[None] for s in samples):,.0f} decisions/s")
+    for durability in modes[1:]:
+        throughput = statistics.median(s[durability] for s in samples)
+        speedups = sorted(s[durability] / s[None] for s in samples)
+        print(f"{durability + ':':16} {throughput:,.0f} decisions/s "
+              f"({statistics.median(speedups):.1f}x, range {speedups[0]:.1f}-{speedups[-1]:.1f}x)")
+
+
+if __name__ == "__main__":
+    run(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 32,
+        int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    )
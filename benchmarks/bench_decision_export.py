@@ -0,0 +1,49 @@
+"""
+Benchmark: export_decision_data (in-memory string) vs streaming export_decisions
+
+Usage: python benchmarks/bench_decision_export.py [decision_count]
+"""
+
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from common import create_coordination_db, quiet_logging, timed
+
+from intercept.decision_capture import DecisionAnalytics, DecisionContext, DecisionType, PMDecisionCapture
+
+
+def peak_mb(fn) -> tuple:
+    tracemalloc.start()
+    seconds = timed(fn)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak / 1e6
+
+
+def run(decision_count: int = 20000) -> None:
+    quiet_logging()
+    capture = PMDecisionCapture(create_coordination_db())
+    context = {'user_prompt': "Implement feature", 'notes': ["subtask detail"] * 50}
+    capture.capture_decisions([
+        DecisionContext('', DecisionType.TASK_ASSIGNMENT, context, "Reasoning, with \"quotes\"\n" * 20, "Outcome", 8)
+        for _ in range(decision_count)
+    ])
+    analytics = DecisionAnalytics(capture)
+    out_dir = tempfile.mkdtemp(prefix="bmad_export_")
+
+    cases = (
+        ('export_decision_data json', lambda: analytics.export_decision_data('json')),
+        ('export_decisions jsonl', lambda: analytics.export_decisions(os.path.join(out_dir, 'd.jsonl'))),
+        ('export_decisions jsonl.gz', lambda: analytics.export_decisions(os.path.join(out_dir, 'd.jsonl.gz'))),
+        ('export_decisions csv', lambda: analytics.export_decisions(os.path.join(out_dir, 'd.csv'), 'csv')),
+    )
+    print(f"decisions: {decision_count}")
+    for name, fn in cases:
+        seconds, peak = peak_mb(fn)
+        print(f"{name:26} {seconds:.3f}s  peak {peak:,.1f} MB")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
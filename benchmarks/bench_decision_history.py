@@ -0,0 +1,49 @@
+"""
+Benchmark: peak memory of get_decision_history vs streaming iter_decision_history
+
+Usage: python benchmarks/bench_decision_history.py [decision_count]
+"""
+
+import sys
+import tracemalloc
+
+from common import create_coordination_db, quiet_logging, timed
+
+from intercept.decision_capture import DecisionContext, DecisionType, PMDecisionCapture
+
+
+def peak_mb(fn) -> tuple:
+    tracemalloc.start()
+    seconds = timed(fn)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak / 1e6
+
+
+def run(decision_count: int = 20000) -> None:
+    quiet_logging()
+    capture = PMDecisionCapture(create_coordination_db())
+    context = {'user_prompt': "Implement feature", 'notes': ["subtask detail"] * 50}
+    capture.capture_decisions([
+        DecisionContext('', DecisionType.TASK_ASSIGNMENT, context, "Reasoning " * 40, "Outcome", 8,
+                        agent_assignments={f"subtask_{i}": 'james_developer' for i in range(8)})
+        for _ in range(decision_count)
+    ])
+
+    def eager():
+        sum(row['confidence_score'] for row in capture.get_decision_history())
+
+    def streaming():
+        sum(record['confidence_score'] for record in capture.iter_decision_history())
+
+    def projected():
+        sum(record['confidence_score'] for record in capture.iter_decision_history(columns=['confidence_score']))
+
+    print(f"decisions: {decision_count}")
+    for name, fn in (('get_decision_history', eager), ('iter (all columns)', streaming), ('iter (projected)', projected)):
+        seconds, peak = peak_mb(fn)
+        print(f"{name:22} {seconds:.3f}s  peak {peak:,.1f} MB")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,55 @@
+"""
+Benchmark: search_decisions latency on a large decision log
+
+Usage: python benchmarks/bench_decision_search.py [decision_count]
+"""
+
+import random
+import sqlite3
+import sys
+
+from common import create_coordination_db, percentiles, quiet_logging, timed
+
+from intercept.decision_capture import DecisionType, PMDecisionCapture
+
+WORDS = ("schema migration login billing cache queue latency retry deploy rollback review security "
+         "architect developer analyst tester budget escalate refactor index throughput").split()
+
+
+def run(decision_count: int = 200000, queries: int = 200) -> None:
+    quiet_logging()
+    rng = random.Random(7)
+    db_path = create_coordination_db()
+    capture = PMDecisionCapture(db_path)
+
+    def load():
+        with sqlite3.connect(db_path) as conn:
+            conn.executemany(
+                "INSERT INTO pm_decision_log (decision_context, decision_type, reasoning_process, outcome, confidence_score)"
+                " VALUES ('{}', ?, ?, ?, ?)",
+                (
+                    (rng.choice(list(DecisionType)).value,
+                     ' '.join(rng.choices(WORDS, k=30)) + f" ticket{i}",
+                     ' '.join(rng.choices(WORDS, k=4)),
+                     rng.randint(1, 10))
+                    for i in range(decision_count)
+                )
+            )
+
+    load_seconds = timed(load)
+    timed(lambda: capture.search_decisions("warmup"))
+
+    cases = {
+        'rare term': lambda: capture.search_decisions(f"ticket{rng.randrange(decision_count)}"),
+        'two common terms': lambda: capture.search_decisions(' '.join(rng.sample(WORDS, 2))),
+        'phrase + type filter': lambda: capture.search_decisions(
+            f'"{rng.choice(WORDS)} {rng.choice(WORDS)}"', DecisionType.QUALITY_GATE),
+    }
+    print(f"decisions: {decision_count} (loaded with triggers in {load_seconds:.1f}s)")
+    for name, query in cases.items():
+        stats = percentiles([timed(query) for _ in range(queries)])
+        print(f"{name:22} p50 {stats['p50_ms']:.2f}ms  p99 {stats['p99_ms']:.2f}ms")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
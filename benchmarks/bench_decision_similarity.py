@@ -0,0 +1,61 @@
+"""
+Benchmark: near-duplicate decision lookup with the MinHash/LSH index
+
+Usage: python benchmarks/bench_decision_similarity.py [decision_count]
+"""
+
+import json
+import random
+import sqlite3
+import sys
+
+from common import create_coordination_db, percentiles, quiet_logging, timed
+
+from intercept.decision_capture import DecisionType, PMDecisionCapture
+
+WORDS = ("schema migration login billing cache queue latency retry deploy rollback review security "
+         "architect developer analyst tester budget escalate refactor index throughput portal invoice "
+         "oauth refund metering onboarding export search payload workflow agent gate notification").split()
+
+
+def run(decision_count: int = 100000, queries: int = 500) -> None:
+    quiet_logging()
+    rng = random.Random(11)
+    db_path = create_coordination_db()
+    prompts = [' '.join(rng.choices(WORDS, k=rng.randint(6, 14))) + f" ticket {i}" for i in range(decision_count)]
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO pm_decision_log (decision_context, decision_type, reasoning_process, outcome, confidence_score)"
+            " VALUES (?, ?, 'reasoning', 'outcome', 8)",
+            ((json.dumps({'user_prompt': prompt}), DecisionType.TASK_ASSIGNMENT.value) for prompt in prompts)
+        )
+
+    capture = PMDecisionCapture(db_path)
+    index_seconds = timed(capture.similarity_index.refresh)
+    capture.close()
+    reopened = PMDecisionCapture(db_path)
+    load_seconds = timed(reopened.similarity_index.refresh)
+
+    def near_duplicate():
+        words = rng.choice(prompts).split()
+        words[rng.randrange(len(words))] = rng.choice(WORDS)
+        return ' '.join(words)
+
+    lookups = [near_duplicate() for _ in range(queries)]
+    hits = sum(bool(reopened.find_similar_decisions(text, limit=5)) for text in lookups)
+    stats = percentiles([timed(lambda: reopened.find_similar_decisions(text, limit=5)) for text in lookups])
+
+    def linear_scan(text):
+        words = set(text.split())
+        return max(prompts, key=lambda prompt: len(words & set(prompt.split())) / len(words | set(prompt.split())))
+
+    scan = percentiles([timed(lambda: linear_scan(text)) for text in lookups[:10]])
+
+    print(f"decisions: {decision_count}")
+    print(f"hash + persist all: {index_seconds:.1f}s, reload from decision_minhash: {load_seconds:.1f}s")
+    print(f"near-duplicate lookup  p50 {stats['p50_ms']:.3f}ms  p99 {stats['p99_ms']:.3f}ms  (found {hits}/{queries})")
+    print(f"exact Jaccard scan     p50 {scan['p50_ms']:.1f}ms")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
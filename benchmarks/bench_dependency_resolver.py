@@ -0,0 +1,46 @@
+"""
+Benchmark: resolving every agent's and team's resource closure per request,
+walked from scratch versus memoized
+
+Usage: python benchmarks/bench_dependency_resolver.py [requests]
+"""
+
+import sys
+
+from common import REPO_ROOT, percentiles, quiet_logging, timed
+
+from intercept.agent_loader import AgentExtensionLoader
+from intercept.dependency_resolver import DependencyResolver
+
+
+def run(requests: int = 2000) -> None:
+    quiet_logging()
+    resolver = DependencyResolver(AgentExtensionLoader(str(REPO_ROOT / ".bmad-core"), str(REPO_ROOT)))
+    targets = [('agent', name) for name in resolver.loader.discover_agents()]
+    targets += [('team', name) for name in resolver.teams()]
+
+    def resolve(i):
+        kind, name = targets[i % len(targets)]
+        return resolver.resolve_agent(name) if kind == 'agent' else resolver.resolve_team(name)
+
+    def from_scratch(i):
+        resolver.invalidate()
+        resolver.loader.clear_cache()
+        return resolve(i)
+
+    cold_samples = [timed(lambda: from_scratch(i)) for i in range(requests // 10)]
+    resolver.invalidate()
+    warm_samples = [timed(lambda: resolve(i)) for i in range(requests)]
+
+    largest = max((resolve(i) for i in range(len(targets))), key=lambda closure: closure.total_bytes)
+    print(f"targets: {len(targets)}, requests: {requests}; largest closure {largest.kind} {largest.name}: "
+          f"{len(largest.paths)} files, {largest.total_bytes / 1024:.0f} KiB")
+    for name, samples in (('walk', cold_samples), ('memoized', warm_samples)):
+        stats = percentiles(samples)
+        mean_us = sum(samples) / len(samples) * 1e6
+        print(f"{name:9} mean {mean_us:.0f}us  p50 {stats['p50_ms'] * 1000:.0f}us  p99 {stats['p99_ms'] * 1000:.0f}us")
+    print(f"cache: {resolver.cache_stats()}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,83 @@
+"""
+Benchmark: task keyword analysis cost vs prompt size
+
+Compares the original per-table keyword scans against TaskKeywordMatcher for the
+analysis PMCoordinator performs per coordinated task: complexity on the prompt
+plus capability extraction on every complex-breakdown subtask description (each
+of which embeds the full prompt).
+
+Usage: python benchmarks/bench_keyword_matcher.py
+"""
+
+import random
+import time
+
+from common import quiet_logging
+
+from intercept.keyword_matcher import TaskKeywordMatcher
+
+ROUNDS = 50
+PREFIXES = ["Requirements analysis for: ", "System architecture design for: ",
+            "Technical specification for: ", "Core implementation for: ",
+            "Integration testing for: ", "UX validation for: ", "Quality gates validation for: "]
+FILLER = ['payment', 'service', 'latency', 'request', 'customer', 'records', 'the', 'with', 'and']
+
+
+def make_prompt(size: int, seed: int) -> str:
+    rng = random.Random(seed)
+    words, length = [], 0
+    while length < size:
+        words.append(rng.choice(FILLER))
+        length += len(words[-1]) + 1
+    return ' '.join(words)
+
+
+def original_analysis(prompt: str):
+    """The pre-matcher code paths, inlined"""
+    complex_keywords = ['integrate', 'orchestrate', 'coordinate', 'multiple', 'system', 'architecture']
+    score = sum(1 for word in complex_keywords if word in prompt.lower())
+    capabilities = []
+    for prefix in PREFIXES:
+        description = (prefix + prompt).lower()
+        found = []
+        for words in (['implement', 'code', 'develop', 'build'], ['test', 'quality', 'validate'],
+                      ['design', 'architect', 'structure'], ['research', 'analyze', 'investigate'],
+                      ['ui', 'ux', 'user', 'interface'], ['coordinate', 'manage', 'oversee']):
+            found.append(any(word in description for word in words))
+        capabilities.append(found)
+    return score, capabilities
+
+
+def matcher_analysis(matcher: TaskKeywordMatcher, prompt: str):
+    score = matcher.complexity_score(prompt)
+    return score, [matcher.capabilities(prefix + prompt) for prefix in PREFIXES]
+
+
+def bench(size: int):
+    prompts = [make_prompt(size, seed) for seed in range(ROUNDS)]
+
+    started = time.perf_counter()
+    for prompt in prompts:
+        original_analysis(prompt)
+    original_ms = (time.perf_counter() - started) / ROUNDS * 1000
+
+    matcher = TaskKeywordMatcher()
+    matcher.hits('')  # compile the keyword plan outside the timed loop
+    started = time.perf_counter()
+    for prompt in prompts:
+        matcher_analysis(matcher, prompt)
+    matcher_ms = (time.perf_counter() - started) / ROUNDS * 1000
+
+    return original_ms, matcher_ms
+
+
+def run():
+    quiet_logging()
+    print(f"{'prompt':>8} {'original ms/task':>18} {'matcher ms/task':>17}")
+    for size in (1_000, 10_000, 100_000):
+        original_ms, matcher_ms = bench(size)
+        print(f"{size // 1000:>6}KB {original_ms:>18.3f} {matcher_ms:>17.3f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,47 @@
+"""
+Benchmark: serialize-once breakdown payloads vs per-sink json.dumps
+
+Usage: python benchmarks/bench_payload_serialization.py [subtask_count]
+"""
+
+import json
+import sys
+
+from common import create_coordination_db, quiet_logging, timed
+
+from intercept.payload_store import Payload
+from intercept.pm_coordinator import PMCoordinator
+
+
+def run(subtask_count: int = 200, rounds: int = 500) -> None:
+    quiet_logging()
+    coordinator = PMCoordinator(create_coordination_db(), load_flush_interval=None)
+    task_breakdown = coordinator._decompose_task("Design, implement and test the billing architecture", {})
+    # Scale the breakdown up to stress encoding
+    task_breakdown.subtasks = [dict(task_breakdown.subtasks[i % len(task_breakdown.subtasks)], index=i)
+                               for i in range(subtask_count)]
+    to_dict = coordinator._breakdown_to_dict
+
+    def per_sink():
+        # Decision context, workflow context and caller result each converted separately
+        for _ in range(rounds):
+            json.dumps({'task_breakdown': to_dict(task_breakdown)})
+            json.dumps({'task_breakdown': to_dict(task_breakdown)})
+            to_dict(task_breakdown)
+
+    def serialize_once():
+        for _ in range(rounds):
+            Payload.of(to_dict(task_breakdown))
+
+    per_sink_seconds = timed(per_sink)
+    once_seconds = timed(serialize_once)
+
+    print(f"subtasks:          {subtask_count}  rounds: {rounds}")
+    print(f"per-sink encoding: {per_sink_seconds / rounds * 1e6:,.0f}us per task")
+    print(f"serialize once:    {once_seconds / rounds * 1e6:,.0f}us per task")
+    print(f"speedup:           {per_sink_seconds / once_seconds:.1f}x")
+    coordinator.close()
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
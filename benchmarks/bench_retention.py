@@ -0,0 +1,62 @@
+"""
+Benchmark: archiving a year of decision history to compressed partitions
+
+Usage: python benchmarks/bench_retention.py [decision_count]
+"""
+
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+
+from common import create_coordination_db, quiet_logging, timed
+
+from intercept.decision_capture import DecisionType, PMDecisionCapture
+from intercept.retention import RetentionManager
+
+
+def run(decision_count: int = 200000, keep_days: int = 30) -> None:
+    quiet_logging()
+    rng = random.Random(3)
+    db_path = create_coordination_db()
+    capture = PMDecisionCapture(db_path)
+    types = [t.value for t in DecisionType]
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO pm_decision_log (decision_context, decision_type, reasoning_process, outcome,"
+            " confidence_score, created_at) VALUES (?, ?, ?, ?, ?, datetime('now', ?))",
+            (
+                (f'{{"user_prompt": "Implement feature {i} for the billing portal"}}', rng.choice(types),
+                 "Capability matching and load balancing across agents " * 4, "Task decomposed into 4 subtasks",
+                 rng.randint(1, 10), f'-{rng.randrange(365 * 24 * 60)} minutes')
+                for i in range(decision_count)
+            )
+        )
+
+    def scan_history():
+        return sum(1 for _ in capture.iter_decision_history(days_back=None, columns=['id']))
+
+    def recent_window():
+        return sum(1 for _ in capture.iter_decision_history(days_back=keep_days, columns=['id']))
+
+    file_before = os.path.getsize(db_path)
+    full_scan_before = timed(scan_history)
+    archive_dir = tempfile.mkdtemp(prefix='bmad-archive-')
+    manager = RetentionManager(db_path, archive_dir)
+    report = {}
+    archive_seconds = timed(lambda: report.update(manager.archive(keep_days, vacuum=True)))
+    full_scan_after = timed(scan_history)
+    merged_seconds = timed(lambda: sum(1 for _ in capture.iter_decision_history(days_back=None, include_archived=True)))
+
+    print(f"decisions: {decision_count}, kept: {keep_days} days")
+    print(f"archived {report['rows_archived']} rows into "
+          f"{report['tables']['pm_decision_log']['partitions']} partitions in {archive_seconds:.1f}s")
+    print(f"database file: {file_before / 1e6:.1f} MB -> {os.path.getsize(db_path) / 1e6:.1f} MB "
+          f"(reclaimed {report['reclaimed_bytes'] / 1e6:.1f} MB live, archives {report['archive_bytes'] / 1e6:.1f} MB)")
+    print(f"hot history scan: {full_scan_before * 1000:.0f}ms -> {full_scan_after * 1000:.0f}ms; "
+          f"last {keep_days} days: {timed(recent_window) * 1000:.0f}ms; hot + cold: {merged_seconds * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,52 @@
+"""
+Benchmark: fetching one embedded resource from a web bundle by reading and
+scanning the whole bundle versus the offset index and mmap view
+
+Usage: python benchmarks/bench_web_bundles.py [fetches]
+"""
+
+import random
+import re
+import sys
+import tempfile
+
+from common import REPO_ROOT, percentiles, quiet_logging, timed
+
+from intercept.web_bundles import WebBundleIndex
+
+BUNDLES_DIR = REPO_ROOT / ".bmad-core" / "web-bundles"
+
+
+def scan_fetch(bundle: str, resource: str) -> bytes:
+    """The pre-index approach: read the bundle and search for the markers"""
+    data = (BUNDLES_DIR / f"{bundle}.txt").read_bytes()
+    name = re.escape(resource.encode())
+    match = re.search(rb'(?ms)^={20} START: ' + name + rb' ={20}\n(.*?)^={20} END: ' + name + rb' ={20}', data)
+    return match.group(1)
+
+
+def run(fetches: int = 2000) -> None:
+    quiet_logging()
+    index = WebBundleIndex(str(BUNDLES_DIR), tempfile.mkdtemp(prefix="bmad_bundle_index_"))
+    build_seconds = timed(index.build)
+    targets = [(bundle, resource) for bundle in index.bundles() for resource in index.sections(bundle)]
+    picks = [targets[random.Random(i).randrange(len(targets))] for i in range(fetches)]
+
+    for pick in picks[:50]:
+        with index.resource(*pick) as view:
+            assert view == scan_fetch(*pick)
+    scan_samples = [timed(lambda: scan_fetch(*pick)) for pick in picks[:fetches // 10]]
+    view_samples = [timed(lambda: index.resource(*pick).release()) for pick in picks]
+    total_bytes = sum(path.stat().st_size for path in BUNDLES_DIR.rglob("*.txt"))
+
+    print(f"bundles: {len(index.bundles())} ({total_bytes / 1e6:.1f} MB), resources: {len(targets)}, "
+          f"build: {build_seconds * 1000:.0f}ms")
+    for name, samples in (('scan', scan_samples), ('mmap view', view_samples)):
+        stats = percentiles(samples)
+        mean_us = sum(samples) / len(samples) * 1e6
+        print(f"{name:10} mean {mean_us:.1f}us  p50 {stats['p50_ms'] * 1000:.1f}us  p99 {stats['p99_ms'] * 1000:.1f}us")
+    index.close()
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,50 @@
+"""
+Shared helpers for BMAD Auto benchmarks
+Benchmarks run against throwaway coordination.db files, never the live database
+"""
+
+import logging
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+SCHEMA_FILES = [
+    REPO_ROOT / "intercept" / "coordination_core.sql",
+    REPO_ROOT / "intercept" / "coordination_extensions.sql",
+]
+
+
+def create_coordination_db() -> str:
+    """Create a temporary coordination.db with all schema files applied"""
+    db_path = Path(tempfile.mkdtemp(prefix="bmad_bench_")) / "coordination.db"
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        for schema_file in SCHEMA_FILES:
+            conn.executescript(schema_file.read_text())
+    return str(db_path)
+
+
+def quiet_logging() -> None:
+    """Silence per-call logging so it does not dominate timings"""
+    logging.disable(logging.WARNING)
+
+
+def timed(fn: Callable[[], object]) -> float:
+    """Wall-clock seconds for a single call"""
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    """p50/p99 of latency samples in milliseconds"""
+    ordered = sorted(samples)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+    return {'p50_ms': pick(0.50), 'p99_ms': pick(0.99)}
+
@@ -17,6 +17,11 @@ import psycopg2
 from psycopg2 import pool
 from psycopg2.extras import RealDictCursor
 
+try:
+    from .sqlite_pool import SQLitePool
+except ImportError:  # imported as a top-level module from database/
+    from sqlite_pool import SQLitePool
+
 
 @dataclass
 class ConnectionConfig:
@@ -34,6 +39,7 @@ class ConnectionConfig:
     sqlite_path: str = "intercept/coordination.db"
     sqlite_timeout: float = 30.0
     sqlite_check_same_thread: bool = False
+    sqlite_pool_size: int = 4
 
 
 class DatabaseConnectionManager:
@@ -46,6 +52,7 @@ class DatabaseConnectionManager:
         self.config = config or ConnectionConfig()
         self._pg_pool: Optional[psycopg2.pool.ThreadedConnectionPool] = None
         self._sqlite_lock = asyncio.Lock()
+        self._sqlite_pool: Optional[SQLitePool] = None
         self.logger = logging.getLogger(__name__)
 
     def initialize_postgresql_pool(self) -> None:
@@ -148,6 +155,19 @@ class DatabaseConnectionManager:
                     connection.close()
                     self.logger.debug("SQLite connection closed")
 
+    def get_sqlite_pool(self) -> SQLitePool:
+        """
+        Pooled coordination.db connections for concurrent persistence steps
+        Unlike get_sqlite_connection, access is not serialized by a global lock
+        """
+        if self._sqlite_pool is None:
+            self._sqlite_pool = SQLitePool(
+                self.config.sqlite_path,
+                size=self.config.sqlite_pool_size,
+                timeout=self.config.sqlite_timeout
+            )
+        return self._sqlite_pool
+
     async def execute_postgresql_query(self, query: str, params: Optional[tuple] = None) -> list:
         """Execute PostgreSQL query with connection management"""
         async with self.get_postgresql_connection() as conn:
@@ -207,6 +227,10 @@ class DatabaseConnectionManager:
         except Exception as e:
             self.logger.error(f"Error closing PostgreSQL pool: {e}")
 
+        if self._sqlite_pool:
+            self._sqlite_pool.close()
+            self._sqlite_pool = None
+
         self.logger.info("Database connections closed")
 
 
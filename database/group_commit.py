@@ -0,0 +1,260 @@
+"""
+Group-Commit Writer for coordination.db
+Purpose: Batch many small writes into few transactions on a background thread
+Standard library only; shared by the notification outbox and decision capture
+
+Producers submit rows; a writer thread drains the queue and writes everything
+that arrived within `max_delay` (up to `max_batch` rows) in one transaction, so
+one commit (and fsync) is shared by many callers.
+
+Durability modes:
+- 'sync': write and commit on the caller's thread, one transaction per submit
+- 'group': queue, then block until the batch holding the rows has committed
+- 'async': queue and return immediately; use flush() as a barrier
+
+A full queue blocks producers for up to `put_timeout` seconds before raising
+WriteQueueFull, so a stalled disk pushes back instead of growing memory.
+
+If a batch fails, its submits are retried in one transaction with a savepoint
+each, so a bad row fails only the submit that carried it.
+"""
+
+import queue
+import sqlite3
+import threading
+import time
+import logging
+from typing import Any, Callable, List, Optional, Sequence
+
+DURABILITY_MODES = ('sync', 'group', 'async')
+
+
+class WriteQueueFull(RuntimeError):
+    """Raised when the writer queue stays full for longer than put_timeout"""
+
+
+class _Ticket:
+    """Completion handle for one submit() call"""
+
+    __slots__ = ('rows', 'done', 'results', 'error')
+
+    def __init__(self, rows: Sequence[Any]):
+        self.rows = rows
+        self.done = threading.Event()
+        self.results: List[Any] = []
+        self.error: Optional[BaseException] = None
+
+    def wait(self) -> List[Any]:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.results
+
+
+class GroupCommitWriter:
+    """Background batching writer with selectable durability"""
+
+    def __init__(
+        self,
+        db_path: str,
+        write_batch: Callable[[sqlite3.Connection, List[Any]], List[Any]],
+        durability: str = 'group',
+        max_batch: int = 512,
+        max_delay: float = 0.005,
+        max_queue: int = 10000,
+        put_timeout: float = 5.0,
+        on_commit: Optional[Callable[[List[Any], List[Any]], None]] = None,
+        name: str = 'group-commit'
+    ):
+        """
+        Args:
+            write_batch: Writes rows on the given connection inside an open
+                transaction and returns one result per row (e.g. row ids)
+            on_commit: Called with (rows, results) after each committed batch
+        """
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"durability must be one of {DURABILITY_MODES}, got {durability!r}")
+        self.db_path = db_path
+        self.write_batch = write_batch
+        self.durability = durability
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.put_timeout = put_timeout
+        self.on_commit = on_commit
+        self.name = name
+        self.logger = logging.getLogger(__name__)
+
+        self._queue: "queue.Queue[Optional[_Ticket]]" = queue.Queue(maxsize=max_queue)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    # Producer API
+
+    def submit(self, rows: Sequence[Any]) -> Optional[List[Any]]:
+        """
+        Write rows in a single batch
+
+        Returns:
+            Per-row results once committed, or None in 'async' mode
+        """
+        if not rows:
+            return []
+        if self.durability == 'sync':
+            ticket = _Ticket(rows)
+            self._write([ticket])
+            return ticket.wait()
+
+        ticket = self._enqueue(rows)
+        if self.durability == 'async':
+            return None
+        return ticket.wait()
+
+    def flush(self) -> None:
+        """Block until everything submitted so far has been committed"""
+        if self.durability != 'sync' and self._thread is not None:
+            self._enqueue([]).done.wait()
+
+    def close(self) -> None:
+        """Flush, stop the writer thread and close its connection"""
+        if self._thread is not None:
+            self.flush()
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        with self._write_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def pending(self) -> int:
+        """Approximate number of queued, uncommitted submits"""
+        return self._queue.qsize()
+
+    # Writer thread
+
+    def _enqueue(self, rows: Sequence[Any]) -> _Ticket:
+        self._ensure_thread()
+        ticket = _Ticket(rows)
+        try:
+            self._queue.put(ticket, timeout=self.put_timeout)
+        except queue.Full:
+            raise WriteQueueFull(f"{self.name} queue full for {self.put_timeout}s") from None
+        return ticket
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                    self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch, rows = [first], len(first.rows)
+            deadline = time.monotonic() + self.max_delay
+            stop = False
+            while rows < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    ticket = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if ticket is None:
+                    stop = True
+                    break
+                batch.append(ticket)
+                rows += len(ticket.rows)
+            self._write(batch)
+            if stop:
+                return
+
+    def _write(self, tickets: List[_Ticket]) -> None:
+        """Write all tickets' rows in one transaction and resolve the tickets"""
+        rows = [row for ticket in tickets for row in ticket.rows]
+        committed = tickets
+        if rows:
+            with self._write_lock:
+                connection = self._get_connection()
+                try:
+                    self._transact(connection, lambda: self._write_together(connection, tickets, rows))
+                except Exception as e:
+                    self.logger.error(f"{self.name} batch of {len(rows)} rows failed: {e}")
+                    if len(tickets) > 1:
+                        committed = self._write_individually(connection, tickets)
+                    else:
+                        committed = []
+                        tickets[0].error = e
+                except BaseException as e:
+                    committed = []
+                    for ticket in tickets:
+                        ticket.error = e
+
+        for ticket in tickets:
+            ticket.done.set()
+
+        if committed and self.on_commit is not None:
+            committed_rows = [row for ticket in committed for row in ticket.rows]
+            if committed_rows:
+                self.on_commit(committed_rows, [result for ticket in committed for result in ticket.results])
+
+    def _write_together(self, connection: sqlite3.Connection, tickets: List[_Ticket], rows: List[Any]) -> None:
+        results = list(self.write_batch(connection, rows))
+        offset = 0
+        for ticket in tickets:
+            count = len(ticket.rows)
+            ticket.results = results[offset:offset + count]
+            offset += count
+
+    def _write_individually(self, connection: sqlite3.Connection, tickets: List[_Ticket]) -> List[_Ticket]:
+        """Retry each ticket under its own savepoint within one transaction; returns the committed tickets"""
+        written: List[_Ticket] = []
+
+        def write() -> None:
+            for ticket in tickets:
+                if not ticket.rows:
+                    continue
+                connection.execute('SAVEPOINT group_commit_ticket')
+                try:
+                    ticket.results = list(self.write_batch(connection, ticket.rows))
+                    connection.execute('RELEASE SAVEPOINT group_commit_ticket')
+                    written.append(ticket)
+                except Exception as e:
+                    connection.execute('ROLLBACK TO SAVEPOINT group_commit_ticket')
+                    connection.execute('RELEASE SAVEPOINT group_commit_ticket')
+                    ticket.results = []
+                    ticket.error = e
+
+        try:
+            self._transact(connection, write)
+        except BaseException as e:
+            self.logger.error(f"{self.name} retry of {len(tickets)} submits failed: {e}")
+            for ticket in tickets:
+                ticket.results = []
+                ticket.error = e
+            return []
+        return written
+
+    def _transact(self, connection: sqlite3.Connection, write: Callable[[], None]) -> None:
+        try:
+            connection.execute('BEGIN IMMEDIATE')
+            write()
+            connection.execute('COMMIT')
+        except BaseException:
+            if connection.in_transaction:
+                connection.execute('ROLLBACK')
+            raise
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None, check_same_thread=False)
+            try:
+                connection.execute("PRAGMA journal_mode=WAL")
+            except sqlite3.OperationalError as e:
+                self.logger.debug(f"Could not enable WAL mode yet: {e}")
+            self._connection = connection
+        return self._connection
@@ -0,0 +1,64 @@
+"""
+Time-Ordered ID Generator for coordination.db primary keys
+Purpose: Collision-free, sortable IDs for workflows, tasks and escalations
+Standard library only so every module can share it
+
+IDs are ULID-style: a 48-bit millisecond timestamp followed by 80 random bits,
+rendered as 26 Crockford base32 characters. Lexicographic order follows creation
+time, so inserts land at the right edge of the primary key B-tree instead of
+splitting pages at random. Within one millisecond the random part is incremented
+rather than redrawn, keeping IDs strictly increasing per process; 80 random bits
+make collisions across processes negligible.
+"""
+
+import base64
+import os
+import threading
+import time
+
+_RANDOM_BITS = 80
+_RANDOM_MASK = (1 << _RANDOM_BITS) - 1
+# RFC 4648 base32 maps 5-bit values in ascending order, so translating to the
+# Crockford alphabet keeps the encoding order-preserving
+_CROCKFORD = bytes.maketrans(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567", b"0123456789ABCDEFGHJKMNPQRSTVWXYZ")
+
+
+class IdGenerator:
+    """Thread-safe, per-process monotonic ULID-style ID source"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_random = 0
+
+    def new_id(self, prefix: str = "") -> str:
+        """New ID, optionally as f"{prefix}_{id}" """
+        with self._lock:
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._last_random = int.from_bytes(os.urandom(10), "big")
+            else:
+                # Same millisecond (or the clock stepped back): stay monotonic
+                self._last_random = (self._last_random + 1) & _RANDOM_MASK
+                if self._last_random == 0:
+                    self._last_ms += 1
+            value = (self._last_ms << _RANDOM_BITS) | self._last_random
+
+        encoded = base64.b32encode(value.to_bytes(16, "big"))[:26].translate(_CROCKFORD).decode("ascii")
+        return f"{prefix}_{encoded}" if prefix else encoded
+
+    def _reset(self) -> None:
+        # A forked child must not continue the parent's sequence
+        self._lock = threading.Lock()
+        self._last_ms = -1
+
+
+_default = IdGenerator()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_default._reset)
+
+
+def new_id(prefix: str = "") -> str:
+    """New time-ordered ID from the shared process-wide generator"""
+    return _default.new_id(prefix)
@@ -0,0 +1,143 @@
+"""
+SQLite Connection Pool for coordination.db
+Purpose: Bounded pool of WAL-mode connections for concurrent async persistence
+Standard library only so the coordination hub can use it without PostgreSQL drivers
+"""
+
+import asyncio
+import sqlite3
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Callable, Deque, TypeVar
+
+T = TypeVar("T")
+
+
+class SQLitePool:
+    """
+    Bounded pool of coordination.db connections
+
+    Connections are opened lazily up to `size` and shared across threads, so
+    blocking statements can run via asyncio.to_thread while the event loop stays
+    free. The pool is not bound to an event loop and may be used from several.
+
+    SQLite's busy handler cannot be interrupted, so lock waits use a short
+    per-attempt busy timeout and are retried until `timeout` or cancellation.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        size: int = 4,
+        timeout: float = 30.0,
+        busy_retry: float = 0.05,
+        acquire_poll: float = 0.001
+    ):
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+        self.busy_retry = busy_retry
+        self.acquire_poll = acquire_poll
+        self._idle: Deque[sqlite3.Connection] = deque()
+        self._all = []
+        self._permits = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def _open(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.db_path, timeout=self.busy_retry, check_same_thread=False)
+        try:
+            # Switching to WAL needs the write lock; retried on the next open if busy
+            connection.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.OperationalError as e:
+            self.logger.debug(f"Could not enable WAL mode yet: {e}")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    async def _acquire_permit(self) -> None:
+        # Poll instead of blocking a worker thread so cancellation never leaks a permit
+        while not self._permits.acquire(blocking=False):
+            await asyncio.sleep(self.acquire_poll)
+
+    def _take(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._idle:
+                return self._idle.popleft()
+        connection = self._open()
+        with self._lock:
+            self._all.append(connection)
+        return connection
+
+    def _give_back(self, connection: sqlite3.Connection) -> None:
+        with self._lock:
+            self._idle.append(connection)
+        self._permits.release()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncGenerator[sqlite3.Connection, None]:
+        """Borrow a pooled connection; uncommitted work is rolled back on error"""
+        await self._acquire_permit()
+        connection = self._take()
+        try:
+            yield connection
+        except BaseException:
+            connection.rollback()
+            raise
+        finally:
+            self._give_back(connection)
+
+    async def run(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """
+        Run fn(connection) in a worker thread inside one transaction
+
+        Cancellation (including timeouts) interrupts the running statement, waits
+        for the worker to roll back and then propagates to the caller.
+        """
+        async with self.connection() as connection:
+            cancelled = threading.Event()
+            worker = asyncio.ensure_future(asyncio.to_thread(self._transact, connection, fn, cancelled))
+            try:
+                return await asyncio.shield(worker)
+            except asyncio.CancelledError:
+                cancelled.set()
+                connection.interrupt()
+                try:
+                    await worker
+                except BaseException:
+                    pass
+                raise
+
+    def _transact(
+        self,
+        connection: sqlite3.Connection,
+        fn: Callable[[sqlite3.Connection], T],
+        cancelled: threading.Event
+    ) -> T:
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                result = fn(connection)
+                connection.commit()
+                return result
+            except sqlite3.OperationalError as e:
+                connection.rollback()
+                locked = 'locked' in str(e) or 'busy' in str(e)
+                if not locked or cancelled.is_set() or time.monotonic() >= deadline:
+                    raise
+            except BaseException:
+                connection.rollback()
+                raise
+
+    def close(self) -> None:
+        """Close every connection opened by the pool"""
+        with self._lock:
+            connections, self._all = self._all, []
+            self._idle.clear()
+        for connection in connections:
+            try:
+                connection.close()
+            except sqlite3.Error as e:
+                self.logger.error(f"Error closing pooled SQLite connection: {e}")
@@ -0,0 +1,173 @@
+"""
+BMAD Auto Agent Definitions
+Parsed, immutable view of the YAML block embedded in a .bmad-core agent file
+
+Each .bmad-core/agents/<name>.md carries its whole definition in one ```yaml
+fenced block: agent metadata, persona, commands and the tasks, templates,
+checklists and data files it depends on. AgentDefinition parses that block
+once and indexes it: commands by name (with their arguments and the dependency
+files each one mentions), dependencies by type, and the reverse map from a
+dependency file to its types. Every lookup after the parse is a dictionary hit.
+
+Nested values are frozen (mappings become read-only proxies, lists become
+tuples), so one definition can be shared by every caller. The markdown text
+itself is not kept: raw_text fetches it on first access through the source
+callable supplied by the loader.
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+_YAML_BLOCK = re.compile(r'^```ya?ml[ \t]*\n(.*?)^```', re.MULTILINE | re.DOTALL)
+
+
+def freeze(value: Any) -> Any:
+    """Read-only copy of parsed YAML: mappings become proxies, lists tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def _flatten_text(value: Any) -> str:
+    if isinstance(value, Mapping):
+        return ' '.join(f'{key} {_flatten_text(item)}' for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return ' '.join(_flatten_text(item) for item in value)
+    return '' if value is None else str(value)
+
+
+@dataclass(frozen=True)
+class AgentCommand:
+    """One entry of an agent's commands list (invoked as *name)"""
+    name: str
+    args: Tuple[str, ...]  # placeholders such as 'story' from 'review {story}'
+    description: str  # empty when the command is specified as nested steps
+    spec: Any  # frozen description or nested steps, as written
+    references: Tuple[str, ...]  # dependency files the command mentions
+
+
+@dataclass(frozen=True)
+class AgentDefinition:
+    """Structured, immutable form of one .bmad-core agent file"""
+    agent_name: str
+    path: str
+    sha256: str
+    name: str
+    title: str
+    icon: str
+    when_to_use: str
+    persona: Mapping[str, Any]
+    commands: Mapping[str, AgentCommand]
+    dependencies: Mapping[str, Tuple[str, ...]]  # type (tasks, templates, ...) -> files
+    dependency_types: Mapping[str, Tuple[str, ...]]  # file -> types listing it
+    config: Mapping[str, Any]  # the whole YAML block, frozen
+    _source: Optional[Callable[[], str]] = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def parse(
+        cls,
+        agent_name: str,
+        text: str,
+        path: str = '',
+        sha256: str = '',
+        source: Optional[Callable[[], str]] = None
+    ) -> 'AgentDefinition':
+        """
+        Parse an agent file's text; a file without a YAML block yields an empty definition
+
+        Raises:
+            ValueError: if the YAML block is malformed or not a mapping
+        """
+        import yaml  # deferred, as in agent_loader: restored starts never parse
+
+        # libyaml's loader when PyYAML was built with it: agent blocks are large
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        match = _YAML_BLOCK.search(text)
+        try:
+            config = yaml.load(match.group(1), Loader=loader) if match else {}
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML block in {path or agent_name}: {e}") from e
+        config = config or {}
+        if not isinstance(config, dict):
+            raise ValueError(f"YAML block in {path or agent_name} is not a mapping")
+
+        dependencies: Dict[str, Tuple[str, ...]] = {}
+        dependency_types: Dict[str, List[str]] = {}
+        for dependency_type, files in (config.get('dependencies') or {}).items():
+            files = tuple(str(name) for name in files or ())
+            dependencies[dependency_type] = files
+            for name in files:
+                dependency_types.setdefault(name, []).append(dependency_type)
+
+        agent = config.get('agent') or {}
+        return cls(
+            agent_name=agent_name,
+            path=path,
+            sha256=sha256,
+            name=str(agent.get('name', '')),
+            title=str(agent.get('title', '')),
+            icon=str(agent.get('icon', '')),
+            when_to_use=str(agent.get('whenToUse', '')),
+            persona=freeze(config.get('persona') or {}),
+            commands=MappingProxyType(_parse_commands(config.get('commands'), dependency_types)),
+            dependencies=MappingProxyType(dependencies),
+            dependency_types=MappingProxyType({name: tuple(types) for name, types in dependency_types.items()}),
+            config=freeze(config),
+            _source=source
+        )
+
+    @cached_property
+    def raw_text(self) -> str:
+        """The agent file's markdown, fetched on first access"""
+        if self._source is None:
+            raise LookupError(f"No source for agent definition: {self.agent_name}")
+        return self._source()
+
+    def command(self, name: str) -> Optional[AgentCommand]:
+        """Command by name, with or without the leading *"""
+        return self.commands.get(name.lstrip('*'))
+
+    def depends_on(self, dependency_type: str) -> Tuple[str, ...]:
+        """Files of one dependency type (tasks, templates, checklists, data, ...)"""
+        return self.dependencies.get(dependency_type, ())
+
+
+def _parse_commands(commands: Any, dependency_types: Mapping[str, Any]) -> Dict[str, AgentCommand]:
+    # Written either as a mapping or as a list of single-key mappings / bare names
+    if isinstance(commands, dict):
+        entries = list(commands.items())
+    else:
+        entries = []
+        for entry in commands or ():
+            if isinstance(entry, dict):
+                entries.extend(entry.items())
+            else:
+                entries.append((entry, None))
+
+    # Mentions match a dependency by file name or by its stem ("task brownfield-create-epic")
+    stems = {}
+    for name in dependency_types:
+        stems.setdefault(name, name)
+        stems.setdefault(name.rsplit('.', 1)[0], name)
+    mention = re.compile(
+        r'(?<![\w.-])(' + '|'.join(sorted(map(re.escape, stems), key=len, reverse=True)) + r')(?![\w-])'
+    ) if stems else None
+
+    parsed = {}
+    for key, spec in entries:
+        name, *args = str(key).split()
+        text = _flatten_text(spec)
+        references = dict.fromkeys(stems[found] for found in mention.findall(text)) if mention else {}
+        parsed[name] = AgentCommand(
+            name=name,
+            args=tuple(arg.strip('{}') for arg in args),
+            description=spec if isinstance(spec, str) else '',
+            spec=freeze(spec),
+            references=tuple(references)
+        )
+    return parsed
@@ -0,0 +1,173 @@
+"""
+BMAD Auto Agent Capability Index
+Inverted capability index with score-ordered heaps for PM agent assignment
+
+PMCoordinator scores an agent for a subtask as:
+    match + performance - load_penalty
+where match is the number of required capabilities the agent has, performance
+is success_rate - avg_response_time / 10 and load_penalty is current_load * 0.5.
+
+Only the match term depends on the subtask, so each capability keeps a max-heap
+of its agents keyed by base score (performance - load_penalty). A query walks the
+heaps of the required capabilities in score order and stops as soon as no unseen
+agent can beat the best candidate, so it only touches agents that can do the work.
+
+Heap entries are invalidated lazily: a load change pushes a fresh entry and bumps
+the agent version, stale entries are dropped when they surface or on compaction.
+"""
+
+import heapq
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+
+@dataclass
+class _IndexedAgent:
+    """Index bookkeeping for one agent"""
+    capabilities: FrozenSet[str]
+    base_score: float
+    order: int
+    version: int
+
+
+class AgentCapabilityIndex:
+    """Capability -> agents index kept current on every load change"""
+
+    def __init__(self, agents: Iterable = ()):
+        # Heap entries: (-base_score, order, version, agent_name)
+        self._heaps: Dict[str, List[Tuple[float, int, int, str]]] = {}
+        self._agents: Dict[str, _IndexedAgent] = {}
+        self._next_order = 0
+        for agent in agents:
+            self.add(agent)
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+    def __contains__(self, agent_name: str) -> bool:
+        return agent_name in self._agents
+
+    @staticmethod
+    def base_score(agent) -> float:
+        """Subtask-independent part of the assignment score"""
+        performance_score = agent.success_rate - (agent.avg_response_time / 10)
+        load_penalty = agent.current_load * 0.5
+        return performance_score - load_penalty
+
+    def agents_with(self, capability: str) -> List[str]:
+        """Agents currently indexed under a capability"""
+        return [
+            name for name, indexed in self._agents.items()
+            if capability in indexed.capabilities
+        ]
+
+    def add(self, agent) -> None:
+        """Index a new agent (AgentCapability) or replace an existing one"""
+        existing = self._agents.get(agent.agent_name)
+        order = existing.order if existing else self._next_order
+        if not existing:
+            self._next_order += 1
+
+        indexed = _IndexedAgent(
+            capabilities=frozenset(agent.capabilities),
+            base_score=self.base_score(agent),
+            order=order,
+            version=existing.version + 1 if existing else 0
+        )
+        self._agents[agent.agent_name] = indexed
+        self._push(agent.agent_name, indexed)
+
+    def update(self, agent) -> None:
+        """Re-score an agent after its load or performance changed"""
+        self.add(agent)
+
+    def remove(self, agent_name: str) -> None:
+        """Drop an agent; its heap entries expire lazily"""
+        self._agents.pop(agent_name, None)
+
+    def best_agent(self, required_capabilities: List[str]) -> Optional[str]:
+        """
+        Best agent for the required capabilities, or None if nobody matches
+
+        Matches a full scan over all agents: highest score wins, ties go to the
+        agent registered first, and scores must exceed -1 to be considered.
+        """
+        heaps = [self._heaps[c] for c in set(required_capabilities) if c in self._heaps]
+        if not heaps:
+            return None
+
+        required = set(required_capabilities)
+        seen = set()
+        restore: List[Tuple[List, Tuple[float, int, int, str]]] = []
+        best: Optional[Tuple[float, int, str]] = None  # (score, order, agent)
+        cursor = 0
+
+        try:
+            while True:
+                live = [heap for heap in heaps if self._valid_top(heap)]
+                if not live:
+                    break
+
+                if best is not None and not self._may_beat(best, live):
+                    break
+
+                heap = live[cursor % len(live)]
+                cursor += 1
+                entry = heapq.heappop(heap)
+                restore.append((heap, entry))
+
+                agent_name = entry[3]
+                if agent_name in seen:
+                    continue
+                seen.add(agent_name)
+
+                indexed = self._agents[agent_name]
+                score = len(required & indexed.capabilities) + indexed.base_score
+                if score <= -1:
+                    continue
+                if best is None or (score, -indexed.order) > (best[0], -best[1]):
+                    best = (score, indexed.order, agent_name)
+        finally:
+            for heap, entry in restore:
+                heapq.heappush(heap, entry)
+
+        return best[2] if best else None
+
+    def _may_beat(self, best: Tuple[float, int, str], live: List[List]) -> bool:
+        """Whether any agent not yet popped could still outrank the best candidate"""
+        # An unseen agent present in m of the live heaps scores at most m + t_m,
+        # where t_m is the m-th highest heap top. Take the maximum over m.
+        tops = sorted((-heap[0][0] for heap in live), reverse=True)
+        bound = max(m + 1 + top for m, top in enumerate(tops))
+
+        if best[0] != bound:
+            return best[0] < bound
+        # Exact tie: an agent reaching the bound sits at or after some heap top
+        return best[1] > min(heap[0][1] for heap in live)
+
+    def _valid_top(self, heap: List) -> bool:
+        """Drop stale entries from the top of a heap; True if a live entry remains"""
+        while heap:
+            _, _, version, agent_name = heap[0]
+            indexed = self._agents.get(agent_name)
+            if indexed is not None and indexed.version == version:
+                return True
+            heapq.heappop(heap)
+        return False
+
+    def _push(self, agent_name: str, indexed: _IndexedAgent) -> None:
+        entry = (-indexed.base_score, indexed.order, indexed.version, agent_name)
+        for capability in indexed.capabilities:
+            heap = self._heaps.setdefault(capability, [])
+            heapq.heappush(heap, entry)
+            if len(heap) > 2 * len(self._agents) + 16:
+                self._compact(capability)
+
+    def _compact(self, capability: str) -> None:
+        """Rebuild a heap from live entries only"""
+        self._heaps[capability] = [
+            (-indexed.base_score, indexed.order, indexed.version, name)
+            for name, indexed in self._agents.items()
+            if capability in indexed.capabilities
+        ]
+        heapq.heapify(self._heaps[capability])
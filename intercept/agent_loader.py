@@ -3,16 +3,105 @@ Agent Extension Loader - Dynamic loading of .bmad-core agents with BMAD Auto enh
 
 This module provides the core infrastructure for loading base .bmad-core agents
 and applying YAML extension overlays while maintaining absolute .bmad-core preservation.
+
+Agents are loaded on every task dispatch, so file contents, their SHA-256 and
+parsed extensions are cached per (path, mtime_ns, size, inode). An unchanged
+file costs one stat() instead of a read, a hash and a YAML parse. Merged
+configurations are memoized per agent and (base, extension) version. An edit
+that keeps size, mtime and inode identical is not noticed until
+reload_extension() or clear_cache().
+
+preload_all() warms every agent on a thread pool at startup. With a
+snapshot_path it also writes the merged configurations, file fingerprints and
+parsed extensions to a versioned marshal snapshot. The next process restores
+each agent whose files still match their fingerprints from that one read.
+yaml is imported on first parse, so a fully restored start never loads it.
+
+watch() hands change detection to an AgentFileWatcher (agent_watcher.py).
+While it runs, an agent that has been loaded once is served from memory
+without a stat(); the watcher invalidates just the agents whose files change
+and keeps validate_all_extensions() results current.
+
+agent_definition() parses the YAML block of an agent file into an immutable
+AgentDefinition (agent_definition.py) with commands and dependencies indexed.
+Parsing is on demand, not part of a load. The definition is then reused until
+the file's contents change.
 """
 
 import os
-import yaml
+import sys
+import time
+import logging
+import threading
+import marshal
 import hashlib
-from typing import Dict, Any, Optional, List
+import struct
+from functools import partial
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Set, Tuple
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from datetime import datetime
 
+if TYPE_CHECKING:
+    from .agent_definition import AgentDefinition
+
+# (path, mtime_ns, size, inode); None for a missing file
+StatKey = Optional[Tuple[str, int, int, int]]
+ExtensionVersion = Tuple[Any, ...]
+
+
+def stat_key(path: Path) -> StatKey:
+    """Cache key that changes whenever a file is replaced or rewritten"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return str(path), st.st_mtime_ns, st.st_size, st.st_ino
+
+
+@dataclass(frozen=True)
+class CachedFile:
+    """Contents and SHA-256 of a file at one stat key"""
+    key: StatKey
+    content: str
+    sha256: str
+
+
+def read_file(path: Path) -> Optional[CachedFile]:
+    """Stat, read and hash a file; None if it does not exist"""
+    key = stat_key(path)
+    if key is None:
+        return None
+    with open(path, 'rb') as f:
+        data = f.read()
+    # Universal newlines, matching a text-mode read
+    content = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    return CachedFile(key=key, content=content, sha256=hashlib.sha256(data).hexdigest())
+
+
+# Snapshot file: magic, format version, then one marshal payload
+SNAPSHOT_MAGIC = b'BMADAGT1'
+SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct('<8sI')
+
+
+class CacheStats:
+    """Hit and miss counters for one cache"""
+
+    __slots__ = ('hits', 'misses')
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
 
 @dataclass
 class AgentExtension:
@@ -33,11 +122,27 @@ class AgentExtensionLoader:
     """
 
     def __init__(self, bmad_core_path: str = ".bmad-core",
-                 bmad_auto_path: str = "."):
+                 bmad_auto_path: str = ".",
+                 snapshot_path: Optional[str] = None):
         self.bmad_core_path = Path(bmad_core_path)
         self.bmad_auto_path = Path(bmad_auto_path)
+        self.snapshot_path = snapshot_path
+        self.logger = logging.getLogger(__name__)
         self.loaded_extensions: Dict[str, AgentExtension] = {}
         self.integrity_cache: Dict[str, str] = {}
+        self._file_cache: Dict[str, CachedFile] = {}
+        self._extension_cache: Dict[str, Tuple[ExtensionVersion, AgentExtension]] = {}
+        self._merged_cache: Dict[Tuple[str, StatKey, ExtensionVersion], Dict[str, Any]] = {}
+        self._definitions: Dict[str, 'AgentDefinition'] = {}
+        self._stats = {name: CacheStats() for name in ('file', 'extension', 'merged', 'definition')}
+        # Filled only while a watcher vouches for freshness: agent -> (merged, extension)
+        self._hot: Dict[str, Tuple[Dict[str, Any], AgentExtension]] = {}
+        self._generation = 0  # bumped on every invalidation, guards _hot against stale loads
+        # Every cache store, invalidation and stats update holds this lock: the watcher
+        # thread and the preload pool run alongside callers. Reads are single dict lookups.
+        self._lock = threading.Lock()
+        self._validation_cache: Dict[str, Tuple[StatKey, StatKey, bool]] = {}
+        self.watcher = None
 
     def load_agent_with_extensions(
         self,
@@ -52,71 +157,421 @@ class AgentExtensionLoader:
             task_context: Optional task-specific context for dynamic loading
 
         Returns:
-            Complete agent configuration with extensions applied
+            Complete agent configuration with extensions applied. Nested
+            values are shared with the memoized configuration: treat them
+            as read-only.
         """
-        # Load base .bmad-core agent
-        base_agent = self._load_base_agent(agent_name)
+        hot = self._hot.get(agent_name)
+        if hot is not None:
+            # The watcher has not seen any change to this agent's files
+            self._record('merged', hit=True)
+            merged, extension = hot
+        else:
+            merged, extension = self._load_merged(agent_name)
+
+        enhanced_agent = {**merged, 'loaded_at': datetime.utcnow().isoformat()}
+        if task_context:
+            enhanced_agent['task_context'] = task_context
+
+        # Cache loaded extension
+        self.loaded_extensions[agent_name] = extension
+
+        return enhanced_agent
+
+    def _load_merged(self, agent_name: str) -> Tuple[Dict[str, Any], AgentExtension]:
+        generation = self._generation
+
+        # Load base .bmad-core agent (re-read and rehashed only if its stat changed)
+        agent_file = self._agent_file(agent_name)
+        base_file = self._read_cached(agent_file)
+        if base_file is None:
+            raise AgentLoadError(f"Base agent not found: {agent_file}")
 
         # Validate .bmad-core integrity
-        if not self._validate_core_integrity(agent_name):
+        if not self._integrity_matches(agent_name, base_file.sha256):
             raise BMadCorePreservationError(
                 f"Integrity check failed for .bmad-core agent: {agent_name}"
             )
 
         # Load extension configuration
-        extension = self._load_extension_config(agent_name)
+        extension_version, extension = self._extension_for(agent_name)
+
+        # Merge base + extension, memoized per (agent, base version, extension version)
+        merged_key = (agent_name, base_file.key, extension_version)
+        merged = self._merged_cache.get(merged_key)
+        if merged is None:
+            self._record('merged', hit=False)
+            base_agent = self._base_agent(agent_name, agent_file, base_file)
+            merged = self._merge_configurations(base_agent, extension, None)
+            with self._lock:
+                for stale in [key for key in self._merged_cache if key[0] == agent_name]:
+                    del self._merged_cache[stale]
+                self._merged_cache[merged_key] = merged
+        else:
+            self._record('merged', hit=True)
+
+        with self._lock:
+            # Unless an invalidation landed since this load read the files
+            if self.watcher is not None and generation == self._generation:
+                self._hot[agent_name] = (merged, extension)
+        return merged, extension
+
+    def _agent_file(self, agent_name: str) -> Path:
+        return self.bmad_core_path / "agents" / f"{agent_name}.md"
+
+    def _extension_file(self, agent_name: str) -> Path:
+        return self.bmad_auto_path / "agents" / f"{agent_name}_extension.yaml"
+
+    def _read_cached(self, path: Path) -> Optional[CachedFile]:
+        """File contents and hash, re-read only when its stat key changes"""
+        key = stat_key(path)
+        cached = self._file_cache.get(path.as_posix())
+        if cached is not None and cached.key == key:
+            self._record('file', hit=True)
+            return cached
+
+        self._record('file', hit=False)
+        cached = read_file(path) if key is not None else None
+        with self._lock:
+            if cached is None:
+                self._file_cache.pop(path.as_posix(), None)
+            else:
+                self._file_cache[path.as_posix()] = cached
+        return cached
+
+    def discover_agents(self) -> List[str]:
+        """Names of all .bmad-core agents"""
+        return sorted(path.stem for path in (self.bmad_core_path / "agents").glob("*.md"))
+
+    def preload_all(self, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Load every agent and extension, restoring from the snapshot where possible
 
-        # Merge base + extension
-        enhanced_agent = self._merge_configurations(base_agent, extension, task_context)
+        Agents the snapshot cannot vouch for are read, hashed and parsed
+        concurrently on a thread pool, then merged. The snapshot is rewritten
+        whenever anything had to be loaded fresh.
 
-        # Cache loaded extension
-        self.loaded_extensions[agent_name] = extension
+        Returns:
+            {'agents', 'restored', 'loaded', 'failed': {agent: error}, 'snapshot_written', 'seconds'}
+        """
+        started = time.perf_counter()
+        agents = self.discover_agents()
+        restored = self._restore_snapshot(agents) if self.snapshot_path else set()
+        pending = [agent_name for agent_name in agents if agent_name not in restored]
+
+        loaded, failed = [], {}
+        if pending:
+            from concurrent.futures import ThreadPoolExecutor  # deferred like yaml: unused on a restored start
+
+            workers = max_workers or min(8, len(pending))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='agent-preload') as pool:
+                futures = {agent_name: pool.submit(self._read_agent, agent_name) for agent_name in pending}
+            for agent_name, future in futures.items():
+                try:
+                    self._install_agent(agent_name, *future.result())
+                    self.load_agent_with_extensions(agent_name)
+                    loaded.append(agent_name)
+                except Exception as e:
+                    failed[agent_name] = str(e)
+
+        snapshot_written = bool(self.snapshot_path) and (bool(loaded) or len(restored) != len(agents))
+        if snapshot_written:
+            self.write_snapshot([agent_name for agent_name in agents if agent_name not in failed])
 
-        return enhanced_agent
+        return {
+            'agents': agents,
+            'restored': sorted(restored),
+            'loaded': loaded,
+            'failed': failed,
+            'snapshot_written': snapshot_written,
+            'seconds': time.perf_counter() - started
+        }
+
+    def _read_agent(self, agent_name: str) -> Tuple[CachedFile, ExtensionVersion, AgentExtension]:
+        """Thread-pool half of a load: file I/O, hashing and YAML parsing, no shared state"""
+        agent_file = self._agent_file(agent_name)
+        base_file = read_file(agent_file)
+        if base_file is None:
+            raise AgentLoadError(f"Base agent not found: {agent_file}")
+        extension_file = self._extension_file(agent_name)
+        key = stat_key(extension_file)
+        version = key if key is not None else ('basic', base_file.sha256)
+        return base_file, version, self._build_extension(agent_name, extension_file, version)
+
+    def _install_agent(self, agent_name: str, base_file: CachedFile,
+                       version: ExtensionVersion, extension: AgentExtension) -> None:
+        with self._lock:
+            self._file_cache[self._agent_file(agent_name).as_posix()] = base_file
+            self._extension_cache[self._extension_file(agent_name).as_posix()] = (version, extension)
+            self._stats['file'].misses += 1
+            self._stats['extension'].misses += 1
+
+    def write_snapshot(self, agents: Optional[List[str]] = None) -> int:
+        """
+        Write merged configurations and their fingerprints to snapshot_path
+
+        Agents whose extension holds values marshal cannot store (such as the
+        datetime.date of an unquoted YAML date) are left out and load fresh.
+
+        Returns:
+            int: Number of agents in the snapshot
+        """
+        entries = {}
+        for agent_name in agents if agents is not None else self.discover_agents():
+            self.load_agent_with_extensions(agent_name)
+            base_file = self._file_cache[self._agent_file(agent_name).as_posix()]
+            version, extension = self._extension_cache[self._extension_file(agent_name).as_posix()]
+            entry = {
+                'base_key': base_file.key,
+                'sha256': base_file.sha256,
+                'content': base_file.content,
+                'extension_version': version,
+                'extension': asdict(extension),
+                'merged': self._merged_cache[(agent_name, base_file.key, version)]
+            }
+            try:
+                marshal.dumps(entry)
+            except ValueError as e:
+                self.logger.warning(f"Agent {agent_name} left out of snapshot: {e}")
+                continue
+            entries[agent_name] = entry
+        payload = marshal.dumps({
+            'python': tuple(sys.version_info[:2]),
+            'bmad_core_path': str(self.bmad_core_path.resolve()),
+            'bmad_auto_path': str(self.bmad_auto_path.resolve()),
+            'agents': entries
+        })
+
+        snapshot_path = Path(self.snapshot_path)
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(_SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION) + payload)
+        os.replace(tmp_path, snapshot_path)
+        return len(entries)
+
+    def _restore_snapshot(self, agents: List[str]) -> Set[str]:
+        """Install snapshot entries whose files still match; returns the restored agents"""
+        try:
+            data = Path(self.snapshot_path).read_bytes()
+            magic, version = _SNAPSHOT_HEADER.unpack_from(data)
+            if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+                return set()
+            snapshot = marshal.loads(data[_SNAPSHOT_HEADER.size:])
+        except (OSError, EOFError, ValueError, TypeError, struct.error):
+            return set()  # missing, truncated or from another format: load fresh
+        if (snapshot.get('python') != tuple(sys.version_info[:2])
+                or snapshot.get('bmad_core_path') != str(self.bmad_core_path.resolve())
+                or snapshot.get('bmad_auto_path') != str(self.bmad_auto_path.resolve())):
+            return set()
+
+        restored = set()
+        for agent_name in agents:
+            entry = snapshot['agents'].get(agent_name)
+            if entry is None:
+                continue
+            agent_file = self._agent_file(agent_name)
+            base_file = CachedFile(key=entry['base_key'], content=entry['content'], sha256=entry['sha256'])
+            key = stat_key(agent_file)
+            if key != base_file.key:
+                # Touched or copied but possibly identical: the hash decides
+                base_file = read_file(agent_file)
+                if base_file is None or base_file.sha256 != entry['sha256']:
+                    continue
+            extension_key = stat_key(self._extension_file(agent_name))
+            version = extension_key if extension_key is not None else ('basic', base_file.sha256)
+            if version != entry['extension_version']:
+                continue
+
+            with self._lock:
+                self._file_cache[agent_file.as_posix()] = base_file
+                self._extension_cache[self._extension_file(agent_name).as_posix()] = (
+                    version, AgentExtension(**entry['extension'])
+                )
+                self._merged_cache[(agent_name, base_file.key, version)] = entry['merged']
+            restored.add(agent_name)
+        return restored
+
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hits, misses and hit rate of the file, extension, merged-config and definition caches"""
+        with self._lock:
+            return {name: stats.as_dict() for name, stats in self._stats.items()}
+
+    def _record(self, cache: str, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._stats[cache].hits += 1
+            else:
+                self._stats[cache].misses += 1
+
+    def clear_cache(self, agent_name: Optional[str] = None) -> None:
+        """Drop cached files and configurations (for one agent, or all)"""
+        with self._lock:
+            self._generation += 1
+            if agent_name is None:
+                self._hot.clear()
+                self._file_cache.clear()
+                self._extension_cache.clear()
+                self._merged_cache.clear()
+                self._validation_cache.clear()
+                self._definitions.clear()
+                return
+            self._hot.pop(agent_name, None)
+            self._file_cache.pop(self._agent_file(agent_name).as_posix(), None)
+            self._extension_cache.pop(self._extension_file(agent_name).as_posix(), None)
+            for key in [key for key in self._merged_cache if key[0] == agent_name]:
+                del self._merged_cache[key]
+            self._validation_cache.pop(agent_name, None)
+            self._definitions.pop(agent_name, None)
+
+    def _detach_watcher(self, watcher) -> None:
+        with self._lock:
+            if self.watcher is watcher:
+                self.watcher = None
+                self._hot.clear()
+
+    def watch(self, poll_interval: float = 1.0, use_inotify: Optional[bool] = None):
+        """
+        Start a background AgentFileWatcher over the agent and extension directories
+
+        Returns:
+            AgentFileWatcher: subscribe() to it for change events
+        """
+        from .agent_watcher import AgentFileWatcher
+
+        if self.watcher is None:
+            AgentFileWatcher(self, poll_interval=poll_interval, use_inotify=use_inotify).start()
+        return self.watcher
+
+    def unwatch(self) -> None:
+        """Stop the watcher; loads go back to checking each file's stat"""
+        if self.watcher is not None:
+            self.watcher.stop()
 
     def _load_base_agent(self, agent_name: str) -> Dict[str, Any]:
         """Load base .bmad-core agent definition (read-only)."""
-        agent_file = self.bmad_core_path / "agents" / f"{agent_name}.md"
+        agent_file = self._agent_file(agent_name)
+        cached = self._read_cached(agent_file)
 
-        if not agent_file.exists():
+        if cached is None:
             raise AgentLoadError(f"Base agent not found: {agent_file}")
 
-        with open(agent_file, 'r') as f:
-            content = f.read()
+        return self._base_agent(agent_name, agent_file, cached)
 
+    def _base_agent(self, agent_name: str, agent_file: Path, cached: CachedFile) -> Dict[str, Any]:
         return {
             'agent_name': agent_name,
-            'base_definition': content,
+            'base_definition': cached.content,
             'base_path': str(agent_file),
             'loaded_at': datetime.utcnow().isoformat()
         }
 
+    def agent_definition(self, agent_name: str) -> 'AgentDefinition':
+        """
+        Parsed, immutable definition of a .bmad-core agent
+
+        Parsed once per file contents; while a watcher runs, repeat calls do
+        not touch the filesystem.
+
+        Raises:
+            AgentLoadError: if the agent does not exist or its YAML block is invalid
+            BMadCorePreservationError: if the agent file changed since it was first loaded
+        """
+        definition = self._definitions.get(agent_name)
+        if definition is not None and self.watcher is not None:
+            self._record('definition', hit=True)
+            return definition
+
+        generation = self._generation
+        agent_file = self._agent_file(agent_name)
+        base_file = self._read_cached(agent_file)
+        if base_file is None:
+            raise AgentLoadError(f"Base agent not found: {agent_file}")
+        if not self._integrity_matches(agent_name, base_file.sha256):
+            raise BMadCorePreservationError(
+                f"Integrity check failed for .bmad-core agent: {agent_name}"
+            )
+        if definition is not None and definition.sha256 == base_file.sha256:
+            self._record('definition', hit=True)
+            return definition
+
+        self._record('definition', hit=False)
+        definition = self._parse_definition(agent_name, agent_file, base_file)
+        with self._lock:
+            # Watched lookups trust this entry without a stat: never store one read before an invalidation
+            if generation == self._generation:
+                self._definitions[agent_name] = definition
+        return definition
+
+    def _parse_definition(self, agent_name: str, agent_file: Path, base_file: CachedFile) -> 'AgentDefinition':
+        from .agent_definition import AgentDefinition  # deferred like yaml: loads never parse definitions
+
+        try:
+            return AgentDefinition.parse(
+                agent_name, base_file.content, str(agent_file), base_file.sha256,
+                source=partial(self._definition_text, agent_name, base_file.sha256)
+            )
+        except ValueError as e:
+            raise AgentLoadError(str(e)) from e
+
+    def _definition_text(self, agent_name: str, sha256: str) -> str:
+        """Raw text behind a definition, from the file cache when unchanged"""
+        cached = self._read_cached(self._agent_file(agent_name))
+        if cached is None or cached.sha256 != sha256:
+            raise BMadCorePreservationError(
+                f"Agent file changed since its definition was parsed: {agent_name}"
+            )
+        return cached.content
+
     def _load_extension_config(self, agent_name: str) -> AgentExtension:
         """Load YAML extension configuration from .bmad-auto/agents/."""
-        extension_file = self.bmad_auto_path / "agents" / f"{agent_name}_extension.yaml"
+        return self._extension_for(agent_name)[1]
 
-        if not extension_file.exists():
+    def _extension_for(self, agent_name: str) -> Tuple[ExtensionVersion, AgentExtension]:
+        """
+        (version, extension): the version is the extension file's stat key, or
+        the base agent hash for agents without one
+        """
+        extension_file = self._extension_file(agent_name)
+        key = stat_key(extension_file)
+        version = key if key is not None else ('basic', self._compute_agent_hash(agent_name))
+        cached = self._extension_cache.get(extension_file.as_posix())
+        if cached is not None and cached[0] == version:
+            self._record('extension', hit=True)
+            return cached
+        self._record('extension', hit=False)
+
+        extension = self._build_extension(agent_name, extension_file, version)
+        with self._lock:
+            self._extension_cache[extension_file.as_posix()] = (version, extension)
+        return version, extension
+
+    def _build_extension(self, agent_name: str, extension_file: Path, version: ExtensionVersion) -> AgentExtension:
+        if version[0] == 'basic':
             # Return minimal extension for agents without custom configs
-            return AgentExtension(
+            extension = AgentExtension(
                 agent_name=agent_name,
                 extension_type='basic',
-                base_agent_hash=self._compute_agent_hash(agent_name),
+                base_agent_hash=version[1],
                 extension_config={},
                 spec_kit_enabled=False,
                 is_active=True
             )
+        else:
+            import yaml  # deferred: a start restored from the snapshot never parses YAML
 
-        with open(extension_file, 'r') as f:
-            config = yaml.safe_load(f)
+            with open(extension_file, 'r') as f:
+                config = yaml.safe_load(f)
 
-        return AgentExtension(
-            agent_name=agent_name,
-            extension_type=config.get('extension_type', 'basic'),
-            base_agent_hash=config.get('base_agent_hash', ''),
-            extension_config=config.get('extension_config', {}),
-            spec_kit_enabled=config.get('spec_kit_enabled', False),
-            is_active=config.get('is_active', True)
-        )
+            extension = AgentExtension(
+                agent_name=agent_name,
+                extension_type=config.get('extension_type', 'basic'),
+                base_agent_hash=config.get('base_agent_hash', ''),
+                extension_config=config.get('extension_config', {}),
+                spec_kit_enabled=config.get('spec_kit_enabled', False),
+                is_active=config.get('is_active', True)
+            )
+        return extension
 
     def _merge_configurations(
         self,
@@ -148,8 +603,9 @@ class AgentExtensionLoader:
 
     def _validate_core_integrity(self, agent_name: str) -> bool:
         """Validate .bmad-core agent file has not been modified."""
-        current_hash = self._compute_agent_hash(agent_name)
+        return self._integrity_matches(agent_name, self._compute_agent_hash(agent_name))
 
+    def _integrity_matches(self, agent_name: str, current_hash: str) -> bool:
         # Check against cached hash if available
         if agent_name in self.integrity_cache:
             return current_hash == self.integrity_cache[agent_name]
@@ -159,17 +615,17 @@ class AgentExtensionLoader:
         return True
 
     def _compute_agent_hash(self, agent_name: str) -> str:
-        """Compute SHA-256 hash of base agent file for integrity checking."""
-        agent_file = self.bmad_core_path / "agents" / f"{agent_name}.md"
-
-        if not agent_file.exists():
-            return ""
-
-        with open(agent_file, 'rb') as f:
-            return hashlib.sha256(f.read()).hexdigest()
+        """SHA-256 of the base agent file, recomputed only when its stat key changes."""
+        cached = self._read_cached(self._agent_file(agent_name))
+        return cached.sha256 if cached is not None else ""
 
     def validate_all_extensions(self) -> Dict[str, bool]:
         """Validate compatibility of all agent extensions."""
+        if self.watcher is not None and self.watcher.primed:
+            # Kept current by the watcher: no glob, stat or parse
+            with self._lock:
+                return {agent_name: entry[2] for agent_name, entry in self._validation_cache.items()}
+
         results = {}
         agent_dir = self.bmad_auto_path / "agents"
 
@@ -178,14 +634,30 @@ class AgentExtensionLoader:
 
         for ext_file in agent_dir.glob("*_extension.yaml"):
             agent_name = ext_file.stem.replace('_extension', '')
-            try:
-                extension = self._load_extension_config(agent_name)
-                results[agent_name] = self._validate_extension_compatibility(extension)
-            except Exception as e:
-                results[agent_name] = False
+            results[agent_name] = self.revalidate_extension(agent_name)
 
         return results
 
+    def revalidate_extension(self, agent_name: str) -> bool:
+        """Validate one extension, reusing the last result while both its files are unchanged"""
+        extension_key = stat_key(self._extension_file(agent_name))
+        base_key = stat_key(self._agent_file(agent_name))
+        cached = self._validation_cache.get(agent_name)
+        if cached is not None and cached[:2] == (extension_key, base_key):
+            return cached[2]
+
+        if extension_key is None:
+            with self._lock:
+                self._validation_cache.pop(agent_name, None)
+            return False
+        try:
+            valid = self._validate_extension_compatibility(self._load_extension_config(agent_name))
+        except Exception:
+            valid = False
+        with self._lock:
+            self._validation_cache[agent_name] = (extension_key, base_key, valid)
+        return valid
+
     def _validate_extension_compatibility(self, extension: AgentExtension) -> bool:
         """Validate extension configuration is compatible with base agent."""
         # Check base agent exists
@@ -210,9 +682,10 @@ class AgentExtensionLoader:
             if agent_name in self.loaded_extensions:
                 del self.loaded_extensions[agent_name]
 
-            # Clear integrity cache to force re-validation
+            # Clear integrity and file caches to force a re-read and re-hash
             if agent_name in self.integrity_cache:
                 del self.integrity_cache[agent_name]
+            self.clear_cache(agent_name)
 
             # Reload with fresh configuration
             self.load_agent_with_extensions(agent_name)
@@ -0,0 +1,229 @@
+"""
+BMAD Auto Agent File Watcher
+Background change detection for AgentExtensionLoader
+
+Watches .bmad-core/agents (*.md) and the extension directory (*_extension.yaml).
+With inotify_simple installed the thread blocks on inotify and re-stats only
+the files named in events; otherwise it diffs a stat() of both directories
+every poll_interval seconds. Either way a change is confirmed against the last
+seen (path, mtime_ns, size, inode), so a touch that rewrites nothing is ignored.
+
+For each changed file the watcher invalidates only that agent's cache entries,
+re-validates only that agent's extension, and publishes an AgentChangeEvent to
+subscribers. While it runs, the loader serves unchanged agents from memory and
+validate_all_extensions() returns the maintained results without touching the
+filesystem. Changes become visible within one poll interval (inotify: as soon
+as the writer closes the file).
+
+The integrity baseline is never reset: a modified .bmad-core agent is reported
+with valid=False and still raises BMadCorePreservationError on its next load.
+"""
+
+import os
+import threading
+import time
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .agent_loader import StatKey, stat_key
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:  # optional: fall back to mtime polling
+    INotify = None
+
+BASE_SUFFIX = '.md'
+EXTENSION_SUFFIX = '_extension.yaml'
+
+
+@dataclass(frozen=True)
+class AgentChangeEvent:
+    """One agent file created, modified or deleted"""
+    agent_name: str
+    kind: str  # 'base' or 'extension'
+    change: str  # 'created', 'modified' or 'deleted'
+    path: str
+    # Base files: integrity still matches. Extensions: compatible with the base agent.
+    # None when the file is gone.
+    valid: Optional[bool]
+    detected_at: float
+
+
+class AgentFileWatcher:
+    """
+    Keeps an AgentExtensionLoader's caches current as agent files change
+
+    Normally started through AgentExtensionLoader.watch().
+    """
+
+    def __init__(self, loader, poll_interval: float = 1.0, use_inotify: Optional[bool] = None):
+        self.loader = loader
+        self.poll_interval = poll_interval
+        if use_inotify and INotify is None:
+            raise RuntimeError("inotify_simple is not installed")
+        self.use_inotify = INotify is not None if use_inotify is None else use_inotify
+        self.base_dir = loader.bmad_core_path / "agents"
+        self.extension_dir = loader.bmad_auto_path / "agents"
+        self.logger = logging.getLogger(__name__)
+        self.primed = False
+
+        self._lock = threading.Lock()
+        self._seen: Dict[str, StatKey] = {}
+        self._subscribers: List[Callable[[AgentChangeEvent], None]] = []
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._inotify = None
+        self._watch_dirs: Dict[int, Path] = {}
+
+    @property
+    def backend(self) -> str:
+        return 'inotify' if self.use_inotify else 'polling'
+
+    def subscribe(self, callback: Callable[[AgentChangeEvent], None]) -> None:
+        """Call callback (on the watcher thread) for every change event"""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[AgentChangeEvent], None]) -> None:
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def start(self) -> None:
+        """Record current files, validate every extension once and start watching"""
+        if self._thread is not None:
+            return
+        if self.use_inotify:
+            self._open_inotify()
+        with self._lock:
+            self._seen = {path: stat_key(Path(path)) for path in self._scan()}
+            for path in self._seen:
+                agent_name, kind = self._classify(path)
+                if kind == 'extension':
+                    self.loader.revalidate_extension(agent_name)
+            self.primed = True
+            self.loader.watcher = self
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="agent-file-watch", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching; the loader falls back to per-load stat checks"""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        with self._lock:
+            self.primed = False
+            self.loader._detach_watcher(self)
+
+    def poll(self) -> List[AgentChangeEvent]:
+        """Rescan both directories now and apply any changes found"""
+        with self._lock:
+            known = set(self._seen)
+        return self._check(self._scan() | known)
+
+    def _run(self) -> None:
+        if self._inotify is None:
+            while not self._stop_event.wait(self.poll_interval):
+                self._safe(self.poll)
+            return
+
+        while not self._stop_event.is_set():
+            timeout_ms = int(self.poll_interval * 1000)
+            events = self._inotify.read(timeout=timeout_ms, read_delay=50)
+            if events:
+                self._safe(lambda: self._check(
+                    (self._watch_dirs[event.wd] / event.name).as_posix()
+                    for event in events if event.wd in self._watch_dirs and event.name
+                ))
+
+    def _safe(self, check: Callable[[], List[AgentChangeEvent]]) -> None:
+        try:
+            check()
+        except Exception as e:
+            self.logger.error(f"Agent file watch failed: {e}")
+
+    def _open_inotify(self) -> None:
+        self._inotify = INotify()
+        mask = (inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO | inotify_flags.MOVED_FROM
+                | inotify_flags.CREATE | inotify_flags.DELETE | inotify_flags.ATTRIB)
+        for directory in (self.base_dir, self.extension_dir):
+            # A directory created later is not watched; poll() still sees it
+            if directory.is_dir():
+                self._watch_dirs[self._inotify.add_watch(str(directory), mask)] = directory
+
+    def _scan(self) -> set:
+        paths = set()
+        for directory, suffix in ((self.base_dir, BASE_SUFFIX), (self.extension_dir, EXTENSION_SUFFIX)):
+            try:
+                with os.scandir(directory) as entries:
+                    paths.update(
+                        (directory / entry.name).as_posix()
+                        for entry in entries if entry.name.endswith(suffix)
+                    )
+            except FileNotFoundError:
+                continue
+        return paths
+
+    def _classify(self, path: str) -> Tuple[Optional[str], Optional[str]]:
+        path = Path(path)
+        if path.parent == self.base_dir and path.name.endswith(BASE_SUFFIX):
+            return path.name[:-len(BASE_SUFFIX)], 'base'
+        if path.parent == self.extension_dir and path.name.endswith(EXTENSION_SUFFIX):
+            return path.name[:-len(EXTENSION_SUFFIX)], 'extension'
+        return None, None
+
+    def _check(self, paths: Iterable[str]) -> List[AgentChangeEvent]:
+        changed = []
+        with self._lock:
+            for path in sorted(set(paths)):
+                agent_name, kind = self._classify(path)
+                if agent_name is None:
+                    continue
+                key = stat_key(Path(path))
+                previous = self._seen.get(path)
+                if key == previous:
+                    continue
+                if key is None:
+                    del self._seen[path]
+                    change = 'deleted'
+                else:
+                    self._seen[path] = key
+                    change = 'created' if previous is None else 'modified'
+                changed.append(self._apply(agent_name, kind, change, path))
+
+        for event in changed:
+            self.logger.info(f"Agent {event.agent_name} {event.kind} {event.change}")
+            for callback in list(self._subscribers):
+                try:
+                    callback(event)
+                except Exception as e:
+                    self.logger.error(f"Agent change subscriber failed: {e}")
+        return changed
+
+    def _apply(self, agent_name: str, kind: str, change: str, path: str) -> AgentChangeEvent:
+        loader = self.loader
+        loader.clear_cache(agent_name)
+
+        valid = None
+        if kind == 'base' and change != 'deleted':
+            valid = loader._validate_core_integrity(agent_name)
+        # Compatibility depends on the base file too, so either change re-validates
+        if self._seen.get(loader._extension_file(agent_name).as_posix()) is not None:
+            extension_valid = loader.revalidate_extension(agent_name)
+            if kind == 'extension':
+                valid = extension_valid
+
+        return AgentChangeEvent(
+            agent_name=agent_name,
+            kind=kind,
+            change=change,
+            path=path,
+            valid=valid,
+            detected_at=time.time()
+        )
@@ -0,0 +1,48 @@
+-- BMAD Auto core coordination.db tables
+-- These tables predate the BMAD Auto extensions and are written by PMCoordinator.
+-- Definitions are kept here so fresh databases (tests, benchmarks) match production.
+
+-- Agent availability and coordination counters
+CREATE TABLE IF NOT EXISTS agent_status (
+    agent TEXT PRIMARY KEY,
+    last_activity DATETIME,
+    current_task TEXT,
+    status TEXT DEFAULT 'available',  -- 'available', 'busy', 'offline', 'error'
+    coordination_count INTEGER DEFAULT 0,
+    current_load REAL DEFAULT 0.0,    -- decayed load, flushed by AgentLoadTracker
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- PM coordinated workflow tracking
+CREATE TABLE IF NOT EXISTS workflow_state (
+    id TEXT PRIMARY KEY,
+    workflow_type TEXT NOT NULL,
+    agents_involved TEXT,            -- JSON array of agent names
+    current_stage TEXT,
+    status TEXT DEFAULT 'active',
+    context TEXT,                    -- JSON workflow context
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Agent command and notification log
+CREATE TABLE IF NOT EXISTS coordination_log (
+    id INTEGER PRIMARY KEY,
+    agent TEXT NOT NULL,
+    command TEXT NOT NULL,
+    context TEXT,                    -- JSON context
+    status TEXT,
+    pm_decision TEXT,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Durable per-agent read cursors into notification rows of coordination_log
+CREATE TABLE IF NOT EXISTS agent_notification_cursors (
+    agent TEXT PRIMARY KEY,
+    cursor INTEGER NOT NULL DEFAULT 0,  -- last acknowledged coordination_log.id
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_workflow_state_status ON workflow_state(status);
+CREATE INDEX IF NOT EXISTS idx_coordination_log_agent ON coordination_log(agent);
+CREATE INDEX IF NOT EXISTS idx_coordination_log_outbox ON coordination_log(agent, command, id);
@@ -85,13 +85,137 @@ CREATE TABLE IF NOT EXISTS quality_gate_executions (
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Serialize-once task payloads, referenced by hash from pm_decision_log and workflow_state contexts
+CREATE TABLE IF NOT EXISTS task_payloads (
+    hash TEXT PRIMARY KEY,           -- blake2b-128 of body
+    body BLOB NOT NULL,              -- canonical JSON bytes (sorted keys, compact)
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Per-step coordinate_task latency, one row per step and flush window
+CREATE TABLE IF NOT EXISTS pm_step_metrics (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    step TEXT NOT NULL,              -- decompose, assign, capture_decision, ...
+    window_start DATETIME NOT NULL,
+    window_end DATETIME NOT NULL,
+    count INTEGER NOT NULL,
+    total_ms REAL NOT NULL,
+    p50_ms REAL,
+    p95_ms REAL,
+    p99_ms REAL,
+    max_ms REAL
+);
+
+-- Per-day, per-type decision aggregates for analyze_decision_patterns, kept in step by triggers
+CREATE TABLE IF NOT EXISTS pm_decision_daily_rollup (
+    day TEXT NOT NULL,
+    decision_type TEXT NOT NULL,
+    decision_count INTEGER NOT NULL DEFAULT 0,
+    confidence_sum INTEGER NOT NULL DEFAULT 0,
+    confidence_count INTEGER NOT NULL DEFAULT 0,
+    low_confidence_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, decision_type)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS trg_pm_decision_rollup_insert
+AFTER INSERT ON pm_decision_log
+BEGIN
+    INSERT INTO pm_decision_daily_rollup
+    (day, decision_type, decision_count, confidence_sum, confidence_count, low_confidence_count)
+    VALUES (
+        COALESCE(DATE(NEW.created_at), DATE('now')), NEW.decision_type, 1,
+        COALESCE(NEW.confidence_score, 0), NEW.confidence_score IS NOT NULL,
+        COALESCE(NEW.confidence_score < 7, 0)
+    )
+    ON CONFLICT(day, decision_type) DO UPDATE SET
+        decision_count = decision_count + 1,
+        confidence_sum = confidence_sum + excluded.confidence_sum,
+        confidence_count = confidence_count + excluded.confidence_count,
+        low_confidence_count = low_confidence_count + excluded.low_confidence_count;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_pm_decision_rollup_delete
+AFTER DELETE ON pm_decision_log
+BEGIN
+    UPDATE pm_decision_daily_rollup SET
+        decision_count = decision_count - 1,
+        confidence_sum = confidence_sum - COALESCE(OLD.confidence_score, 0),
+        confidence_count = confidence_count - (OLD.confidence_score IS NOT NULL),
+        low_confidence_count = low_confidence_count - COALESCE(OLD.confidence_score < 7, 0)
+    WHERE day = COALESCE(DATE(OLD.created_at), DATE('now')) AND decision_type = OLD.decision_type;
+    DELETE FROM pm_decision_daily_rollup
+    WHERE day = COALESCE(DATE(OLD.created_at), DATE('now')) AND decision_type = OLD.decision_type
+      AND decision_count <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_pm_decision_rollup_update
+AFTER UPDATE OF decision_type, confidence_score, created_at ON pm_decision_log
+BEGIN
+    UPDATE pm_decision_daily_rollup SET
+        decision_count = decision_count - 1,
+        confidence_sum = confidence_sum - COALESCE(OLD.confidence_score, 0),
+        confidence_count = confidence_count - (OLD.confidence_score IS NOT NULL),
+        low_confidence_count = low_confidence_count - COALESCE(OLD.confidence_score < 7, 0)
+    WHERE day = COALESCE(DATE(OLD.created_at), DATE('now')) AND decision_type = OLD.decision_type;
+    DELETE FROM pm_decision_daily_rollup
+    WHERE day = COALESCE(DATE(OLD.created_at), DATE('now')) AND decision_type = OLD.decision_type
+      AND decision_count <= 0;
+
+    INSERT INTO pm_decision_daily_rollup
+    (day, decision_type, decision_count, confidence_sum, confidence_count, low_confidence_count)
+    VALUES (
+        COALESCE(DATE(NEW.created_at), DATE('now')), NEW.decision_type, 1,
+        COALESCE(NEW.confidence_score, 0), NEW.confidence_score IS NOT NULL,
+        COALESCE(NEW.confidence_score < 7, 0)
+    )
+    ON CONFLICT(day, decision_type) DO UPDATE SET
+        decision_count = decision_count + 1,
+        confidence_sum = confidence_sum + excluded.confidence_sum,
+        confidence_count = confidence_count + excluded.confidence_count,
+        low_confidence_count = low_confidence_count + excluded.low_confidence_count;
+END;
+
+-- decision_search (FTS5 over pm_decision_log reasoning) and its triggers are created by
+-- intercept/decision_search.py when SQLite has FTS5
+
+-- MinHash signatures of decision prompts for near-duplicate lookup (intercept/decision_similarity.py)
+CREATE TABLE IF NOT EXISTS decision_minhash (
+    decision_id INTEGER PRIMARY KEY,
+    decision_type TEXT NOT NULL,
+    signature BLOB NOT NULL          -- 64 little-endian uint32 MinHash values
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_pm_decision_minhash_delete
+AFTER DELETE ON pm_decision_log
+BEGIN
+    DELETE FROM decision_minhash WHERE decision_id = OLD.id;
+END;
+
+-- Archive partition manifest for tiered retention (intercept/retention.py)
+CREATE TABLE IF NOT EXISTS archive_partitions (
+    id INTEGER PRIMARY KEY,
+    table_name TEXT NOT NULL,        -- pm_decision_log, coordination_log, quality_gate_executions
+    day TEXT NOT NULL,               -- YYYY-MM-DD of the archived created_at values
+    path TEXT NOT NULL,              -- gzip JSON Lines partition file
+    row_count INTEGER NOT NULL,
+    min_id INTEGER,
+    max_id INTEGER,
+    file_bytes INTEGER NOT NULL,
+    archived_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Create indexes for performance
 CREATE INDEX IF NOT EXISTS idx_provider_plans_provider ON provider_plans(provider_name);
+CREATE INDEX IF NOT EXISTS idx_archive_partitions_table_day ON archive_partitions(table_name, day);
 CREATE INDEX IF NOT EXISTS idx_pm_decision_log_type ON pm_decision_log(decision_type);
+CREATE INDEX IF NOT EXISTS idx_pm_decision_log_created ON pm_decision_log(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_pm_decision_log_type_created ON pm_decision_log(decision_type, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_pm_decision_log_confidence ON pm_decision_log(confidence_score, created_at);
 CREATE INDEX IF NOT EXISTS idx_agent_extensions_agent ON agent_extensions(agent_name);
 CREATE INDEX IF NOT EXISTS idx_langgraph_executions_status ON langgraph_executions(execution_status);
 CREATE INDEX IF NOT EXISTS idx_external_service_operations_service ON external_service_operations(service_name);
 CREATE INDEX IF NOT EXISTS idx_quality_gate_executions_stage ON quality_gate_executions(quality_stage);
+CREATE INDEX IF NOT EXISTS idx_pm_step_metrics_step ON pm_step_metrics(step, window_end);
 
 -- Insert initial provider plans for multi-model AI strategy
 INSERT OR IGNORE INTO provider_plans (provider_name, plan_tier, monthly_limit, cost_per_request) VALUES
@@ -24,14 +24,50 @@ Database Schema:
 - Temporal tracking for decision evolution analysis
 """
 
+import csv
+import heapq
+import io
 import json
 import sqlite3
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Sequence, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import uuid
+from contextlib import contextmanager
+
+from .payload_store import Payload, PAYLOAD_INSERT_SQL, ensure_payload_schema, store_payloads
+from . import decision_rollups
+from . import decision_export
+from . import decision_search
+from . import retention
+from .decision_similarity import DecisionSimilarityIndex, ensure_similarity_schema
+from database.group_commit import GroupCommitWriter
+
+
+DECISION_INSERT_SQL = """
+    INSERT INTO pm_decision_log (
+        decision_context, decision_type, reasoning_process,
+        outcome, confidence_score, learning_notes,
+        model_assignments, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+DECISION_COLUMNS = (
+    'id', 'decision_context', 'decision_type', 'reasoning_process', 'outcome',
+    'confidence_score', 'learning_notes', 'model_assignments', 'created_at'
+)
+JSON_COLUMNS = frozenset({'decision_context', 'model_assignments'})
+
+# Keyset pages walk (created_at, id) with or without a decision_type filter
+DECISION_HISTORY_INDEX_SQL = '''
+    CREATE INDEX IF NOT EXISTS idx_pm_decision_log_created ON pm_decision_log(created_at, id);
+    CREATE INDEX IF NOT EXISTS idx_pm_decision_log_type_created ON pm_decision_log(decision_type, created_at, id);
+    CREATE INDEX IF NOT EXISTS idx_pm_decision_log_confidence ON pm_decision_log(confidence_score, created_at);
+'''
 
 
 class DecisionType(Enum):
@@ -65,6 +101,46 @@ class DecisionContext:
             self.decision_id = str(uuid.uuid4())
 
 
+class DecisionRecord(Mapping):
+    """
+    Read-only pm_decision_log row; JSON columns are decoded on first access
+
+    dict(record) decodes everything, matching get_decision_history's rows.
+    """
+
+    __slots__ = ('_columns', '_values', '_decoded', 'keyset')
+
+    def __init__(self, columns: Sequence[str], values: Sequence[Any], keyset: Tuple[Any, Any]):
+        self._columns = columns  # shared per query: column name -> position
+        self._values = values
+        self._decoded: Dict[str, Any] = {}
+        self.keyset = keyset  # (created_at, id) position in the history
+
+    def __getitem__(self, column: str) -> Any:
+        if column in self._decoded:
+            return self._decoded[column]
+        value = self.raw(column)
+        if column in JSON_COLUMNS and value is not None:
+            value = self._decoded[column] = json.loads(value)
+        return value
+
+    def raw(self, column: str) -> Any:
+        """Stored value without JSON decoding"""
+        try:
+            return self._values[self._columns.index(column)]
+        except ValueError:
+            raise KeyError(column) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __repr__(self) -> str:
+        return f"DecisionRecord(id={self.get('id')!r}, decision_type={self.get('decision_type')!r})"
+
+
 class PMDecisionCapture:
     """
     PM Decision Reasoning Capture System
@@ -73,10 +149,54 @@ class PMDecisionCapture:
     framework enhancement with confidence scoring and learning feedback.
     """
 
-    def __init__(self, db_path: str = "coordination.db"):
+    def __init__(
+        self,
+        db_path: str = "coordination.db",
+        durability: Optional[str] = None,
+        max_batch: int = 512,
+        max_delay: float = 0.0,
+        max_queue: int = 10000,
+        put_timeout: float = 5.0
+    ):
+        """
+        Args:
+            durability: None writes each decision on its own connection and
+                commit. 'sync', 'group' or 'async' route writes through a
+                GroupCommitWriter: 'group' blocks until the batch holding the
+                decision commits, 'async' returns at once (call flush() before
+                reading back). A full queue blocks for put_timeout, then raises
+                WriteQueueFull.
+            max_delay: Extra time to gather a batch. The default 0 commits as
+                soon as the queue is drained; concurrent callers still batch up
+                behind the commit in flight without waiting on a timer.
+        """
         self.db_path = db_path
         self.logger = logging.getLogger(__name__)
         self._ensure_database_connection()
+        self.similarity_index = DecisionSimilarityIndex(db_path)
+        self.writer: Optional[GroupCommitWriter] = None
+        if durability is not None:
+            self.writer = GroupCommitWriter(
+                db_path,
+                self._write_decisions,
+                durability=durability,
+                max_batch=max_batch,
+                max_delay=max_delay,
+                max_queue=max_queue,
+                put_timeout=put_timeout,
+                name='decision-capture'
+            )
+
+    def flush(self) -> None:
+        """Block until every buffered decision has been committed"""
+        if self.writer is not None:
+            self.writer.flush()
+
+    def close(self) -> None:
+        """Flush buffered decisions, stop the writer thread and save the similarity index"""
+        if self.writer is not None:
+            self.writer.close()
+        self.similarity_index.close()
 
     def _ensure_database_connection(self) -> None:
         """Ensure database connection and schema exist"""
@@ -89,51 +209,140 @@ class PMDecisionCapture:
                 """)
                 if not cursor.fetchone():
                     raise Exception("pm_decision_log table not found in coordination.db")
+                ensure_payload_schema(conn)
+                conn.executescript(DECISION_HISTORY_INDEX_SQL)
+                if decision_rollups.ensure_rollups(conn):
+                    self.logger.info("Decision rollups created and backfilled")
+                if decision_search.ensure_search_index(conn):
+                    self.logger.info("Decision search index created and populated")
+                ensure_similarity_schema(conn)
 
             self.logger.info("Database connection verified")
         except Exception as e:
             self.logger.error(f"Database connection failed: {e}")
             raise
 
-    def capture_decision(self, decision: DecisionContext) -> str:
+    def capture_decision(self, decision: DecisionContext, payloads: Iterable[Payload] = ()) -> str:
         """
         Capture PM decision with complete reasoning and context
 
         Args:
             decision: Complete decision context and reasoning
+            payloads: Encoded payloads the context references by hash,
+                stored in the same transaction
 
         Returns:
             str: Decision ID for tracking
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT INTO pm_decision_log (
-                        decision_context, decision_type, reasoning_process,
-                        outcome, confidence_score, learning_notes,
-                        model_assignments, created_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    json.dumps(decision.context_data),
-                    decision.decision_type.value,
-                    decision.reasoning_process,
-                    decision.outcome,
-                    decision.confidence_score,
-                    decision.learning_notes,
-                    json.dumps({
-                        "agent_assignments": decision.agent_assignments,
-                        "resource_optimization": decision.resource_optimization
-                    }),
-                    decision.created_at.isoformat()
-                ))
-
-                self.logger.info(f"Decision captured: {decision.decision_id}")
+            if self.writer is not None:
+                self.writer.submit([(self._decision_row(decision), [payload.row() for payload in payloads])])
+                self.logger.debug(f"Decision queued: {decision.decision_id}")
                 return decision.decision_id
 
+            with self._write_transaction() as conn:
+                store_payloads(conn, payloads)
+                conn.execute(DECISION_INSERT_SQL, self._decision_row(decision))
+
+            self.logger.info(f"Decision captured: {decision.decision_id}")
+            return decision.decision_id
+
         except Exception as e:
             self.logger.error(f"Failed to capture decision: {e}")
             raise
 
+    def capture_decisions(
+        self,
+        decisions: List[DecisionContext],
+        conn: Optional[sqlite3.Connection] = None,
+        payloads: Iterable[Payload] = ()
+    ) -> List[str]:
+        """
+        Capture a batch of PM decisions with a single executemany
+
+        Args:
+            decisions: Decision contexts to store
+            conn: Open connection to write through; the caller owns the
+                transaction when provided, otherwise one is committed here
+            payloads: Encoded payloads the contexts reference by hash
+
+        Returns:
+            List[str]: Decision IDs in input order
+        """
+        rows = [self._decision_row(decision) for decision in decisions]
+        decision_ids = [decision.decision_id for decision in decisions]
+
+        if conn is not None:
+            # Caller owns the transaction and its error handling
+            store_payloads(conn, payloads)
+            conn.executemany(DECISION_INSERT_SQL, rows)
+            return decision_ids
+
+        try:
+            if self.writer is not None:
+                # Payloads ride on the first row so the batch stays a single submit
+                payload_rows = [payload.row() for payload in payloads]
+                self.writer.submit([
+                    (row, payload_rows if i == 0 else []) for i, row in enumerate(rows)
+                ])
+                return decision_ids
+
+            with self._write_transaction() as own_conn:
+                store_payloads(own_conn, payloads)
+                own_conn.executemany(DECISION_INSERT_SQL, rows)
+
+            self.logger.info(f"Decisions captured: {len(rows)}")
+            return decision_ids
+
+        except Exception as e:
+            self.logger.error(f"Failed to capture decisions: {e}")
+            raise
+
+    @contextmanager
+    def _write_transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Connection inside a BEGIN IMMEDIATE transaction, committed on success
+
+        The search and rollup triggers read before they write. In a deferred
+        transaction the lock upgrade then fails at once with SQLITE_BUSY under
+        concurrent captures. Taking the write lock up front waits on the busy
+        timeout instead, 30s as for the group-commit writer: SQLite's busy
+        handler is not fair, and many writers can starve one past the 5s default.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield conn
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+        finally:
+            conn.close()
+
+    def _write_decisions(self, conn: sqlite3.Connection, rows: List[Tuple]) -> List[None]:
+        """GroupCommitWriter batch: payloads first, then one executemany for the decisions"""
+        conn.executemany(PAYLOAD_INSERT_SQL, [payload for _, payloads in rows for payload in payloads])
+        conn.executemany(DECISION_INSERT_SQL, [decision_row for decision_row, _ in rows])
+        return [None] * len(rows)
+
+    def _decision_row(self, decision: DecisionContext) -> Tuple:
+        """Build pm_decision_log row values for a decision"""
+        return (
+            json.dumps(decision.context_data),
+            decision.decision_type.value,
+            decision.reasoning_process,
+            decision.outcome,
+            decision.confidence_score,
+            decision.learning_notes,
+            json.dumps({
+                "agent_assignments": decision.agent_assignments,
+                "resource_optimization": decision.resource_optimization
+            }),
+            decision.created_at.isoformat()
+        )
+
     def create_task_assignment_decision(
         self,
         user_prompt: str,
@@ -219,16 +428,60 @@ class PMDecisionCapture:
             learning_notes="Resource optimization decision with budget constraints"
         )
 
-    def get_decision_history(
+    def iter_decision_history(
         self,
         decision_type: Optional[DecisionType] = None,
-        days_back: int = 30,
-        min_confidence: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
-        """Retrieve decision history for analysis"""
+        days_back: Optional[int] = 30,
+        min_confidence: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+        page_size: int = 500,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        after: Optional[Tuple[Any, Any]] = None,
+        oldest_first: bool = False,
+        include_archived: bool = False
+    ) -> Iterator[DecisionRecord]:
+        """
+        Stream decision history newest first, one keyset page at a time
+
+        Pages are fetched on a short-lived connection and resume after the last
+        (created_at, id) seen, so memory stays at one page however long the
+        history is and no read transaction is held between pages.
+
+        Args:
+            days_back: Relative window; None for no relative limit
+            columns: pm_decision_log columns to select (default: all)
+            page_size: Rows fetched per query
+            since, until: Absolute created_at range [since, until)
+            after: Resume after this record.keyset (in iteration order)
+            oldest_first: Iterate in ascending (created_at, id) order
+            include_archived: Merge in decisions moved to archive partitions
+                by intercept.retention
+
+        Raises:
+            ValueError: Unknown column requested
+        """
+        columns = tuple(columns or DECISION_COLUMNS)
+        unknown = set(columns) - set(DECISION_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown pm_decision_log columns: {sorted(unknown)}")
+        # The keyset columns are always fetched, after the projected ones
+        selected = columns + tuple(c for c in ('created_at', 'id') if c not in columns)
+        created_at_pos, id_pos = selected.index('created_at'), selected.index('id')
+
+        where_clauses: List[str] = []
+        params: List[Any] = []
 
-        where_clauses = ["created_at >= datetime('now', '-{} days')".format(days_back)]
-        params = []
+        if days_back is not None:
+            where_clauses.append("created_at >= datetime('now', '-{} days')".format(days_back))
+
+        if since is not None:
+            where_clauses.append("created_at >= ?")
+            params.append(since.isoformat())
+
+        if until is not None:
+            where_clauses.append("created_at < ?")
+            params.append(until.isoformat())
 
         if decision_type:
             where_clauses.append("decision_type = ?")
@@ -238,86 +491,163 @@ class PMDecisionCapture:
             where_clauses.append("confidence_score >= ?")
             params.append(min_confidence)
 
-        where_clause = " AND ".join(where_clauses)
+        where_clause = " AND ".join(where_clauses) or "1"
+        direction, beyond = ('ASC', '>') if oldest_first else ('DESC', '<')
+        first_page = f"""
+            SELECT {', '.join(selected)} FROM pm_decision_log
+            WHERE {where_clause}
+            ORDER BY created_at {direction}, id {direction} LIMIT ?
+        """
+        next_page = f"""
+            SELECT {', '.join(selected)} FROM pm_decision_log
+            WHERE {where_clause} AND (created_at, id) {beyond} (?, ?)
+            ORDER BY created_at {direction}, id {direction} LIMIT ?
+        """
 
+        def hot_pages() -> Iterator[DecisionRecord]:
+            keyset: Optional[Tuple[Any, Any]] = tuple(after) if after is not None else None
+            while True:
+                with sqlite3.connect(self.db_path) as conn:
+                    if keyset is None:
+                        rows = conn.execute(first_page, (*params, page_size)).fetchall()
+                    else:
+                        rows = conn.execute(next_page, (*params, *keyset, page_size)).fetchall()
+
+                for row in rows:
+                    yield DecisionRecord(columns, row, (row[created_at_pos], row[id_pos]))
+                if len(rows) < page_size:
+                    return
+                keyset = (rows[-1][created_at_pos], rows[-1][id_pos])
+
+        if not include_archived:
+            yield from hot_pages()
+            return
+
+        # Same filters, applied in Python to archived rows
+        low = [since.isoformat()] if since is not None else []
+        if days_back is not None:
+            low.append((datetime.now(timezone.utc) - timedelta(days=days_back)).strftime('%Y-%m-%d %H:%M:%S'))
+        low_bound = max(low) if low else None
+        high_bound = until.isoformat() if until is not None else None
+        after_keyset = tuple(after) if after is not None else None
+
+        def matches(row: Dict[str, Any]) -> bool:
+            keyset = (row['created_at'], row['id'])
+            return (
+                (low_bound is None or keyset[0] >= low_bound)
+                and (high_bound is None or keyset[0] < high_bound)
+                and (not decision_type or row['decision_type'] == decision_type.value)
+                and (not min_confidence or (row['confidence_score'] or 0) >= min_confidence)
+                and (after_keyset is None or (keyset > after_keyset if oldest_first else keyset < after_keyset))
+            )
+
+        archived = (
+            DecisionRecord(columns, tuple(row.get(column) for column in selected), (row['created_at'], row['id']))
+            for row in retention.RetentionManager(self.db_path).iter_archived(
+                'pm_decision_log',
+                first_day=low_bound[:10] if low_bound else None,
+                last_day=high_bound[:10] if high_bound else None,
+                newest_first=not oldest_first
+            )
+            if matches(row)
+        )
+        yield from heapq.merge(hot_pages(), archived, key=lambda record: record.keyset, reverse=not oldest_first)
+
+    def get_decision_history(
+        self,
+        decision_type: Optional[DecisionType] = None,
+        days_back: int = 30,
+        min_confidence: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Retrieve decision history for analysis (all rows, JSON decoded)"""
+        try:
+            return [
+                dict(record)
+                for record in self.iter_decision_history(decision_type, days_back, min_confidence)
+            ]
+
+        except Exception as e:
+            self.logger.error(f"Failed to retrieve decision history: {e}")
+            return []
+
+    def search_decisions(
+        self,
+        query: str,
+        decision_type: Optional[DecisionType] = None,
+        limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """
+        Full-text search over decision reasoning, outcome and learning notes
+
+        Returns:
+            Matches ranked by bm25, each with id, decision_type, created_at,
+            confidence_score, outcome, a [highlighted] snippet and score
+            (lower is better)
+        """
         try:
             with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.execute(f"""
-                    SELECT * FROM pm_decision_log
-                    WHERE {where_clause}
-                    ORDER BY created_at DESC
-                """, params)
-
-                decisions = []
-                for row in cursor.fetchall():
-                    decision = dict(row)
-                    # Parse JSON fields
-                    decision["decision_context"] = json.loads(decision["decision_context"])
-                    decision["model_assignments"] = json.loads(decision["model_assignments"])
-                    decisions.append(decision)
+                return decision_search.search(
+                    conn, query, decision_type.value if decision_type else None, limit
+                )
 
-                return decisions
+        except Exception as e:
+            self.logger.error(f"Failed to search decisions: {e}")
+            return []
+
+    def find_similar_decisions(
+        self,
+        text: str,
+        decision_type: Optional[DecisionType] = None,
+        limit: int = 5,
+        min_similarity: float = 0.5
+    ) -> List[Dict[str, Any]]:
+        """
+        Past decisions whose prompt (or reasoning) is a near-duplicate of text
+
+        Returns:
+            Best matches first, each with id, decision_type, created_at,
+            confidence_score, outcome, decision_context and similarity (0-1)
+        """
+        try:
+            return self.similarity_index.similar(
+                text, limit, min_similarity, decision_type.value if decision_type else None
+            )
 
         except Exception as e:
-            self.logger.error(f"Failed to retrieve decision history: {e}")
+            self.logger.error(f"Failed to find similar decisions: {e}")
             return []
 
     def analyze_decision_patterns(self) -> Dict[str, Any]:
-        """Analyze decision patterns for learning and optimization"""
+        """
+        Analyze decision patterns for learning and optimization
+
+        Counts and averages come from the daily rollups, so the 30 and 7 day
+        windows are whole calendar days.
+        """
 
         try:
             with sqlite3.connect(self.db_path) as conn:
                 # Confidence distribution by decision type
-                confidence_analysis = {}
-                cursor = conn.execute("""
-                    SELECT decision_type, AVG(confidence_score) as avg_confidence,
-                           COUNT(*) as total_decisions
-                    FROM pm_decision_log
-                    WHERE created_at >= datetime('now', '-30 days')
-                    GROUP BY decision_type
-                """)
-
-                for row in cursor.fetchall():
-                    confidence_analysis[row[0]] = {
-                        "average_confidence": round(row[1], 2),
-                        "total_decisions": row[2]
-                    }
+                confidence_analysis = decision_rollups.confidence_by_type(conn, days_back=30)
 
                 # Recent decision trends
-                cursor = conn.execute("""
-                    SELECT DATE(created_at) as decision_date,
-                           COUNT(*) as decisions_count,
-                           AVG(confidence_score) as avg_confidence
-                    FROM pm_decision_log
-                    WHERE created_at >= datetime('now', '-7 days')
-                    GROUP BY DATE(created_at)
-                    ORDER BY decision_date DESC
-                """)
+                daily_trends = decision_rollups.daily_trends(conn, days_back=7)
 
-                daily_trends = []
-                for row in cursor.fetchall():
-                    daily_trends.append({
-                        "date": row[0],
-                        "decisions_count": row[1],
-                        "avg_confidence": round(row[2], 2)
-                    })
-
-                # Low confidence decisions for learning
+                # Low confidence decisions for learning (walks the confidence index)
                 cursor = conn.execute("""
                     SELECT decision_type, reasoning_process, confidence_score
                     FROM pm_decision_log
-                    WHERE confidence_score < 7
+                    WHERE confidence_score < ?
                     AND created_at >= datetime('now', '-30 days')
                     ORDER BY confidence_score ASC
                     LIMIT 10
-                """)
+                """, (decision_rollups.LOW_CONFIDENCE_THRESHOLD,))
 
                 low_confidence_decisions = []
                 for row in cursor.fetchall():
                     low_confidence_decisions.append({
                         "decision_type": row[0],
-                        "reasoning": row[1][:100] + "...",
+                        "reasoning": (row[1] or "")[:100] + "...",
                         "confidence": row[2]
                     })
 
@@ -395,6 +725,8 @@ class DecisionAnalytics:
         confidence_data = patterns.get("confidence_by_type", {})
         for decision_type, data in confidence_data.items():
             avg_conf = data["average_confidence"]
+            if avg_conf is None:
+                continue  # no scored decisions of this type
             if avg_conf < 7:
                 insights["improvement_opportunities"].append({
                     "area": decision_type,
@@ -419,21 +751,64 @@ class DecisionAnalytics:
 
         return insights
 
+    def similar_decisions(
+        self,
+        text: str,
+        decision_type: Optional[DecisionType] = None,
+        limit: int = 5,
+        min_similarity: float = 0.5
+    ) -> List[Dict[str, Any]]:
+        """Top similar prior decisions with their confidence and outcomes"""
+        return self.decision_capture.find_similar_decisions(text, decision_type, limit, min_similarity)
+
     def export_decision_data(self, format_type: str = "json") -> str:
-        """Export decision data for external analysis"""
+        """
+        Export the last 90 days of decision data as a string
+
+        Builds the whole export in memory; use export_decisions() to stream
+        large histories to a file.
+        """
+
+        if format_type == "csv":
+            out = io.StringIO()
+            writer = csv.writer(out, lineterminator="\n")
+            writer.writerow(["decision_type", "confidence_score", "created_at", "outcome"])
+            for decision in self.decision_capture.iter_decision_history(
+                days_back=90, columns=["decision_type", "confidence_score", "created_at", "outcome"]
+            ):
+                writer.writerow([
+                    decision["decision_type"], decision["confidence_score"],
+                    decision["created_at"], (decision["outcome"] or "")[:50]
+                ])
+            return out.getvalue().rstrip("\n")
 
         decisions = self.decision_capture.get_decision_history(days_back=90)
 
         if format_type == "json":
             return json.dumps(decisions, indent=2, default=str)
-        elif format_type == "csv":
-            # Simple CSV export (would need pandas for full implementation)
-            csv_lines = ["decision_type,confidence_score,created_at,outcome"]
-            for decision in decisions:
-                csv_lines.append(
-                    f"{decision['decision_type']},{decision['confidence_score']},"
-                    f"{decision['created_at']},{decision['outcome'][:50]}"
-                )
-            return "\n".join(csv_lines)
 
-        return str(decisions)
\ No newline at end of file
+        return str(decisions)
+
+    def export_decisions(
+        self,
+        destination: "decision_export.Destination",
+        format_type: str = "jsonl",
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        resume_token: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        compress: Optional[bool] = None,
+        include_archived: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Stream decisions as JSON Lines or CSV to a path or file object in constant memory
+
+        Returns:
+            {'rows', 'resume_token', 'complete'}; pass resume_token back to
+            continue after the last exported row
+        """
+        return decision_export.export_decisions(
+            self.decision_capture, destination, format_type,
+            since=since, until=until, resume_token=resume_token, max_rows=max_rows, compress=compress,
+            include_archived=include_archived
+        )
\ No newline at end of file
@@ -0,0 +1,160 @@
+"""
+BMAD Auto Decision Export
+Constant-memory JSON Lines / CSV export of pm_decision_log
+
+Rows stream from PMDecisionCapture.iter_decision_history in ascending
+(created_at, id) order straight into the destination, one keyset page in memory
+at a time. JSON columns are copied through as stored rather than decoded and
+re-encoded. CSV goes through the csv module, so commas, quotes and newlines in
+reasoning text are escaped properly.
+
+Every export returns a resume token naming the last row written. Passing it back
+continues after that row, appending to a path destination (a gzip destination
+gains a new gzip member, which readers treat as one stream).
+"""
+
+import base64
+import csv
+import gzip
+import io
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime
+from typing import IO, Any, Dict, Iterator, Optional, Tuple, Union
+
+EXPORT_FORMATS = ('jsonl', 'csv')
+EXPORT_COLUMNS = (
+    'id', 'created_at', 'decision_type', 'confidence_score', 'outcome',
+    'reasoning_process', 'learning_notes', 'decision_context', 'model_assignments'
+)
+JSON_EXPORT_COLUMNS = ('decision_context', 'model_assignments')
+
+Destination = Union[str, 'os.PathLike[str]', IO]
+
+
+def encode_resume_token(keyset: Tuple[Any, Any]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(keyset)).encode('utf-8')).decode('ascii')
+
+
+def decode_resume_token(token: str) -> Tuple[Any, Any]:
+    try:
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid resume token: {token!r}") from e
+    return created_at, row_id
+
+
+def export_decisions(
+    decision_capture,
+    destination: Destination,
+    format_type: str = 'jsonl',
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    resume_token: Optional[str] = None,
+    max_rows: Optional[int] = None,
+    compress: Optional[bool] = None,
+    page_size: int = 1000,
+    include_archived: bool = False
+) -> Dict[str, Any]:
+    """
+    Stream decisions to a path or file object
+
+    Args:
+        decision_capture: PMDecisionCapture to read from
+        destination: Path, or a text or binary file object
+        format_type: 'jsonl' or 'csv'
+        since, until: created_at range [since, until)
+        resume_token: Token from a previous export; continues after its last row
+        max_rows: Stop after this many rows (the result says whether more remain)
+        compress: gzip output; defaults to True for paths ending in .gz
+        include_archived: Also export decisions moved to archive partitions
+
+    Returns:
+        {'rows', 'resume_token', 'complete'}
+    """
+    if format_type not in EXPORT_FORMATS:
+        raise ValueError(f"format_type must be one of {EXPORT_FORMATS}, got {format_type!r}")
+    after = decode_resume_token(resume_token) if resume_token else None
+
+    records = decision_capture.iter_decision_history(
+        days_back=None,
+        columns=EXPORT_COLUMNS,
+        page_size=page_size,
+        since=since,
+        until=until,
+        after=after,
+        oldest_first=True,
+        include_archived=include_archived
+    )
+
+    rows, last_keyset, complete = 0, after, True
+    with _open_text(destination, compress, append=after is not None) as out:
+        if format_type == 'csv':
+            writer = csv.writer(out)
+            if after is None:
+                writer.writerow(EXPORT_COLUMNS)
+            write = lambda record: writer.writerow([record.raw(column) for column in EXPORT_COLUMNS])
+        else:
+            write = lambda record: out.write(_jsonl_line(record))
+
+        for record in records:
+            if max_rows is not None and rows >= max_rows:
+                complete = False
+                break
+            write(record)
+            rows += 1
+            last_keyset = record.keyset
+
+    return {
+        'rows': rows,
+        'resume_token': encode_resume_token(last_keyset) if last_keyset is not None else None,
+        'complete': complete
+    }
+
+
+def _jsonl_line(record) -> str:
+    # Scalars are encoded here; stored JSON columns are spliced in verbatim
+    fields = [
+        f'{json.dumps(column)}:{json.dumps(record.raw(column), ensure_ascii=False)}'
+        for column in EXPORT_COLUMNS if column not in JSON_EXPORT_COLUMNS
+    ]
+    fields.extend(
+        f'{json.dumps(column)}:{record.raw(column) or "null"}'
+        for column in JSON_EXPORT_COLUMNS
+    )
+    return '{' + ','.join(fields) + '}\n'
+
+
+@contextmanager
+def _open_text(destination: Destination, compress: Optional[bool], append: bool) -> Iterator[IO[str]]:
+    """Text stream over a path or file object, optionally gzip-compressed"""
+    if isinstance(destination, (str, os.PathLike)):
+        if compress is None:
+            compress = os.fspath(destination).endswith('.gz')
+        opener = gzip.open if compress else open
+        with opener(destination, 'at' if append else 'wt', encoding='utf-8', newline='') as out:
+            yield out
+        return
+
+    if compress:
+        if isinstance(destination, io.TextIOBase):
+            raise ValueError("gzip export needs a binary file object or a path")
+        # GzipFile leaves the caller's file object open
+        with gzip.GzipFile(fileobj=destination, mode='wb') as compressed:
+            out = io.TextIOWrapper(compressed, encoding='utf-8', newline='')
+            yield out
+            out.flush()
+            out.detach()
+        return
+
+    if isinstance(destination, io.TextIOBase):
+        yield destination
+        return
+
+    out = io.TextIOWrapper(destination, encoding='utf-8', newline='')
+    try:
+        yield out
+    finally:
+        out.flush()
+        out.detach()  # leave the caller's binary stream open
@@ -0,0 +1,224 @@
+"""
+BMAD Auto Decision Rollups
+Per-day, per-decision-type aggregates of pm_decision_log maintained by triggers
+
+analyze_decision_patterns used to aggregate pm_decision_log on every call,
+including a GROUP BY DATE(created_at) that no index can serve. Triggers now keep
+pm_decision_daily_rollup in step with every insert, update and delete, so the
+analytics read one row per day and type.
+
+Creating the rollup table on a database that already has history backfills it in
+the same transaction as the triggers, so no decision is missed or counted twice.
+backfill_rollups() rebuilds the table if it is ever suspected to have drifted
+(python -m intercept.maintenance rollups).
+
+The table and trigger definitions live in coordination_extensions.sql; this
+module runs them from there and reads the low-confidence threshold off them.
+
+Archiving decisions (intercept/retention.py) deletes them, which the delete
+trigger would subtract; the archiver adds their aggregates back in the same
+transaction with archived_rollups() and restore_rollups(), so the rollups keep
+covering archived history. backfill_rollups() therefore only rebuilds days that
+still have decisions in pm_decision_log, recounting the archived decisions of
+those days from their partitions; fully archived days keep their rows.
+"""
+
+import gzip
+import json
+import os
+import re
+import sqlite3
+from typing import Any, Dict, List, Sequence, Tuple
+
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), 'coordination_extensions.sql')
+
+
+def _schema_definitions() -> Tuple[str, str]:
+    """The rollup table and trigger definitions from coordination_extensions.sql"""
+    with open(SCHEMA_PATH, encoding='utf-8') as schema_file:
+        schema = schema_file.read()
+    table = re.search(r'CREATE TABLE IF NOT EXISTS pm_decision_daily_rollup\b[^;]*;', schema)
+    triggers = re.findall(r'CREATE TRIGGER IF NOT EXISTS trg_pm_decision_rollup_\w+\b.*?\bEND;', schema, re.DOTALL)
+    return table.group(0), '\n\n'.join(triggers)
+
+
+ROLLUP_TABLE_SQL, ROLLUP_TRIGGERS_SQL = _schema_definitions()
+
+# Scores below this count as low confidence; the triggers define it, the aggregates follow
+LOW_CONFIDENCE_THRESHOLD = int(re.search(r'NEW\.confidence_score < (\d+)', ROLLUP_TRIGGERS_SQL).group(1))
+
+_AGGREGATE_SQL = f'''
+    SELECT COALESCE(DATE(created_at), DATE('now')), decision_type, COUNT(*),
+           COALESCE(SUM(confidence_score), 0), COUNT(confidence_score),
+           COALESCE(SUM(confidence_score < {LOW_CONFIDENCE_THRESHOLD}), 0)
+    FROM {{table}}
+    WHERE {{where}}
+    GROUP BY 1, 2
+'''
+
+_HOT_DAYS_SQL = "SELECT DISTINCT COALESCE(DATE(created_at), DATE('now')) FROM pm_decision_log"
+
+BACKFILL_SQL = '''
+    INSERT INTO pm_decision_daily_rollup
+    (day, decision_type, decision_count, confidence_sum, confidence_count, low_confidence_count)
+''' + _AGGREGATE_SQL.format(table='pm_decision_log', where='1')
+
+_RESTORE_SQL = '''
+    INSERT INTO pm_decision_daily_rollup
+    (day, decision_type, decision_count, confidence_sum, confidence_count, low_confidence_count)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(day, decision_type) DO UPDATE SET
+        decision_count = decision_count + excluded.decision_count,
+        confidence_sum = confidence_sum + excluded.confidence_sum,
+        confidence_count = confidence_count + excluded.confidence_count,
+        low_confidence_count = low_confidence_count + excluded.low_confidence_count
+'''
+
+
+def ensure_rollups(conn: sqlite3.Connection) -> bool:
+    """
+    Create the rollup table and triggers, backfilling a new table from history
+
+    Runs its own IMMEDIATE transaction, so no insert can land between the
+    backfill and the triggers taking over.
+
+    Returns:
+        bool: True if the table was created (and backfilled) by this call
+    """
+    if _has_rollups(conn):
+        return False
+    if conn.in_transaction:
+        conn.commit()
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        created = not _has_rollups(conn)  # another process may have won the race
+        if created:
+            # A table left without its triggers may have missed rows: rebuild it
+            conn.execute(ROLLUP_TABLE_SQL)
+            conn.execute("DELETE FROM pm_decision_daily_rollup")
+            conn.execute(BACKFILL_SQL)
+            for statement in trigger_statements(ROLLUP_TRIGGERS_SQL):
+                conn.execute(statement)
+        conn.execute('COMMIT')
+        return created
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
+
+
+def backfill_rollups(conn: sqlite3.Connection) -> int:
+    """
+    Rebuild the rollup rows of every day still in pm_decision_log in one transaction
+
+    Days that were partly archived get their archived decisions counted back in
+    from the archive partitions; days archived entirely are left alone.
+
+    Returns:
+        int: Number of (day, decision_type) rollup rows written
+    """
+    ensure_rollups(conn)
+    if conn.in_transaction:
+        conn.commit()
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        conn.execute(f"DELETE FROM pm_decision_daily_rollup WHERE day IN ({_HOT_DAYS_SQL})")
+        written = conn.execute(BACKFILL_SQL).rowcount
+        restore_rollups(conn, _archived_rollups_of_hot_days(conn))
+        conn.execute('COMMIT')
+        return written
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
+
+
+def _archived_rollups_of_hot_days(conn: sqlite3.Connection) -> List[Tuple]:
+    """Rollup rows of the archived decisions on days that still have hot decisions"""
+    if not conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'archive_partitions'"
+    ).fetchone():
+        return []
+    paths = [path for path, in conn.execute(f"""
+        SELECT path FROM archive_partitions
+        WHERE table_name = 'pm_decision_log' AND day IN ({_HOT_DAYS_SQL})
+    """)]
+    if not paths:
+        return []
+
+    conn.execute(
+        "CREATE TEMP TABLE IF NOT EXISTS archived_decisions (created_at TEXT, decision_type TEXT, confidence_score INTEGER)"
+    )
+    try:
+        for path in paths:
+            with gzip.open(path, 'rt', encoding='utf-8') as lines:
+                conn.executemany(
+                    "INSERT INTO archived_decisions VALUES (?, ?, ?)",
+                    ((row['created_at'], row['decision_type'], row['confidence_score'])
+                     for row in map(json.loads, lines))
+                )
+        return conn.execute(_AGGREGATE_SQL.format(table='archived_decisions', where='1')).fetchall()
+    finally:
+        conn.execute("DROP TABLE archived_decisions")
+
+
+def archived_rollups(conn: sqlite3.Connection, where: str, params: Sequence[Any]) -> List[Tuple]:
+    """Rollup rows for the decisions matching where, read before they are deleted"""
+    if not _has_rollups(conn):
+        return []
+    return conn.execute(_AGGREGATE_SQL.format(table='pm_decision_log', where=where), params).fetchall()
+
+
+def restore_rollups(conn: sqlite3.Connection, rows: Sequence[Tuple]) -> None:
+    """Add rollup rows back after their decisions were deleted"""
+    conn.executemany(_RESTORE_SQL, rows)
+
+
+def confidence_by_type(conn: sqlite3.Connection, days_back: int) -> Dict[str, Dict[str, Any]]:
+    """Decision count, average confidence and low-confidence count per type"""
+    rows = conn.execute('''
+        SELECT decision_type, SUM(decision_count), SUM(confidence_sum), SUM(confidence_count),
+               SUM(low_confidence_count)
+        FROM pm_decision_daily_rollup
+        WHERE day >= DATE('now', ?)
+        GROUP BY decision_type
+    ''', (f'-{days_back} days',)).fetchall()
+    return {
+        decision_type: {
+            "average_confidence": round(total / scored, 2) if scored else None,
+            "total_decisions": count,
+            "low_confidence_decisions": low
+        }
+        for decision_type, count, total, scored, low in rows
+    }
+
+
+def daily_trends(conn: sqlite3.Connection, days_back: int) -> List[Dict[str, Any]]:
+    """Decisions and average confidence per day, newest first"""
+    rows = conn.execute('''
+        SELECT day, SUM(decision_count), SUM(confidence_sum), SUM(confidence_count)
+        FROM pm_decision_daily_rollup
+        WHERE day >= DATE('now', ?)
+        GROUP BY day
+        ORDER BY day DESC
+    ''', (f'-{days_back} days',)).fetchall()
+    return [
+        {
+            "date": day,
+            "decisions_count": count,
+            "avg_confidence": round(total / scored, 2) if scored else None
+        }
+        for day, count, total, scored in rows
+    ]
+
+
+def _has_rollups(conn: sqlite3.Connection) -> bool:
+    names = {row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE name IN ('pm_decision_daily_rollup', 'trg_pm_decision_rollup_insert',"
+        " 'trg_pm_decision_rollup_delete', 'trg_pm_decision_rollup_update')"
+    )}
+    return len(names) == 4
+
+
+def trigger_statements(script: str) -> List[str]:
+    """Split a CREATE TRIGGER script for execute() inside an open transaction"""
+    # Trigger bodies contain semicolons; split on the END that closes each one
+    return [part.strip() + ' END' for part in script.split('END;') if part.strip()]
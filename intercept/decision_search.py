@@ -0,0 +1,197 @@
+"""
+BMAD Auto Decision Search
+FTS5 full-text index over PM decision reasoning
+
+decision_search is an external-content FTS5 table over the reasoning_process,
+outcome and learning_notes columns of pm_decision_log: the index stores only
+tokens, the text itself stays in pm_decision_log. Insert, update and delete
+triggers keep the index in step. Results are ranked with bm25 (outcome matches
+weigh double) and carry a highlighted snippet.
+
+Creating the index on a database with history populates it in the same
+transaction as the triggers. rebuild_search_index() re-derives it from
+pm_decision_log and optimize_search_index() merges its b-trees after large
+imports or deletes (python -m intercept.maintenance search-index).
+
+SQLite builds without FTS5 skip the index; search then falls back to an
+unranked LIKE scan.
+"""
+
+import re
+import sqlite3
+from typing import Any, Dict, List, Optional
+
+from .decision_rollups import trigger_statements
+
+SEARCH_COLUMNS = ('reasoning_process', 'outcome', 'learning_notes')
+SEARCH_WEIGHTS = (1.0, 2.0, 1.0)  # bm25 weight per column, in SEARCH_COLUMNS order
+
+SEARCH_TABLE_SQL = '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS decision_search USING fts5(
+        reasoning_process, outcome, learning_notes,
+        content='pm_decision_log', content_rowid='id'
+    )
+'''
+
+SEARCH_TRIGGERS_SQL = '''
+    CREATE TRIGGER IF NOT EXISTS trg_pm_decision_search_insert
+    AFTER INSERT ON pm_decision_log
+    BEGIN
+        INSERT INTO decision_search (rowid, reasoning_process, outcome, learning_notes)
+        VALUES (NEW.id, NEW.reasoning_process, NEW.outcome, NEW.learning_notes);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_pm_decision_search_delete
+    AFTER DELETE ON pm_decision_log
+    BEGIN
+        INSERT INTO decision_search (decision_search, rowid, reasoning_process, outcome, learning_notes)
+        VALUES ('delete', OLD.id, OLD.reasoning_process, OLD.outcome, OLD.learning_notes);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_pm_decision_search_update
+    AFTER UPDATE OF reasoning_process, outcome, learning_notes ON pm_decision_log
+    BEGIN
+        INSERT INTO decision_search (decision_search, rowid, reasoning_process, outcome, learning_notes)
+        VALUES ('delete', OLD.id, OLD.reasoning_process, OLD.outcome, OLD.learning_notes);
+        INSERT INTO decision_search (rowid, reasoning_process, outcome, learning_notes)
+        VALUES (NEW.id, NEW.reasoning_process, NEW.outcome, NEW.learning_notes);
+    END;
+'''
+
+_TRIGGER_NAMES = ('trg_pm_decision_search_insert', 'trg_pm_decision_search_delete', 'trg_pm_decision_search_update')
+
+
+def fts5_available(conn: sqlite3.Connection) -> bool:
+    return bool(conn.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')").fetchone()[0])
+
+
+def ensure_search_index(conn: sqlite3.Connection) -> bool:
+    """
+    Create the FTS5 index and its triggers, populating a new index from history
+
+    Returns:
+        bool: True if the index was created (and populated) by this call
+    """
+    if _has_search_index(conn) or not fts5_available(conn):
+        return False
+    if conn.in_transaction:
+        conn.commit()
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        created = not _has_search_index(conn)
+        if created:
+            conn.execute(SEARCH_TABLE_SQL)
+            conn.execute("INSERT INTO decision_search (decision_search) VALUES ('rebuild')")
+            for statement in trigger_statements(SEARCH_TRIGGERS_SQL):
+                conn.execute(statement)
+        conn.execute('COMMIT')
+        return created
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
+
+
+def rebuild_search_index(conn: sqlite3.Connection) -> int:
+    """
+    Re-derive the index from pm_decision_log
+
+    Returns:
+        int: Number of decisions indexed
+
+    Raises:
+        RuntimeError: SQLite was built without FTS5
+    """
+    if not ensure_search_index(conn):
+        if not _has_search_index(conn):
+            raise RuntimeError("SQLite was built without FTS5; decision search uses LIKE scans")
+        with conn:
+            conn.execute("INSERT INTO decision_search (decision_search) VALUES ('rebuild')")
+    return conn.execute("SELECT COUNT(*) FROM pm_decision_log").fetchone()[0]
+
+
+def optimize_search_index(conn: sqlite3.Connection) -> None:
+    """Merge the index b-trees into one for the fastest queries"""
+    if _has_search_index(conn):
+        with conn:
+            conn.execute("INSERT INTO decision_search (decision_search) VALUES ('optimize')")
+
+
+def search(
+    conn: sqlite3.Connection,
+    query: str,
+    decision_type: Optional[str] = None,
+    limit: int = 20
+) -> List[Dict[str, Any]]:
+    """
+    Best matches for an FTS5 query, most relevant first
+
+    Plain text works as-is (all terms must match); FTS5 syntax such as
+    "exact phrase", OR, NOT and prefix* is honoured. Text that is not valid
+    FTS5 syntax is searched as quoted terms instead of raising.
+    """
+    if not _has_search_index(conn):
+        return _search_like(conn, query, decision_type, limit)
+    try:
+        return _search_fts(conn, query, decision_type, limit)
+    except sqlite3.OperationalError:
+        # e.g. "fts5: syntax error" or "no such column" for text like "ratio: 3/4"
+        return _search_fts(conn, _quote_terms(query), decision_type, limit)
+
+
+def _search_fts(conn: sqlite3.Connection, query: str, decision_type: Optional[str], limit: int) -> List[Dict[str, Any]]:
+    weights = ', '.join(str(weight) for weight in SEARCH_WEIGHTS)
+    type_clause = "AND d.decision_type = ?" if decision_type else ""
+    params: List[Any] = [query] + ([decision_type] if decision_type else []) + [limit]
+    rows = conn.execute(f'''
+        SELECT d.id, d.decision_type, d.created_at, d.confidence_score, d.outcome,
+               snippet(decision_search, -1, '[', ']', '...', 12), bm25(decision_search, {weights}) AS score
+        FROM decision_search
+        JOIN pm_decision_log d ON d.id = decision_search.rowid
+        WHERE decision_search MATCH ? {type_clause}
+        ORDER BY score
+        LIMIT ?
+    ''', params).fetchall()
+    return [_result(row) for row in rows]
+
+
+def _search_like(conn: sqlite3.Connection, query: str, decision_type: Optional[str], limit: int) -> List[Dict[str, Any]]:
+    terms = re.findall(r'\w+', query) or [query]
+    clauses, params = [], []
+    for term in terms:
+        clauses.append('(' + ' OR '.join(f"{column} LIKE ?" for column in SEARCH_COLUMNS) + ')')
+        params.extend([f'%{term}%'] * len(SEARCH_COLUMNS))
+    if decision_type:
+        clauses.append("decision_type = ?")
+        params.append(decision_type)
+    rows = conn.execute(f'''
+        SELECT id, decision_type, created_at, confidence_score, outcome, substr(reasoning_process, 1, 120), NULL
+        FROM pm_decision_log
+        WHERE {' AND '.join(clauses)}
+        ORDER BY created_at DESC
+        LIMIT ?
+    ''', params + [limit]).fetchall()
+    return [_result(row) for row in rows]
+
+
+def _result(row) -> Dict[str, Any]:
+    decision_id, decision_type, created_at, confidence_score, outcome, snippet, score = row
+    return {
+        'id': decision_id,
+        'decision_type': decision_type,
+        'created_at': created_at,
+        'confidence_score': confidence_score,
+        'outcome': outcome,
+        'snippet': snippet,
+        'score': score
+    }
+
+
+def _quote_terms(query: str) -> str:
+    return ' '.join('"{}"'.format(term.replace('"', '""')) for term in query.split()) or '""'
+
+
+def _has_search_index(conn: sqlite3.Connection) -> bool:
+    names = {row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE name IN ('decision_search', ?, ?, ?)", _TRIGGER_NAMES
+    )}
+    return len(names) == 4
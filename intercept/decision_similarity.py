@@ -0,0 +1,279 @@
+"""
+BMAD Auto Decision Similarity Index
+MinHash/LSH lookup of past PM decisions with near-duplicate context
+
+Each decision is reduced to a set of shingles (words and adjacent word pairs of
+its user prompt, or of its reasoning when the context has no prompt) and a
+64-value MinHash signature whose agreement with another signature estimates the
+Jaccard similarity of the two shingle sets. Signatures are split into 16 bands
+of 4; decisions sharing any band land in the same bucket and become candidates.
+Pairs at similarity 0.8 collide with probability > 0.999, pairs at 0.3 about
+12% of the time, so the index is meant for near-duplicates, not loose matches.
+
+Signatures persist in decision_minhash, so a restart rebuilds the in-memory
+buckets without re-hashing history. The index is incremental: each lookup first
+indexes decisions with ids above the last one seen, which is one primary-key
+range probe when nothing is new. New signatures are written back in batches.
+Deleted decisions drop their signature by trigger and are filtered out of results.
+"""
+
+import hashlib
+import json
+import operator
+import re
+import sqlite3
+import struct
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from .decision_rollups import trigger_statements
+from .payload_store import load_payload
+
+NUM_PERM = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+PERSIST_BATCH = 256  # signatures buffered before they are written back
+
+_SIGNATURE = struct.Struct(f'<{NUM_PERM}I')
+_BAND_BYTES = ROWS_PER_BAND * 4
+
+SIMILARITY_TABLE_SQL = '''
+    CREATE TABLE IF NOT EXISTS decision_minhash (
+        decision_id INTEGER PRIMARY KEY,
+        decision_type TEXT NOT NULL,
+        signature BLOB NOT NULL
+    )
+'''
+
+SIMILARITY_TRIGGERS_SQL = '''
+    CREATE TRIGGER IF NOT EXISTS trg_pm_decision_minhash_delete
+    AFTER DELETE ON pm_decision_log
+    BEGIN
+        DELETE FROM decision_minhash WHERE decision_id = OLD.id;
+    END;
+'''
+
+# Coordinator decisions carry the prompt in their context; others fall back to reasoning
+_SOURCE_TEXT_SQL = '''
+    SELECT id, decision_type,
+           COALESCE(CASE WHEN json_valid(decision_context)
+                         THEN json_extract(decision_context, '$.user_prompt') END,
+                    reasoning_process, '')
+    FROM pm_decision_log
+    WHERE id > ?
+    ORDER BY id
+'''
+
+
+def shingles(text: str) -> Set[str]:
+    """Lower-cased words and adjacent word pairs"""
+    words = re.findall(r'\w+', text.lower())
+    return set(words).union(f'{a} {b}' for a, b in zip(words, words[1:]))
+
+
+def minhash_signature(text: str) -> Optional[bytes]:
+    """Packed MinHash signature of text, or None when it has no words"""
+    shingle_set = shingles(text)
+    if not shingle_set:
+        return None
+    # shake_128 yields NUM_PERM independent 32-bit hashes per shingle in one call
+    hashes = [
+        _SIGNATURE.unpack(hashlib.shake_128(shingle.encode('utf-8')).digest(_SIGNATURE.size))
+        for shingle in shingle_set
+    ]
+    return _SIGNATURE.pack(*map(min, zip(*hashes)))
+
+
+def estimate_similarity(signature: bytes, other: bytes) -> float:
+    """Estimated Jaccard similarity: the fraction of agreeing MinHash values"""
+    return sum(map(operator.eq, _SIGNATURE.unpack(signature), _SIGNATURE.unpack(other))) / NUM_PERM
+
+
+def ensure_similarity_schema(conn: sqlite3.Connection) -> None:
+    conn.execute(SIMILARITY_TABLE_SQL)
+    for statement in trigger_statements(SIMILARITY_TRIGGERS_SQL):
+        conn.execute(statement)
+
+
+class DecisionSimilarityIndex:
+    """
+    In-memory LSH buckets over persisted decision signatures
+
+    Thread-safe; holds one SQLite connection so a lookup stays well under a
+    millisecond once history is loaded.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._signatures: Dict[int, bytes] = {}
+        self._types: Dict[int, str] = {}
+        self._buckets: List[Dict[bytes, List[int]]] = [defaultdict(list) for _ in range(BANDS)]
+        self._last_id = 0
+        self._unsaved: List[Tuple[int, str, bytes]] = []
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def close(self) -> None:
+        """Write back buffered signatures and release the connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._save()
+                self._conn.close()
+                self._conn = None
+
+    def refresh(self) -> int:
+        """
+        Index decisions added since the last call
+
+        Returns:
+            int: Number of decisions newly indexed
+        """
+        with self._lock:
+            return self._refresh()
+
+    def rebuild(self) -> int:
+        """Discard stored signatures and re-hash every decision"""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM decision_minhash")
+            self._signatures.clear()
+            self._types.clear()
+            self._buckets = [defaultdict(list) for _ in range(BANDS)]
+            self._last_id = 0
+            self._unsaved.clear()
+            indexed = self._refresh()
+            self._save()
+            return indexed
+
+    def similar(
+        self,
+        text: str,
+        limit: int = 5,
+        min_similarity: float = 0.5,
+        decision_type: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Indexed decisions most similar to text, best first
+
+        Returns:
+            Dicts with id, decision_type, created_at, confidence_score, outcome,
+            decision_context (decoded) and similarity (estimated Jaccard, 0-1)
+        """
+        signature = minhash_signature(text)
+        if signature is None:
+            return []
+        with self._lock:
+            self._refresh()
+            candidates: Set[int] = set()
+            for band, buckets in enumerate(self._buckets):
+                bucket = buckets.get(_band_key(signature, band))
+                if bucket:
+                    candidates.update(bucket)
+            scored = [
+                (estimate_similarity(signature, self._signatures[decision_id]), decision_id)
+                for decision_id in candidates
+                if decision_id in self._signatures
+                and (decision_type is None or self._types[decision_id] == decision_type)
+            ]
+            ranked = sorted((entry for entry in scored if entry[0] >= min_similarity), reverse=True)
+            results: List[Dict[str, Any]] = []
+            # Decisions deleted since they were indexed drop out of a page: read on until limit are found
+            start = 0
+            while len(results) < limit and start < len(ranked):
+                page = ranked[start:start + limit - len(results)]
+                results.extend(self._results(page))
+                start += len(page)
+            return results
+
+    def payload(self, payload_hash: str) -> Optional[Any]:
+        """Stored payload a matched decision references, read on the index's connection"""
+        with self._lock:
+            return load_payload(self._connection(), payload_hash)
+
+    def _results(self, best: Sequence[Tuple[float, int]]) -> List[Dict[str, Any]]:
+        if not best:
+            return []
+        similarity = {decision_id: score for score, decision_id in best}
+        rows = self._connection().execute(f'''
+            SELECT id, decision_type, created_at, confidence_score, outcome, decision_context
+            FROM pm_decision_log
+            WHERE id IN ({', '.join('?' * len(similarity))})
+        ''', list(similarity)).fetchall()
+        results = [
+            {
+                'id': decision_id,
+                'decision_type': decision_type,
+                'created_at': created_at,
+                'confidence_score': confidence_score,
+                'outcome': outcome,
+                'decision_context': json.loads(decision_context) if decision_context else {},
+                'similarity': similarity[decision_id]
+            }
+            for decision_id, decision_type, created_at, confidence_score, outcome, decision_context in rows
+        ]
+        # Decisions deleted since they were indexed are missing from rows: stop scoring them
+        for decision_id in similarity.keys() - {result['id'] for result in results}:
+            self._signatures.pop(decision_id, None)
+            self._types.pop(decision_id, None)
+        results.sort(key=lambda result: (-result['similarity'], -result['id']))
+        return results
+
+    def _refresh(self) -> int:
+        conn = self._connection()
+        latest = conn.execute("SELECT MAX(id) FROM pm_decision_log").fetchone()[0] or 0
+        if latest <= self._last_id:
+            return 0
+
+        # Signatures another process (or an earlier run) already computed
+        stored = conn.execute(
+            "SELECT decision_id, decision_type, signature FROM decision_minhash WHERE decision_id > ? ORDER BY decision_id",
+            (self._last_id,)
+        ).fetchall()
+        for decision_id, decision_type, signature in stored:
+            self._add(decision_id, decision_type, signature)
+
+        hashed = 0
+        for decision_id, decision_type, text in conn.execute(_SOURCE_TEXT_SQL, (self._last_id,)).fetchall():
+            signature = minhash_signature(text)
+            if signature is not None:
+                self._add(decision_id, decision_type, signature)
+                self._unsaved.append((decision_id, decision_type, signature))
+                hashed += 1
+            self._last_id = decision_id
+        if len(self._unsaved) >= PERSIST_BATCH:
+            self._save()
+        return len(stored) + hashed
+
+    def _add(self, decision_id: int, decision_type: str, signature: bytes) -> None:
+        self._signatures[decision_id] = signature
+        self._types[decision_id] = decision_type
+        for band, buckets in enumerate(self._buckets):
+            buckets[_band_key(signature, band)].append(decision_id)
+        self._last_id = max(self._last_id, decision_id)
+
+    def _save(self) -> None:
+        if not self._unsaved:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO decision_minhash (decision_id, decision_type, signature)"
+                " SELECT ?1, ?2, ?3 WHERE EXISTS (SELECT 1 FROM pm_decision_log WHERE id = ?1)",
+                self._unsaved
+            )
+        self._unsaved.clear()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            with self._conn:
+                ensure_similarity_schema(self._conn)
+        return self._conn
+
+
+def _band_key(signature: bytes, band: int) -> bytes:
+    return signature[band * _BAND_BYTES:(band + 1) * _BAND_BYTES]
@@ -0,0 +1,196 @@
+"""
+BMAD Auto Dependency Resolver
+Memoized transitive closure of the .bmad-core resources an agent or team needs
+
+The graph has three kinds of edges:
+    team     -> its agents ("*" expands to every agent) and workflows
+    agent    -> the tasks, templates, checklists, data and utils it lists
+                (read from the loader's parsed AgentDefinition)
+    resource -> resources it cites by path, e.g. .bmad-core/templates/story-tmpl.yaml
+                or {root}/tasks/execute-checklist (extension optional)
+
+Nodes are parsed once and memoized by stat key. Each closure is memoized with
+the stat key of every file it covers, including missing files and, for "*"
+teams, the agents directory. A repeat lookup therefore costs one stat() per
+member and no reads. Any change to a member (edited, created, deleted, or an
+agent added to a "*" team) rebuilds only that closure. Unchanged nodes are
+reused when it is rebuilt.
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+from .agent_loader import AgentExtensionLoader, AgentLoadError, CacheStats, StatKey, stat_key
+
+RESOURCE_TYPES = ('tasks', 'templates', 'checklists', 'data', 'utils', 'workflows', 'agents')
+
+_REFERENCE = re.compile(
+    r'(?:\{root\}|\.?bmad-core)/(' + '|'.join(RESOURCE_TYPES) + r')/([A-Za-z0-9_.-]*[A-Za-z0-9_-])'
+)
+_EXTENSIONS = ('', '.md', '.yaml', '.yml')
+
+
+@dataclass(frozen=True)
+class DependencyClosure:
+    """Every resource an agent or team needs, for prefetching"""
+    name: str
+    kind: str  # 'agent' or 'team'
+    paths: Tuple[str, ...]  # existing resource files, sorted
+    total_bytes: int
+    missing: Tuple[str, ...]  # referenced but not present
+
+
+@dataclass(frozen=True)
+class _Node:
+    key: StatKey
+    edges: Tuple[str, ...]
+    missing: Tuple[str, ...]
+    # Other paths whose change invalidates the node: the agents directory of a
+    # "*" team, every candidate file name of a missing reference
+    extra_keys: Tuple[Tuple[str, StatKey], ...] = ()
+
+
+class DependencyResolver:
+    """
+    Dependency graph over one .bmad-core tree
+
+    Thread-safe. Agent nodes go through the loader, so a modified .bmad-core
+    agent raises BMadCorePreservationError here as it does on load.
+    """
+
+    def __init__(self, loader: AgentExtensionLoader):
+        self.loader = loader
+        self.core_path = loader.bmad_core_path
+        self._lock = threading.Lock()
+        self._nodes: Dict[str, _Node] = {}
+        self._closures: Dict[Tuple[str, str], Tuple[DependencyClosure, Tuple[Tuple[str, StatKey], ...]]] = {}
+        self._stats = {name: CacheStats() for name in ('closure', 'node')}
+
+    def resolve_agent(self, agent_name: str) -> DependencyClosure:
+        """Agent file plus everything it transitively depends on"""
+        return self._resolve('agent', agent_name, self.core_path / "agents" / f"{agent_name}.md")
+
+    def resolve_team(self, team_name: str) -> DependencyClosure:
+        """Team file, its agents and workflows, and everything they depend on"""
+        return self._resolve('team', team_name, self.core_path / "agent-teams" / f"{team_name}.yaml")
+
+    def teams(self) -> List[str]:
+        """Names of all .bmad-core agent teams"""
+        return sorted(path.stem for path in (self.core_path / "agent-teams").glob("*.yaml"))
+
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hits, misses and hit rate of the closure and node caches"""
+        return {name: stats.as_dict() for name, stats in self._stats.items()}
+
+    def invalidate(self) -> None:
+        """Forget every node and closure"""
+        with self._lock:
+            self._nodes.clear()
+            self._closures.clear()
+
+    def _resolve(self, kind: str, name: str, root: Path) -> DependencyClosure:
+        with self._lock:
+            cached = self._closures.get((kind, name))
+            if cached is not None and all(stat_key(Path(path)) == key for path, key in cached[1]):
+                self._stats['closure'].hits += 1
+                return cached[0]
+            self._stats['closure'].misses += 1
+
+            root_path = root.as_posix()
+            if stat_key(root) is None:
+                raise AgentLoadError(f"No {kind} definition: {root_path}")
+
+            seen: Set[str] = set()
+            stack = [root_path]
+            members: Dict[str, StatKey] = {}
+            missing: Set[str] = set()
+            while stack:
+                path = stack.pop()
+                if path in seen:
+                    continue
+                seen.add(path)
+                node = self._node(path, is_team=kind == 'team' and path == root_path)
+                members[path] = node.key
+                members.update(node.extra_keys)
+                if node.key is None:
+                    missing.add(path)
+                    continue
+                missing.update(node.missing)
+                stack.extend(edge for edge in node.edges if edge not in seen)
+
+            files = sorted(path for path in seen if members.get(path) is not None)
+            closure = DependencyClosure(
+                name=name,
+                kind=kind,
+                paths=tuple(files),
+                total_bytes=sum(members[path][2] for path in files),
+                missing=tuple(sorted(missing))
+            )
+            self._closures[(kind, name)] = (closure, tuple(members.items()))
+            return closure
+
+    def _node(self, path: str, is_team: bool = False) -> _Node:
+        key = stat_key(Path(path))
+        node = self._nodes.get(path)
+        if (node is not None and node.key == key
+                and all(stat_key(Path(extra)) == extra_key for extra, extra_key in node.extra_keys)):
+            self._stats['node'].hits += 1
+            return node
+        self._stats['node'].misses += 1
+
+        if key is None:
+            node = _Node(key=None, edges=(), missing=())
+        elif is_team:
+            node = self._team_node(Path(path), key)
+        elif Path(path).parent == self.core_path / "agents":
+            node = self._agent_node(Path(path).stem, key)
+        else:
+            node = self._resource_node(Path(path), key)
+        self._nodes[path] = node
+        return node
+
+    def _agent_node(self, agent_name: str, key: StatKey) -> _Node:
+        # Only the declared dependencies: agent text quotes example paths
+        definition = self.loader.agent_definition(agent_name)
+        edges = [
+            (self.core_path / dependency_type / file_name).as_posix()
+            for dependency_type, files in definition.dependencies.items()
+            for file_name in files
+        ]
+        return _Node(key=key, edges=tuple(edges), missing=())
+
+    def _team_node(self, team_file: Path, key: StatKey) -> _Node:
+        import yaml  # deferred, as in agent_loader
+
+        with open(team_file, 'r', encoding='utf-8') as f:
+            team = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader)) or {}
+
+        agents_dir = self.core_path / "agents"
+        agents = [str(agent) for agent in team.get('agents') or ()]
+        extra_keys = ()
+        if '*' in agents:
+            agents = [agent for agent in agents if agent != '*'] + self.loader.discover_agents()
+            extra_keys = ((agents_dir.as_posix(), stat_key(agents_dir)),)
+        edges = [(agents_dir / f"{agent}.md").as_posix() for agent in dict.fromkeys(agents)]
+        edges += [(self.core_path / "workflows" / str(workflow)).as_posix() for workflow in team.get('workflows') or ()]
+        return _Node(key=key, edges=tuple(edges), missing=(), extra_keys=extra_keys)
+
+    def _resource_node(self, path: Path, key: StatKey) -> _Node:
+        try:
+            text = path.read_text(encoding='utf-8')
+        except UnicodeDecodeError:
+            return _Node(key=key, edges=(), missing=())
+
+        edges, missing, extra_keys = [], [], []
+        for resource_type, name in dict.fromkeys(_REFERENCE.findall(text)):
+            candidates = [(self.core_path / resource_type / f"{name}{extension}").as_posix() for extension in _EXTENSIONS]
+            resolved = next((candidate for candidate in candidates if Path(candidate).is_file()), None)
+            if resolved is None:
+                missing.append(candidates[0])
+                extra_keys.extend((candidate, None) for candidate in candidates)  # resolve once one appears
+            elif resolved != path.as_posix():
+                edges.append(resolved)
+        return _Node(key=key, edges=tuple(edges), missing=tuple(missing), extra_keys=tuple(extra_keys))
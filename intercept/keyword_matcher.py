@@ -0,0 +1,152 @@
+"""
+BMAD Auto Task Keyword Matcher
+Compiled, config-driven keyword matching for PM task analysis
+
+Keyword tables live in task_keywords.yaml. They are compiled into one matching
+plan shared by capability extraction and complexity analysis:
+- every distinct keyword is scanned at most once per text (C-level substring search)
+- a keyword is skipped when a shorter keyword it contains is already absent
+- hits for long texts are memoized, and a text ending in a memoized text only
+  scans its new prefix (subtask descriptions embed the full user prompt)
+
+The plan is cached and recompiled only when the config file's stat changes.
+Results are identical to per-table `any(word in text ...)` scans.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import yaml
+
+
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'task_keywords.yaml')
+
+
+@dataclass(frozen=True)
+class _KeywordPlan:
+    """Compiled keyword tables"""
+    fingerprint: Tuple[int, int]
+    independent: Tuple[str, ...]
+    dependent: Tuple[Tuple[str, str], ...]  # (keyword, longest keyword it contains)
+    capability_table: Tuple[Tuple[str, FrozenSet[str]], ...]
+    complexity_keywords: FrozenSet[str]
+    default_capability: Optional[str]
+    keyword_chars: FrozenSet[str]
+
+
+class TaskKeywordMatcher:
+    """Single-plan keyword matcher for capability and complexity analysis"""
+
+    LONG_TEXT = 512  # texts at least this long are memoized for suffix reuse
+    MEMO_SIZE = 32
+
+    def __init__(self, config_path: str = DEFAULT_CONFIG_PATH):
+        self.config_path = config_path
+        self._plan: Optional[_KeywordPlan] = None
+        self._memo: "OrderedDict[str, FrozenSet[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def capabilities(self, text: str) -> List[str]:
+        """Capabilities whose keywords appear in text, in config order"""
+        plan = self._current_plan()
+        hits = self._hits(plan, text)
+        matched = [capability for capability, keywords in plan.capability_table if hits & keywords]
+        if not matched and plan.default_capability:
+            matched.append(plan.default_capability)
+        return matched
+
+    def complexity_score(self, text: str) -> int:
+        """Number of distinct complexity keywords appearing in text"""
+        plan = self._current_plan()
+        return len(self._hits(plan, text) & plan.complexity_keywords)
+
+    def hits(self, text: str) -> FrozenSet[str]:
+        """All configured keywords appearing in text"""
+        return self._hits(self._current_plan(), text)
+
+    # Matching
+
+    def _hits(self, plan: _KeywordPlan, text: str) -> FrozenSet[str]:
+        # The memo is shared by every thread: look up under the lock, scan outside it
+        with self._lock:
+            cached = self._memo.get(text)
+            if cached is not None:
+                return cached
+
+            split, suffix_hits = len(text), frozenset()
+            for memo_text, memo_hits in reversed(self._memo.items()):
+                boundary = len(text) - len(memo_text)
+                # Reuse a memoized suffix when no keyword can span the boundary
+                if boundary > 0 and text.endswith(memo_text) and text[boundary - 1].lower() not in plan.keyword_chars:
+                    split, suffix_hits = boundary, memo_hits
+                    break
+
+        hits = suffix_hits | self._scan(plan, text[:split].lower())
+
+        if len(text) >= self.LONG_TEXT:
+            with self._lock:
+                if self._plan is plan:  # not stale after a concurrent recompile
+                    self._memo[text] = hits
+                    while len(self._memo) > self.MEMO_SIZE:
+                        self._memo.popitem(last=False)
+        return hits
+
+    @staticmethod
+    def _scan(plan: _KeywordPlan, lowered: str) -> FrozenSet[str]:
+        found = {keyword for keyword in plan.independent if keyword in lowered}
+        for keyword, inner in plan.dependent:
+            if inner in found and keyword in lowered:
+                found.add(keyword)
+        return frozenset(found)
+
+    # Compilation
+
+    def _current_plan(self) -> _KeywordPlan:
+        stat = os.stat(self.config_path)
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+        plan = self._plan
+        if plan is None or plan.fingerprint != fingerprint:
+            with self._lock:
+                if self._plan is None or self._plan.fingerprint != fingerprint:
+                    self._plan = self._compile(fingerprint)
+                    self._memo.clear()
+                plan = self._plan
+        return plan
+
+    def _compile(self, fingerprint: Tuple[int, int]) -> _KeywordPlan:
+        with open(self.config_path, 'r') as f:
+            config = yaml.safe_load(f) or {}
+
+        capability_keywords: Dict[str, List[str]] = config.get('capability_keywords', {})
+        complexity_keywords = [k.lower() for k in config.get('complexity_keywords', [])]
+        capability_table = tuple(
+            (capability, frozenset(k.lower() for k in keywords))
+            for capability, keywords in capability_keywords.items()
+        )
+
+        keywords = set(complexity_keywords)
+        for _, table_keywords in capability_table:
+            keywords |= table_keywords
+
+        # A keyword containing another is only searched when the shorter one was found;
+        # shorter keywords come first so their result is known in time
+        independent, dependent = [], []
+        for keyword in sorted(keywords, key=lambda k: (len(k), k)):
+            contained = [inner for inner in keywords if inner != keyword and inner in keyword]
+            if contained:
+                dependent.append((keyword, max(contained, key=len)))
+            else:
+                independent.append(keyword)
+
+        return _KeywordPlan(
+            fingerprint=fingerprint,
+            independent=tuple(independent),
+            dependent=tuple(dependent),
+            capability_table=capability_table,
+            complexity_keywords=frozenset(complexity_keywords),
+            default_capability=config.get('default_capability'),
+            keyword_chars=frozenset(''.join(keywords))
+        )
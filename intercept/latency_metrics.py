@@ -0,0 +1,295 @@
+"""
+BMAD Auto Latency Metrics
+Per-step timing spans and in-process latency histograms for PMCoordinator
+
+Each pipeline step runs inside `with metrics.span('step'):`. Durations go into a
+log-bucketed histogram per step (16 buckets per power of two, so percentiles are
+within ~4.5% of the true value) with exact count, sum, min and max. Memory stays
+bounded no matter how many samples are recorded.
+
+When the recorder is disabled span() returns one shared no-op context manager,
+so an instrumented step costs a method call and an empty `with` block.
+
+With a flush interval, a background thread writes the samples recorded since the
+previous flush to pm_step_metrics, one row per step and window. Samples go into
+a cumulative histogram for stats() and into the open window; flush() swaps the
+window out under the lock, so reset() never discards samples not yet written.
+"""
+
+import math
+import sqlite3
+import threading
+import time
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+METRICS_SCHEMA_SQL = '''
+    CREATE TABLE IF NOT EXISTS pm_step_metrics (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        step TEXT NOT NULL,
+        window_start DATETIME NOT NULL,
+        window_end DATETIME NOT NULL,
+        count INTEGER NOT NULL,
+        total_ms REAL NOT NULL,
+        p50_ms REAL,
+        p95_ms REAL,
+        p99_ms REAL,
+        max_ms REAL
+    );
+    CREATE INDEX IF NOT EXISTS idx_pm_step_metrics_step ON pm_step_metrics(step, window_end);
+'''
+
+METRICS_INSERT_SQL = '''
+    INSERT INTO pm_step_metrics (step, window_start, window_end, count, total_ms, p50_ms, p95_ms, p99_ms, max_ms)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+BUCKETS_PER_OCTAVE = 16
+
+
+def _bucket(duration_ns: int) -> int:
+    return int(math.log2(duration_ns) * BUCKETS_PER_OCTAVE) if duration_ns > 1 else 0
+
+
+def _bucket_upper_ms(bucket: int) -> float:
+    return 2 ** ((bucket + 1) / BUCKETS_PER_OCTAVE) / 1e6
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with exact count, sum, min and max"""
+
+    __slots__ = ('buckets', 'count', 'total_ns', 'min_ns', 'max_ns')
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def add(self, duration_ns: int) -> None:
+        bucket = _bucket(duration_ns)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        if not self.count or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self.count += 1
+        self.total_ns += duration_ns
+
+    def copy(self) -> 'LatencyHistogram':
+        clone = LatencyHistogram()
+        clone.buckets = dict(self.buckets)
+        clone.count, clone.total_ns, clone.min_ns, clone.max_ns = self.count, self.total_ns, self.min_ns, self.max_ns
+        return clone
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """Add the samples of other to this histogram"""
+        if not other.count:
+            return
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+        self.min_ns = other.min_ns if not self.count else min(self.min_ns, other.min_ns)
+        self.max_ns = max(self.max_ns, other.max_ns)
+        self.count += other.count
+        self.total_ns += other.total_ns
+
+    def since(self, earlier: Optional['LatencyHistogram']) -> 'LatencyHistogram':
+        """Samples added after `earlier` was copied; min/max are bucket-accurate"""
+        if earlier is None:
+            return self.copy()
+        delta = LatencyHistogram()
+        delta.buckets = {
+            bucket: count - earlier.buckets.get(bucket, 0)
+            for bucket, count in self.buckets.items()
+            if count > earlier.buckets.get(bucket, 0)
+        }
+        delta.count = self.count - earlier.count
+        delta.total_ns = self.total_ns - earlier.total_ns
+        if delta.buckets:
+            delta.min_ns = max(self.min_ns, int(2 ** (min(delta.buckets) / BUCKETS_PER_OCTAVE)))
+            delta.max_ns = min(self.max_ns, int(_bucket_upper_ms(max(delta.buckets)) * 1e6))
+        return delta
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Upper bound in milliseconds of the bucket holding the q-th sample"""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(_bucket_upper_ms(bucket), self.max_ns / 1e6)
+        return self.max_ns / 1e6
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'mean_ms': self.total_ns / self.count / 1e6 if self.count else None,
+            'min_ms': self.min_ns / 1e6 if self.count else None,
+            'p50_ms': self.percentile(0.50),
+            'p95_ms': self.percentile(0.95),
+            'p99_ms': self.percentile(0.99),
+            'max_ms': self.max_ns / 1e6 if self.count else None
+        }
+
+
+class _Span:
+    """Times one step and records it on exit (including when the step raises)"""
+
+    __slots__ = ('recorder', 'name', 'started')
+
+    def __init__(self, recorder: 'LatencyRecorder', name: str):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self) -> '_Span':
+        self.started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.recorder.record_ns(self.name, time.perf_counter_ns() - self.started)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> '_NoopSpan':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class LatencyRecorder:
+    """Named latency spans with per-step histograms and optional periodic persistence"""
+
+    def __init__(self, db_path: Optional[str] = None, enabled: bool = True, flush_interval: Optional[float] = None):
+        self.db_path = db_path
+        self.enabled = enabled
+        self.flush_interval = flush_interval
+        self.logger = logging.getLogger(__name__)
+
+        self._histograms: Dict[str, LatencyHistogram] = {}  # since start or reset()
+        self._window: Dict[str, LatencyHistogram] = {}  # since the previous flush()
+        self._window_start = datetime.now()
+        self._started = self._window_start
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if db_path is not None and flush_interval is not None:
+            self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executescript(METRICS_SCHEMA_SQL)
+
+    # Recording
+
+    def span(self, name: str):
+        """Context manager timing one step; a shared no-op when disabled"""
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, name)
+
+    def record_ns(self, name: str, duration_ns: int) -> None:
+        with self._lock:
+            for histograms in (self._histograms, self._window):
+                histogram = histograms.get(name)
+                if histogram is None:
+                    histogram = histograms[name] = LatencyHistogram()
+                histogram.add(duration_ns)
+
+    def record(self, name: str, seconds: float) -> None:
+        if self.enabled:
+            self.record_ns(name, int(seconds * 1e9))
+
+    # Reading
+
+    def stats(self) -> Dict[str, Any]:
+        """Cumulative per-step summaries since start or the last reset()"""
+        with self._lock:
+            histograms = {name: histogram.copy() for name, histogram in self._histograms.items()}
+            since = self._started
+        return {
+            'enabled': self.enabled,
+            'since': since.isoformat(),
+            'steps': {name: histogram.summary() for name, histogram in sorted(histograms.items())}
+        }
+
+    def reset(self) -> None:
+        """Restart the cumulative stats; samples not yet flushed are still written"""
+        with self._lock:
+            self._histograms = {}
+            self._started = datetime.now()
+
+    # Persistence
+
+    def flush(self) -> int:
+        """
+        Write samples recorded since the previous flush to pm_step_metrics
+
+        Returns:
+            int: Number of step rows written
+        """
+        if self.db_path is None:
+            return 0
+        with self._lock:
+            if not self._window:
+                return 0
+            window, self._window = self._window, {}
+            window_start, self._window_start = self._window_start, datetime.now()
+            window_end = self._window_start
+        rows = [
+            (
+                name, window_start.isoformat(), window_end.isoformat(), histogram.count, histogram.total_ns / 1e6,
+                histogram.percentile(0.50), histogram.percentile(0.95), histogram.percentile(0.99),
+                histogram.max_ns / 1e6
+            )
+            for name, histogram in sorted(window.items())
+        ]
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executescript(METRICS_SCHEMA_SQL)
+                conn.executemany(METRICS_INSERT_SQL, rows)
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to flush step metrics: {e}")
+            self._reopen_window(window, window_start)
+            return 0
+        return len(rows)
+
+    def _reopen_window(self, window: Dict[str, LatencyHistogram], window_start: datetime) -> None:
+        """Fold an unwritten window back in so the next flush retries its samples"""
+        with self._lock:
+            for name, histogram in self._window.items():
+                if name in window:
+                    window[name].merge(histogram)
+                else:
+                    window[name] = histogram
+            self._window = window
+            self._window_start = window_start
+
+    def start(self) -> None:
+        """Start the background flush thread"""
+        if self.flush_interval is None or self.db_path is None or self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="pm-step-metrics-flush", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread and flush the open window"""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+            self.flush()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
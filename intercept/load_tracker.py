@@ -0,0 +1,309 @@
+"""
+BMAD Auto Agent Load Tracker
+Decaying, write-behind agent load accounting for PMCoordinator
+
+Load is added when a subtask is assigned, released when its workflow completes
+and decays exponentially (configurable half-life) so abandoned work cannot pin an
+agent at saturation forever.
+
+Persistence is write-behind: assignments only touch memory, and a background
+thread flushes aggregated load, coordination_count deltas and the latest task per
+agent to agent_status with one executemany per interval. On startup the tracker
+rebuilds its view from agent_status, decaying persisted load by its age.
+
+Decay is applied on the caller's thread via decay() so that consumers such as the
+capability index are never mutated from the flush thread.
+"""
+
+import sqlite3
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+AGENT_STATUS_FLUSH_SQL = '''
+    INSERT INTO agent_status
+    (agent, last_activity, current_task, status, coordination_count, current_load, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(agent) DO UPDATE SET
+        last_activity = COALESCE(excluded.last_activity, agent_status.last_activity),
+        current_task = COALESCE(excluded.current_task, agent_status.current_task),
+        status = excluded.status,
+        coordination_count = COALESCE(agent_status.coordination_count, 0) + excluded.coordination_count,
+        current_load = excluded.current_load,
+        updated_at = excluded.updated_at
+'''
+
+
+class AgentLoadTracker:
+    """In-memory agent load with exponential decay and background persistence"""
+
+    MIN_LOAD = 0.001  # loads below this snap to zero
+    BUSY_THRESHOLD = 0.05
+
+    def __init__(
+        self,
+        db_path: str,
+        half_life_seconds: float = 1800.0,
+        decay_tick_seconds: float = 1.0,
+        flush_interval: Optional[float] = 5.0
+    ):
+        self.db_path = db_path
+        self.half_life_seconds = half_life_seconds
+        self.decay_tick_seconds = decay_tick_seconds
+        self.flush_interval = flush_interval
+        self.logger = logging.getLogger(__name__)
+
+        self._loads: Dict[str, float] = {}
+        self._pending_counts: Dict[str, int] = {}
+        self._pending_tasks: Dict[str, str] = {}
+        self._last_activity: Dict[str, str] = {}
+        self._dirty = set()
+        self._last_decay = time.time()
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        """Add the current_load column to pre-existing agent_status tables"""
+        with sqlite3.connect(self.db_path) as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(agent_status)")}
+            if columns and 'current_load' not in columns:
+                conn.execute("ALTER TABLE agent_status ADD COLUMN current_load REAL DEFAULT 0.0")
+
+    # Load accounting
+
+    def load(self, agent_name: str) -> float:
+        with self._lock:
+            return self._loads.get(agent_name, 0.0)
+
+    def acquire(self, agent_name: str, amount: float) -> float:
+        """Add load for an assignment; returns the agent's new load"""
+        return self._change(agent_name, amount)
+
+    def release(self, agent_name: str, amount: float) -> float:
+        """Release load for completed work; returns the agent's new load"""
+        return self._change(agent_name, -amount)
+
+    def _change(self, agent_name: str, delta: float) -> float:
+        with self._lock:
+            load = max(0.0, self._loads.get(agent_name, 0.0) + delta)
+            if load < self.MIN_LOAD:
+                load = 0.0
+            self._loads[agent_name] = load
+            self._dirty.add(agent_name)
+            return load
+
+    def record_assignments(self, assignments: Dict[str, str]) -> str:
+        """
+        Aggregate coordination_count and current task for the next flush
+
+        Returns:
+            str: The last_activity timestamp that will be written
+        """
+        now = datetime.now().isoformat()
+        with self._lock:
+            for subtask, agent_name in assignments.items():
+                self._pending_counts[agent_name] = self._pending_counts.get(agent_name, 0) + 1
+                self._pending_tasks[agent_name] = subtask
+                self._last_activity[agent_name] = now
+                self._dirty.add(agent_name)
+        return now
+
+    def decay(self, now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Apply exponential decay if a tick has elapsed
+
+        Returns:
+            Dict[str, float]: New loads for agents whose load changed
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            elapsed = now - self._last_decay
+            if elapsed < self.decay_tick_seconds:
+                return {}
+            self._last_decay = now
+
+            factor = 0.5 ** (elapsed / self.half_life_seconds)
+            changed = {}
+            for agent_name, load in self._loads.items():
+                if load == 0.0:
+                    continue
+                new_load = load * factor
+                if new_load < self.MIN_LOAD:
+                    new_load = 0.0
+                self._loads[agent_name] = new_load
+                self._dirty.add(agent_name)
+                changed[agent_name] = new_load
+            return changed
+
+    def pending(self) -> Dict[str, Dict[str, Any]]:
+        """
+        State the next flush will write, per dirty agent, without flushing
+
+        Returns:
+            {agent: {'status', 'current_task', 'last_activity', 'coordination_count'}};
+            coordination_count is the unflushed delta, the others are None when unchanged
+        """
+        with self._lock:
+            return {
+                agent_name: {
+                    'status': 'busy' if self._loads.get(agent_name, 0.0) >= self.BUSY_THRESHOLD else 'available',
+                    'current_task': self._pending_tasks.get(agent_name),
+                    'last_activity': self._last_activity.get(agent_name),
+                    'coordination_count': self._pending_counts.get(agent_name, 0)
+                }
+                for agent_name in self._dirty
+            }
+
+    # Persistence
+
+    def load_from_database(self) -> Dict[str, float]:
+        """Rebuild loads from agent_status, decayed by time since last update"""
+        now = time.time()
+        loads = {}
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                rows = conn.execute(
+                    "SELECT agent, current_load, updated_at FROM agent_status WHERE current_load > 0"
+                ).fetchall()
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to load agent status: {e}")
+            return loads
+
+        for agent_name, load, updated_at in rows:
+            try:
+                age = max(0.0, now - datetime.fromisoformat(updated_at).timestamp())
+            except (TypeError, ValueError):
+                age = 0.0
+            load = load * 0.5 ** (age / self.half_life_seconds)
+            if load >= self.MIN_LOAD:
+                loads[agent_name] = load
+
+        with self._lock:
+            self._loads.update(loads)
+            self._last_decay = now
+        return loads
+
+    def flush(self, conn: Optional[sqlite3.Connection] = None) -> int:
+        """
+        Write aggregated state for dirty agents to agent_status
+
+        Args:
+            conn: Open connection to write through; the caller owns the
+                transaction when provided, otherwise one is committed here.
+                Counters are consumed even if that transaction later rolls
+                back: use flushing() to keep them until it commits.
+
+        Returns:
+            int: Number of agent rows written
+        """
+        rows, _ = self._drain()
+        if not rows:
+            return 0
+
+        try:
+            if conn is not None:
+                conn.executemany(AGENT_STATUS_FLUSH_SQL, rows)
+            else:
+                with sqlite3.connect(self.db_path) as own_conn:
+                    own_conn.executemany(AGENT_STATUS_FLUSH_SQL, rows)
+            return len(rows)
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to flush agent status: {e}")
+            self._requeue(rows)
+            return 0
+
+    @contextmanager
+    def flushing(self, conn: sqlite3.Connection, assignments: Iterable[Dict[str, str]] = ()) -> Iterator[int]:
+        """
+        Write dirty state and assignments in the caller's open transaction
+
+        Commit inside the block. If the write, the block or the commit fails,
+        pending counters go back for the next flush and the assignments are
+        dropped with the rolled-back rows they belong to.
+
+        Yields:
+            int: Number of agent rows written
+        """
+        rows, pending = self._drain(assignments)
+        try:
+            if rows:
+                conn.executemany(AGENT_STATUS_FLUSH_SQL, rows)
+            yield len(rows)
+        except BaseException:
+            self._requeue(pending)
+            raise
+
+    def _drain(self, assignments: Iterable[Dict[str, str]] = ()) -> Tuple[List[Tuple], List[Tuple]]:
+        """Take dirty state as flush rows including assignments, and as rows to requeue without them"""
+        now = datetime.now().isoformat()
+        with self._lock:
+            pending = self._rows(self._dirty, self._last_activity, self._pending_tasks, self._pending_counts, now)
+            dirty, activity = set(self._dirty), dict(self._last_activity)
+            tasks, counts = dict(self._pending_tasks), dict(self._pending_counts)
+            for batch in assignments:
+                for subtask, agent_name in batch.items():
+                    counts[agent_name] = counts.get(agent_name, 0) + 1
+                    tasks[agent_name] = subtask
+                    activity[agent_name] = now
+                    dirty.add(agent_name)
+            rows = self._rows(dirty, activity, tasks, counts, now)
+
+            self._dirty.clear()
+            self._pending_counts.clear()
+            self._pending_tasks.clear()
+            self._last_activity.clear()
+        return rows, pending
+
+    def _rows(self, agents, last_activity, tasks, counts, now: str) -> List[Tuple]:
+        return [
+            (
+                agent_name,
+                last_activity.get(agent_name),
+                tasks.get(agent_name),
+                'busy' if self._loads.get(agent_name, 0.0) >= self.BUSY_THRESHOLD else 'available',
+                counts.get(agent_name, 0),
+                self._loads.get(agent_name, 0.0),
+                now
+            )
+            for agent_name in agents
+        ]
+
+    def _requeue(self, rows) -> None:
+        """Put unflushed counters back so the next flush retries them"""
+        with self._lock:
+            for agent_name, last_activity, task, _, count, _, _ in rows:
+                self._dirty.add(agent_name)
+                self._pending_counts[agent_name] = self._pending_counts.get(agent_name, 0) + count
+                if task and agent_name not in self._pending_tasks:
+                    self._pending_tasks[agent_name] = task
+                if last_activity and agent_name not in self._last_activity:
+                    self._last_activity[agent_name] = last_activity
+
+    # Background flushing
+
+    def start(self) -> None:
+        """Start the background flush thread"""
+        if self.flush_interval is None or self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="agent-load-flush", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread and flush remaining state"""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
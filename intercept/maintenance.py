@@ -0,0 +1,101 @@
+"""
+BMAD Auto Maintenance Commands
+Offline upkeep for coordination.db
+
+Usage:
+    python -m intercept.maintenance [--db PATH] rollups
+    python -m intercept.maintenance [--db PATH] search-index {rebuild,optimize}
+    python -m intercept.maintenance [--db PATH] archive --older-than-days N [--archive-dir DIR] [--vacuum]
+    python -m intercept.maintenance [--db PATH] outbox-trim [--older-than-days N]
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import sys
+from typing import Any, Dict, List, Optional
+
+from . import decision_rollups
+from . import decision_search
+from . import retention
+from .notification_outbox import NotificationOutbox
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(__file__), 'coordination.db')
+
+
+def rebuild_rollups(db_path: str) -> int:
+    """Rebuild pm_decision_daily_rollup from pm_decision_log"""
+    with sqlite3.connect(db_path) as conn:
+        return decision_rollups.backfill_rollups(conn)
+
+
+def maintain_search_index(db_path: str, action: str) -> int:
+    """Rebuild or optimize the decision search index; returns decisions indexed"""
+    with sqlite3.connect(db_path) as conn:
+        if action == 'rebuild':
+            return decision_search.rebuild_search_index(conn)
+        decision_search.ensure_search_index(conn)
+        decision_search.optimize_search_index(conn)
+        return conn.execute("SELECT COUNT(*) FROM pm_decision_log").fetchone()[0]
+
+
+def archive_history(db_path: str, older_than_days: int, archive_dir: Optional[str] = None,
+                    tables: Optional[List[str]] = None, vacuum: bool = False) -> Dict[str, Any]:
+    """Move rows older than the retention age to archive partitions"""
+    manager = retention.RetentionManager(db_path, archive_dir)
+    return manager.archive(older_than_days, tables or retention.RETENTION_TABLES, vacuum=vacuum)
+
+
+def trim_outbox(db_path: str, older_than_days: float = 7) -> int:
+    """Delete notifications every recipient has acknowledged, once past the retention age"""
+    outbox = NotificationOutbox(db_path)
+    try:
+        return outbox.trim_delivered(older_than_days * 24 * 3600)
+    finally:
+        outbox.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m intercept.maintenance', description=__doc__.split('\n')[2])
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help='coordination.db path')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('rollups', help='rebuild the daily decision rollups from history')
+    search_index = commands.add_parser('search-index', help='rebuild or optimize the decision full-text index')
+    search_index.add_argument('action', choices=['rebuild', 'optimize'])
+    archive = commands.add_parser('archive', help='move old log rows to compressed date-partitioned files')
+    archive.add_argument('--older-than-days', type=int, required=True, help='days of history kept in the database')
+    archive.add_argument('--archive-dir', help='partition directory (default: archive/ next to the database)')
+    archive.add_argument('--tables', nargs='+', choices=retention.RETENTION_TABLES)
+    archive.add_argument('--vacuum', action='store_true', help='VACUUM afterwards to shrink the database file')
+    outbox_trim = commands.add_parser('outbox-trim', help='delete acknowledged agent notifications')
+    outbox_trim.add_argument('--older-than-days', type=float, default=7,
+                             help='age past which acknowledged notifications are deleted (default: 7)')
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s %(message)s')
+    if not os.path.exists(args.db):
+        parser.error(f"database not found: {args.db}")
+
+    if args.command == 'rollups':
+        written = rebuild_rollups(args.db)
+        print(f"Rebuilt {written} decision rollup rows in {args.db}")
+    elif args.command == 'search-index':
+        indexed = maintain_search_index(args.db, args.action)
+        print(f"Search index {args.action} complete: {indexed} decisions in {args.db}")
+    elif args.command == 'archive':
+        report = archive_history(args.db, args.older_than_days, args.archive_dir, args.tables, args.vacuum)
+        for table, counts in report['tables'].items():
+            print(f"{table}: {counts['rows']} rows in {counts['partitions']} partitions")
+        print(f"Archived {report['rows_archived']} rows before {report['cutoff']} "
+              f"({report['archive_bytes']} bytes compressed); reclaimed {report['reclaimed_bytes']} bytes, "
+              f"database {report['db_bytes_before']} -> {report['db_bytes_after']} bytes")
+    elif args.command == 'outbox-trim':
+        trimmed = trim_outbox(args.db, args.older_than_days)
+        print(f"Trimmed {trimmed} delivered notifications older than {args.older_than_days:g} days from {args.db}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
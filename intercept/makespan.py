@@ -0,0 +1,168 @@
+"""
+BMAD Auto Makespan Estimator
+Scheduler-aware completion estimates for a subtask dependency DAG
+
+Subtasks carry an 'id' and explicit 'depends_on' edges. The estimator list-
+schedules them onto their assigned agents: each agent works one subtask at a
+time, at a speed scaled by its spare capacity (1 - current load), and a subtask
+starts once its prerequisites have finished and its agent is free. Ready
+subtasks are taken longest-remaining-path first, so the critical chain is never
+queued behind work that has slack.
+
+The result is the parallel makespan, earliest start/finish per subtask and the
+critical path, in place of a serial sum of subtask hours.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+MIN_CAPACITY = 0.1  # a saturated agent still progresses at 10% speed
+DEFAULT_HOURS = 1
+
+
+def subtask_id(subtask: Mapping[str, Any], index: int) -> str:
+    """Subtask id, defaulting to the assignment key for breakdowns without one"""
+    return subtask.get('id') or f"subtask_{index}"
+
+
+@dataclass(frozen=True)
+class ScheduledSubtask:
+    subtask_id: str
+    agent: Optional[str]
+    duration_minutes: float
+    earliest_start: float   # minutes from schedule start
+    earliest_finish: float
+    depends_on: List[str]
+
+
+@dataclass
+class Schedule:
+    makespan_minutes: float
+    serial_minutes: float
+    subtasks: Dict[str, ScheduledSubtask] = field(default_factory=dict)
+    critical_path: List[str] = field(default_factory=list)
+
+    @property
+    def parallelism(self) -> float:
+        """Speedup over running every subtask back to back"""
+        return self.serial_minutes / self.makespan_minutes if self.makespan_minutes else 1.0
+
+
+def critical_path_minutes(subtasks: Sequence[Mapping[str, Any]]) -> float:
+    """Makespan with unlimited agents at full capacity: the longest DAG path"""
+    return estimate_schedule(subtasks, {}, unbounded_agents=True).makespan_minutes
+
+
+def estimate_schedule(
+    subtasks: Sequence[Mapping[str, Any]],
+    assignments: Mapping[str, str],
+    capacity: Optional[Mapping[str, float]] = None,
+    unbounded_agents: bool = False
+) -> Schedule:
+    """
+    List-schedule a subtask DAG onto its assigned agents
+
+    Args:
+        subtasks: Subtasks with 'id', 'depends_on' and 'estimated_hours'
+        assignments: Subtask id -> agent name
+        capacity: Agent name -> spare capacity in (0, 1]; missing agents are idle
+        unbounded_agents: Ignore agent contention (pure DAG critical path)
+
+    Raises:
+        ValueError: Unknown dependency or dependency cycle
+    """
+    capacity = capacity or {}
+    ids = [subtask_id(subtask, i) for i, subtask in enumerate(subtasks)]
+    index_of = {sid: i for i, sid in enumerate(ids)}
+    if len(index_of) != len(ids):
+        raise ValueError("Duplicate subtask ids")
+
+    count = len(ids)
+    agents: List[Optional[str]] = [None if unbounded_agents else assignments.get(sid) for sid in ids]
+    predecessors: List[List[int]] = []
+    successors: List[List[int]] = [[] for _ in range(count)]
+    durations: List[float] = []
+    for i, subtask in enumerate(subtasks):
+        preds = []
+        for dependency in subtask.get('depends_on', ()):
+            if dependency not in index_of:
+                raise ValueError(f"Subtask {ids[i]} depends on unknown subtask {dependency}")
+            preds.append(index_of[dependency])
+            successors[index_of[dependency]].append(i)
+        predecessors.append(preds)
+        minutes = subtask.get('estimated_hours', DEFAULT_HOURS) * 60
+        if agents[i] is not None:
+            minutes /= max(MIN_CAPACITY, min(1.0, capacity.get(agents[i], 1.0)))
+        durations.append(minutes)
+
+    order = _topological_order(predecessors, successors, ids)
+
+    # Longest path from each subtask to a sink, including itself
+    remaining = [0.0] * count
+    for i in reversed(order):
+        remaining[i] = durations[i] + max((remaining[j] for j in successors[i]), default=0.0)
+
+    start = [0.0] * count
+    finish = [0.0] * count
+    blocked_by: List[Optional[int]] = [None] * count
+    agent_free: Dict[str, float] = {}
+    agent_last: Dict[str, int] = {}
+    waiting = [len(preds) for preds in predecessors]
+    ready = [(-remaining[i], i) for i in range(count) if not waiting[i]]
+    heapq.heapify(ready)
+
+    while ready:
+        _, i = heapq.heappop(ready)
+        begin, blocker = 0.0, None
+        for p in predecessors[i]:
+            if finish[p] > begin:
+                begin, blocker = finish[p], p
+        agent = agents[i]
+        if agent is not None and agent_free.get(agent, 0.0) > begin:
+            begin, blocker = agent_free[agent], agent_last[agent]
+        start[i], finish[i], blocked_by[i] = begin, begin + durations[i], blocker
+        if agent is not None:
+            agent_free[agent], agent_last[agent] = finish[i], i
+        for j in successors[i]:
+            waiting[j] -= 1
+            if not waiting[j]:
+                heapq.heappush(ready, (-remaining[j], j))
+
+    makespan = max(finish, default=0.0)
+    critical_path = []
+    node = max(range(count), key=lambda i: finish[i]) if count else None
+    while node is not None:
+        critical_path.append(ids[node])
+        node = blocked_by[node]
+
+    return Schedule(
+        makespan_minutes=makespan,
+        serial_minutes=sum(durations),
+        subtasks={
+            ids[i]: ScheduledSubtask(
+                subtask_id=ids[i],
+                agent=agents[i],
+                duration_minutes=durations[i],
+                earliest_start=start[i],
+                earliest_finish=finish[i],
+                depends_on=[ids[p] for p in predecessors[i]]
+            )
+            for i in range(count)
+        },
+        critical_path=critical_path[::-1]
+    )
+
+
+def _topological_order(predecessors: List[List[int]], successors: List[List[int]], ids: List[str]) -> List[int]:
+    waiting = [len(preds) for preds in predecessors]
+    order = [i for i, w in enumerate(waiting) if not w]
+    for i in order:  # order grows while iterating
+        for j in successors[i]:
+            waiting[j] -= 1
+            if not waiting[j]:
+                order.append(j)
+    if len(order) != len(ids):
+        cyclic = sorted(ids[i] for i, w in enumerate(waiting) if w)
+        raise ValueError(f"Dependency cycle among subtasks: {', '.join(cyclic)}")
+    return order
@@ -0,0 +1,195 @@
+"""
+BMAD Auto Notification Outbox
+Group-committed agent notifications with durable per-agent read cursors
+
+Notifications stay in coordination_log (command = 'notification'); the row id is
+the cursor. Writes go through a GroupCommitWriter, so concurrent notify calls and
+fan-outs to many agents share one transaction. Consumers long-poll fetch() with
+the last cursor they processed, which is an index range scan on
+(agent, command, id), and persist progress with ack(). trim_delivered() deletes
+notifications every agent has acknowledged once they pass the retention age;
+schedule it with `python -m intercept.maintenance outbox-trim`.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from database.group_commit import GroupCommitWriter
+
+NOTIFICATION_INSERT_SQL = '''
+    INSERT INTO coordination_log (agent, command, context, status, pm_decision, created_at)
+    VALUES (?, 'notification', ?, 'sent', ?, ?)
+'''
+
+OUTBOX_SCHEMA_SQL = '''
+    CREATE TABLE IF NOT EXISTS agent_notification_cursors (
+        agent TEXT PRIMARY KEY,
+        cursor INTEGER NOT NULL DEFAULT 0,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX IF NOT EXISTS idx_coordination_log_outbox ON coordination_log(agent, command, id);
+'''
+
+
+class NotificationOutbox:
+    """Batched notification writes and cursor-based delivery"""
+
+    POLL_INTERVAL = 0.25  # seconds between database polls while long-polling
+
+    def __init__(
+        self,
+        db_path: str,
+        durability: str = 'group',
+        max_batch: int = 512,
+        max_delay: float = 0.002
+    ):
+        self.db_path = db_path
+        self.logger = logging.getLogger(__name__)
+        self._published = threading.Condition()
+        self._generation = 0  # committed batches, so waiters never miss a wakeup
+        self.writer = GroupCommitWriter(
+            db_path,
+            self._write_notifications,
+            durability=durability,
+            max_batch=max_batch,
+            max_delay=max_delay,
+            on_commit=self._wake_consumers,
+            name='notification-outbox'
+        )
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executescript(OUTBOX_SCHEMA_SQL)
+
+    # Publishing
+
+    def publish(self, agent_name: str, message: str, context: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        """Queue one notification; returns its cursor unless durability is 'async'"""
+        cursors = self.publish_many([(agent_name, message, context)])
+        return cursors[0] if cursors else None
+
+    def publish_many(self, notifications: Iterable[Tuple[str, str, Optional[Dict[str, Any]]]]) -> List[int]:
+        """Fan out notifications in a single batched write"""
+        now = datetime.now().isoformat()
+        rows = [
+            (agent_name, json.dumps(context or {}), message, now)
+            for agent_name, message, context in notifications
+        ]
+        return self.writer.submit(rows) or []
+
+    def flush(self) -> None:
+        self.writer.flush()
+
+    def close(self) -> None:
+        self.writer.close()
+
+    def _write_notifications(self, conn: sqlite3.Connection, rows: List[Tuple]) -> List[int]:
+        return [conn.execute(NOTIFICATION_INSERT_SQL, row).lastrowid for row in rows]
+
+    def _wake_consumers(self, rows: List[Tuple], cursors: List[int]) -> None:
+        with self._published:
+            self._generation += 1
+            self._published.notify_all()
+
+    # Delivery
+
+    def fetch(
+        self,
+        agent_name: str,
+        after_cursor: Optional[int] = None,
+        max_items: int = 100,
+        timeout: float = 0.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Notifications for an agent after a cursor, oldest first
+
+        Args:
+            after_cursor: Last cursor processed; defaults to the agent's acked cursor
+            timeout: Seconds to long-poll for new notifications when none are pending
+        """
+        if after_cursor is None:
+            after_cursor = self.cursor(agent_name)
+        deadline = time.monotonic() + timeout
+
+        while True:
+            generation = self._generation
+            items = self._read(agent_name, after_cursor, max_items)
+            remaining = deadline - time.monotonic()
+            if items or remaining <= 0:
+                return items
+            # Woken early by in-process publishes; polling covers other processes
+            with self._published:
+                if generation == self._generation:
+                    self._published.wait(min(remaining, self.POLL_INTERVAL))
+
+    def _read(self, agent_name: str, after_cursor: int, max_items: int) -> List[Dict[str, Any]]:
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute('''
+                SELECT id, pm_decision, context, created_at FROM coordination_log
+                WHERE agent = ? AND command = 'notification' AND id > ?
+                ORDER BY id LIMIT ?
+            ''', (agent_name, after_cursor, max_items)).fetchall()
+        return [
+            {'cursor': cursor, 'message': message, 'context': json.loads(context or '{}'), 'created_at': created_at}
+            for cursor, message, context, created_at in rows
+        ]
+
+    def cursor(self, agent_name: str) -> int:
+        """Last cursor the agent acknowledged (0 if none)"""
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT cursor FROM agent_notification_cursors WHERE agent = ?", (agent_name,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def ack(self, agent_name: str, cursor: int) -> int:
+        """
+        Durably advance an agent's cursor; cursors never move backwards
+
+        Returns:
+            int: Number of notifications newly acknowledged
+        """
+        with sqlite3.connect(self.db_path, isolation_level=None) as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            previous = conn.execute(
+                "SELECT cursor FROM agent_notification_cursors WHERE agent = ?", (agent_name,)
+            ).fetchone()
+            previous = previous[0] if previous else 0
+            if cursor <= previous:
+                conn.execute('COMMIT')
+                return 0
+            acknowledged = conn.execute('''
+                SELECT COUNT(*) FROM coordination_log
+                WHERE agent = ? AND command = 'notification' AND id > ? AND id <= ?
+            ''', (agent_name, previous, cursor)).fetchone()[0]
+            conn.execute('''
+                INSERT INTO agent_notification_cursors (agent, cursor, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(agent) DO UPDATE SET cursor = excluded.cursor, updated_at = excluded.updated_at
+            ''', (agent_name, cursor, datetime.now().isoformat()))
+            conn.execute('COMMIT')
+        return acknowledged
+
+    # Retention
+
+    def trim_delivered(self, older_than_seconds: float = 7 * 24 * 3600) -> int:
+        """Delete acknowledged notifications older than the retention age"""
+        cutoff = (datetime.now() - timedelta(seconds=older_than_seconds)).isoformat()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                deleted = conn.execute('''
+                    DELETE FROM coordination_log
+                    WHERE command = 'notification' AND created_at < ?
+                      AND id <= (SELECT cursor FROM agent_notification_cursors c
+                                 WHERE c.agent = coordination_log.agent)
+                ''', (cutoff,)).rowcount
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to trim delivered notifications: {e}")
+            return 0
+        self.logger.info(f"Trimmed {deleted} delivered notifications")
+        return deleted
@@ -0,0 +1,84 @@
+"""
+BMAD Auto Payload Store
+Serialize-once, content-addressed storage for large coordination payloads
+
+A task breakdown used to be converted and JSON-encoded separately for the
+decision context, the workflow_state context and the caller's result. It is now
+encoded once into canonical bytes (sorted keys, compact separators) and stored
+once in task_payloads, keyed by a hash of those bytes.
+pm_decision_log and workflow_state reference the hash. Every reader rebuilds a
+whole TaskBreakdown, so load_payload() decodes the body at once.
+
+Encoding always goes through the json module: orjson rejects non-string keys,
+serializes datetimes and formats floats differently, and the hash of a payload
+must not depend on which backend is installed. orjson, when installed, only
+decodes.
+
+Retention archives a payload together with the last decision that references
+it, unless a workflow still does.
+"""
+
+import hashlib
+import json
+import sqlite3
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+PAYLOAD_SCHEMA_SQL = '''
+    CREATE TABLE IF NOT EXISTS task_payloads (
+        hash TEXT PRIMARY KEY,
+        body BLOB NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+PAYLOAD_INSERT_SQL = "INSERT OR IGNORE INTO task_payloads (hash, body) VALUES (?, ?)"
+
+
+def encode(obj: Any) -> bytes:
+    """Canonical UTF-8 JSON bytes for obj; NaN and infinities are rejected"""
+    return json.dumps(
+        obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False, allow_nan=False
+    ).encode('utf-8')
+
+
+def decode(body: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+@dataclass(frozen=True)
+class Payload:
+    """Encoded payload and its content hash"""
+    hash: str
+    body: bytes
+
+    @classmethod
+    def of(cls, obj: Any) -> 'Payload':
+        body = encode(obj)
+        return cls(hashlib.blake2b(body, digest_size=16).hexdigest(), body)
+
+    def row(self) -> Tuple[str, bytes]:
+        return self.hash, self.body
+
+
+def ensure_payload_schema(conn: sqlite3.Connection) -> None:
+    conn.execute(PAYLOAD_SCHEMA_SQL)
+
+
+def store_payloads(conn: sqlite3.Connection, payloads: Iterable[Payload]) -> None:
+    """Store payloads in the caller's transaction; existing hashes are skipped"""
+    conn.executemany(PAYLOAD_INSERT_SQL, [payload.row() for payload in payloads])
+
+
+def load_payload(conn: sqlite3.Connection, payload_hash: str) -> Optional[Any]:
+    """Decoded payload, or None if no payload has the hash"""
+    row = conn.execute("SELECT body FROM task_payloads WHERE hash = ?", (payload_hash,)).fetchone()
+    return decode(row[0]) if row else None
@@ -5,13 +5,47 @@ Implements autonomous task breakdown, agent assignment, and quality orchestratio
 
 import json
 import sqlite3
+import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 
-from .decision_capture import PMDecisionCapture
+from .decision_capture import PMDecisionCapture, DecisionContext, DecisionType
+from .agent_index import AgentCapabilityIndex
+from .load_tracker import AgentLoadTracker
+from .keyword_matcher import TaskKeywordMatcher, DEFAULT_CONFIG_PATH as DEFAULT_KEYWORDS_PATH
+from .workflow_registry import WorkflowRegistry
+from .status_snapshot import SystemStatusSnapshot
+from .notification_outbox import NotificationOutbox
+from .payload_store import Payload, load_payload, store_payloads
+from .latency_metrics import LatencyRecorder
+from .makespan import Schedule, critical_path_minutes, estimate_schedule
+from database.sqlite_pool import SQLitePool
+from database.id_generator import new_id
+
+
+WORKFLOW_INSERT_SQL = '''
+    INSERT INTO workflow_state (id, workflow_type, agents_involved, current_stage, status, context)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+# Load added to an agent per assigned subtask, released when the workflow completes
+ASSIGNMENT_LOAD = 0.1
+
+# Subtask type -> types it waits for when both are in the same breakdown
+SUBTASK_PREREQUISITES = {
+    'design': ('research', 'analysis'),
+    'architecture': ('research', 'analysis'),
+    'specification': ('architecture', 'design'),
+    'implementation': ('design', 'architecture', 'specification'),
+    'testing': ('implementation',),
+    'validation': ('implementation',),
+    'ux_validation': ('implementation',),
+    'quality': ('testing',),
+}
 
 
 class TaskPriority(Enum):
@@ -35,7 +69,7 @@ class TaskBreakdown:
     subtasks: List[Dict[str, Any]]
     agent_assignments: Dict[str, str]
     priority: TaskPriority
-    estimated_duration: int  # minutes
+    estimated_duration: int  # minutes, parallel makespan of the subtask DAG
     dependencies: List[str]
     quality_gates: List[str]
     created_at: datetime
@@ -51,15 +85,82 @@ class AgentCapability:
     last_activity: datetime
 
 
+@dataclass
+class PlannedTask:
+    """A task planned in memory and ready to persist"""
+    task_breakdown: TaskBreakdown
+    assignments: Dict[str, str]
+    quality_config: Dict[str, Any]
+    breakdown: Dict[str, Any]  # JSON-safe breakdown, converted once
+    payload: Payload           # canonical encoding of breakdown, stored once
+    decision: DecisionContext
+    schedule: Schedule
+    reused_from: Optional[Dict[str, Any]] = None  # {'decision_log_id', 'similarity'} of the reused breakdown
+
+    @property
+    def workflow_id(self) -> str:
+        return f"wf_{self.task_breakdown.task_id}"
+
+
 class PMCoordinator:
     """Central coordination hub for BMAD Auto 10-agent ecosystem"""
 
-    def __init__(self, db_path: str = None):
+    def __init__(
+        self,
+        db_path: str = None,
+        load_half_life_seconds: float = 1800.0,
+        load_flush_interval: Optional[float] = 5.0,
+        keywords_path: Optional[str] = None,
+        workflow_cache_size: int = 1024,
+        workflow_ttl_seconds: Optional[float] = 3600.0,
+        status_ttl_seconds: float = 2.0,
+        notification_durability: str = 'group',
+        metrics_enabled: bool = True,
+        metrics_flush_interval: Optional[float] = None,
+        decision_durability: Optional[str] = None,
+        reuse_threshold: Optional[float] = None
+    ):
+        """
+        Args:
+            reuse_threshold: Start from the breakdown of a past task assignment
+                whose prompt has at least this estimated similarity (0-1) to the
+                new one, instead of decomposing from scratch. None disables reuse.
+        """
         self.db_path = db_path or self._get_default_db_path()
-        self.decision_capture = PMDecisionCapture(self.db_path)
+        self.metrics = LatencyRecorder(self.db_path, enabled=metrics_enabled, flush_interval=metrics_flush_interval)
+        self.decision_capture = PMDecisionCapture(self.db_path, durability=decision_durability)
         self.agent_capabilities = self._initialize_agent_capabilities()
-        self.active_workflows = {}
+        self.capability_index = AgentCapabilityIndex(self.agent_capabilities.values())
+        self.load_tracker = AgentLoadTracker(
+            self.db_path,
+            half_life_seconds=load_half_life_seconds,
+            flush_interval=load_flush_interval
+        )
+        self.keyword_matcher = TaskKeywordMatcher(keywords_path or DEFAULT_KEYWORDS_PATH)
+        self.active_workflows = WorkflowRegistry(
+            self.db_path,
+            self._breakdown_from_context,
+            max_entries=workflow_cache_size,
+            ttl_seconds=workflow_ttl_seconds
+        )
+        self.notification_outbox = NotificationOutbox(self.db_path, durability=notification_durability)
+        self.status_snapshot = SystemStatusSnapshot(self._load_system_status, ttl_seconds=status_ttl_seconds)
+        self._sqlite_pool: Optional[SQLitePool] = None
+        self.reuse_threshold = reuse_threshold
         self._setup_logging()
+        self._restore_agent_loads()
+        self.load_tracker.start()
+        self.metrics.start()
+
+    def close(self) -> None:
+        """Stop background work and flush pending agent status, notifications and decisions"""
+        self.load_tracker.stop()
+        self.notification_outbox.close()
+        self.decision_capture.close()
+        self.metrics.stop()
+        if self._sqlite_pool is not None:
+            self._sqlite_pool.close()
+            self._sqlite_pool = None
 
     def _get_default_db_path(self) -> str:
         """Get default coordination.db path"""
@@ -141,59 +242,287 @@ class PMCoordinator:
         Returns:
             Coordination result with task breakdown and assignments
         """
+        metrics = self.metrics
+        plan = workflow_id = None
         try:
             self.logger.info(f"Starting task coordination for: {user_prompt[:100]}...")
 
-            # Step 1: Autonomous task breakdown
-            task_breakdown = self._decompose_task(user_prompt, context or {})
+            with metrics.span('coordinate_task'):
+                # Steps 1-3: Task breakdown, agent assignment and quality gates
+                plan = self._plan_task(user_prompt, context)
 
-            # Step 2: Capability-based agent assignment
-            assignments = self._assign_agents(task_breakdown)
-
-            # Step 3: Quality gate configuration
-            quality_config = self._configure_quality_gates(task_breakdown)
-
-            # Step 4: Capture PM decision reasoning
-            decision_id = self.decision_capture.capture_decision(
-                decision_type='task_assignment',
-                context_data={
-                    'user_prompt': user_prompt,
-                    'context': context,
-                    'task_breakdown': asdict(task_breakdown),
-                    'agent_assignments': assignments
-                },
-                reasoning_process=self._generate_reasoning(task_breakdown, assignments),
-                outcome=f"Task decomposed into {len(task_breakdown.subtasks)} subtasks",
-                confidence_score=self._calculate_confidence(task_breakdown),
-                model_assignments=self._determine_model_assignments(assignments)
-            )
+                # Step 4: Capture PM decision reasoning (may be group-committed)
+                with metrics.span('capture_decision'):
+                    self.decision_capture.capture_decision(plan.decision, [plan.payload])
 
-            # Step 5: Register workflow in database
-            workflow_id = self._register_workflow(task_breakdown, assignments, decision_id)
+                # Step 5: Register workflow in database
+                with metrics.span('register_workflow'):
+                    workflow_id = self._register_workflow(plan)
 
-            # Step 6: Update agent status
-            self._update_agent_status(assignments)
+                # Step 6: Update agent status
+                with metrics.span('update_status'):
+                    self._update_agent_status(plan.assignments)
 
-            coordination_result = {
-                'workflow_id': workflow_id,
-                'decision_id': decision_id,
-                'task_breakdown': asdict(task_breakdown),
-                'agent_assignments': assignments,
-                'quality_gates': quality_config,
-                'estimated_completion': self._estimate_completion_time(task_breakdown),
-                'next_actions': self._generate_next_actions(assignments)
-            }
+                coordination_result = self._coordination_result(plan)
 
             self.logger.info(f"Task coordination completed - Workflow ID: {workflow_id}")
             return coordination_result
 
         except Exception as e:
             self.logger.error(f"Task coordination failed: {e}")
+            if plan is not None and workflow_id is None:
+                self._release_assignments(plan.assignments)  # no workflow will complete to release it
             raise
 
+    async def coordinate_task_async(
+        self,
+        user_prompt: str,
+        context: Dict[str, Any] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Async coordination entry point for event-loop callers
+
+        Decomposition, assignment and gate configuration are CPU-only and run inline.
+        The decision and its workflow are inserted in one transaction on a pooled
+        connection in a worker thread, so a failure, timeout or cancellation rolls
+        back both; agent status is queued for the write-behind flush. Cancellation
+        and timeouts interrupt in-flight statements and propagate.
+
+        The pool is this coordinator's own SQLitePool: these writes bypass
+        database.connection_manager and its SQLite lock.
+
+        Args:
+            user_prompt: User's task description
+            context: Additional context (project, priority, etc.)
+            timeout: Optional limit in seconds for the persistence steps
+
+        Returns:
+            Coordination result with task breakdown and assignments
+        """
+        metrics = self.metrics
+        plan = None
+        tracked = False
+        try:
+            self.logger.info(f"Starting async task coordination for: {user_prompt[:100]}...")
+
+            # Steps 1-3: CPU-only planning
+            plan = self._plan_task(user_prompt, context)
+
+            # Steps 4-5: decision and workflow commit or roll back together
+            pool = self._get_sqlite_pool()
+            with metrics.span('persist_async'):
+                await asyncio.wait_for(pool.run(lambda conn: self._persist_plan(conn, plan)), timeout)
+
+            self._track_workflow(plan.workflow_id, plan.task_breakdown, plan.assignments)
+            tracked = True
+
+            # Step 6: write-behind agent status
+            with metrics.span('update_status'):
+                self._update_agent_status(plan.assignments)
+
+            self.logger.info(f"Async task coordination completed - Workflow ID: {plan.workflow_id}")
+            return self._coordination_result(plan)
+
+        except asyncio.TimeoutError:
+            self.logger.warning(f"Async task coordination timed out after {timeout}s: {user_prompt[:100]}")
+            raise
+        except asyncio.CancelledError:
+            self.logger.warning(f"Async task coordination cancelled for: {user_prompt[:100]}")
+            raise
+        except Exception as e:
+            self.logger.error(f"Async task coordination failed: {e}")
+            raise
+        finally:
+            if plan is not None and not tracked:
+                self._release_assignments(plan.assignments)  # no workflow will complete to release it
+
+    def _get_sqlite_pool(self) -> SQLitePool:
+        """Lazily create the pooled connections used by async coordination"""
+        if self._sqlite_pool is None:
+            self._sqlite_pool = SQLitePool(self.db_path)
+        return self._sqlite_pool
+
+    def _plan_task(self, user_prompt: str, context: Optional[Dict[str, Any]]) -> PlannedTask:
+        """Decompose, assign and build the decision for one prompt in memory"""
+        metrics = self.metrics
+        reused = None
+        if self.reuse_threshold is not None:
+            with metrics.span('reuse_lookup'):
+                reused = self._reuse_breakdown(user_prompt, self.reuse_threshold)
+        if reused is not None:
+            task_breakdown, reused_from = reused
+        else:
+            reused_from = None
+            with metrics.span('decompose'):
+                task_breakdown = self._decompose_task(user_prompt, context or {})
+        with metrics.span('assign'):
+            assignments = self._assign_agents(task_breakdown)
+        try:
+            with metrics.span('schedule'):
+                schedule = self._schedule_subtasks(task_breakdown, assignments)
+                task_breakdown.estimated_duration = round(schedule.makespan_minutes)
+            with metrics.span('configure_gates'):
+                quality_config = self._configure_quality_gates(task_breakdown)
+            with metrics.span('build_decision'):
+                breakdown = self._breakdown_to_dict(task_breakdown)
+                payload = Payload.of(breakdown)
+                decision = self._build_decision(user_prompt, context, task_breakdown, assignments, payload.hash, reused_from)
+        except BaseException:
+            self._release_assignments(assignments)
+            raise
+        return PlannedTask(
+            task_breakdown=task_breakdown,
+            assignments=assignments,
+            quality_config=quality_config,
+            breakdown=breakdown,
+            payload=payload,
+            decision=decision,
+            schedule=schedule,
+            reused_from=reused_from
+        )
+
+    def _coordination_result(self, plan: PlannedTask) -> Dict[str, Any]:
+        """Assemble the coordination result returned to callers"""
+        return {
+            'workflow_id': plan.workflow_id,
+            'decision_id': plan.decision.decision_id,
+            'task_breakdown': plan.breakdown,
+            'agent_assignments': plan.assignments,
+            'quality_gates': plan.quality_config,
+            'estimated_completion': self._estimate_completion_time(plan.task_breakdown),
+            'schedule': self._schedule_summary(plan.schedule, plan.task_breakdown.created_at),
+            'reused_from': plan.reused_from,
+            'next_actions': self._generate_next_actions(plan.assignments)
+        }
+
+    def coordinate_tasks_bulk(
+        self,
+        user_prompts: List[str],
+        contexts: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Bulk coordination entry point for bursts of prompts
+
+        Decomposes, assigns and builds decisions for every prompt in memory, then
+        persists all decisions, workflows and agent status in one SQLite transaction.
+
+        Args:
+            user_prompts: Task descriptions to coordinate
+            contexts: Optional per-prompt context, parallel to user_prompts
+
+        Returns:
+            Per-prompt results, failure details and throughput statistics
+        """
+        started = time.perf_counter()
+        contexts = contexts or [None] * len(user_prompts)
+        if len(contexts) != len(user_prompts):
+            raise ValueError("contexts must be parallel to user_prompts")
+
+        results: List[Dict[str, Any]] = [None] * len(user_prompts)
+        failures: List[Dict[str, Any]] = []
+        prepared = []
+
+        # Phase 1: CPU-only planning, isolated per prompt
+        for index, (user_prompt, context) in enumerate(zip(user_prompts, contexts)):
+            try:
+                prepared.append((index, self._plan_task(user_prompt, context)))
+            except Exception as e:
+                failures.append({'index': index, 'user_prompt': user_prompt, 'stage': 'planning', 'error': str(e)})
+
+        # Phase 2: single transaction for the whole batch
+        with self.metrics.span('persist_bulk'):
+            persisted, persist_failures = self._persist_bulk(prepared)
+        failures.extend(persist_failures)
+
+        # No workflow will ever complete for these: give back the load planning took
+        persisted_indexes = {index for index, _ in persisted}
+        for index, plan in prepared:
+            if index not in persisted_indexes:
+                self._release_assignments(plan.assignments)
+
+        for index, plan in persisted:
+            self._track_workflow(plan.workflow_id, plan.task_breakdown, plan.assignments)
+            results[index] = {'status': 'coordinated', **self._coordination_result(plan)}
+
+        for failure in failures:
+            results[failure['index']] = {'status': 'failed', 'stage': failure['stage'], 'error': failure['error']}
+
+        elapsed = time.perf_counter() - started
+        self.logger.info(
+            f"Bulk coordination completed - {len(persisted)}/{len(user_prompts)} prompts in {elapsed:.3f}s"
+        )
+
+        return {
+            'results': results,
+            'failures': sorted(failures, key=lambda f: f['index']),
+            'coordinated': len(persisted),
+            'failed': len(failures),
+            'elapsed_seconds': elapsed,
+            'prompts_per_second': len(user_prompts) / elapsed if elapsed > 0 else 0.0
+        }
+
+    def _persist_bulk(self, prepared: List[Tuple]) -> Tuple[List[Tuple], List[Dict[str, Any]]]:
+        """Write a planned batch in one transaction, isolating rows that fail"""
+        if not prepared:
+            return [], []
+
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                # Fast path: whole batch via executemany
+                plans = [plan for _, plan in prepared]
+                self.decision_capture.capture_decisions(
+                    [plan.decision for plan in plans], conn, [plan.payload for plan in plans]
+                )
+                conn.executemany(WORKFLOW_INSERT_SQL, [self._workflow_row(plan) for plan in plans])
+                persisted, failures = prepared, []
+            except sqlite3.IntegrityError:
+                # Slow path: retry row by row under savepoints to find the offenders
+                conn.execute('ROLLBACK')
+                conn.execute('BEGIN IMMEDIATE')
+                persisted, failures = self._persist_rows_individually(conn, prepared)
+
+            # Pending load counters are only consumed if this COMMIT succeeds
+            with self.load_tracker.flushing(conn, [plan.assignments for _, plan in persisted]):
+                conn.execute('COMMIT')
+            # A whole batch is cheaper to re-read than to patch agent by agent
+            self.status_snapshot.invalidate()
+            return persisted, failures
+
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            self.logger.error(f"Bulk persistence failed: {e}")
+            return [], [
+                {'index': index, 'user_prompt': plan.task_breakdown.parent_task, 'stage': 'persistence', 'error': str(e)}
+                for index, plan in prepared
+            ]
+        finally:
+            conn.close()
+
+    def _persist_rows_individually(self, conn: sqlite3.Connection, prepared: List[Tuple]) -> Tuple[List[Tuple], List[Dict[str, Any]]]:
+        """Insert each prompt under its own savepoint within the open transaction"""
+        persisted, failures = [], []
+
+        for item in prepared:
+            index, plan = item
+            conn.execute('SAVEPOINT bulk_row')
+            try:
+                self._persist_plan(conn, plan)
+                conn.execute('RELEASE SAVEPOINT bulk_row')
+                persisted.append(item)
+            except sqlite3.Error as e:
+                conn.execute('ROLLBACK TO SAVEPOINT bulk_row')
+                conn.execute('RELEASE SAVEPOINT bulk_row')
+                failures.append({'index': index, 'user_prompt': plan.task_breakdown.parent_task, 'stage': 'persistence', 'error': str(e)})
+
+        return persisted, failures
+
     def _decompose_task(self, user_prompt: str, context: Dict[str, Any]) -> TaskBreakdown:
         """Autonomous task decomposition with PM logic"""
-        task_id = f"task_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        task_id = new_id('task')
 
         # Analyze task complexity and determine breakdown strategy
         complexity_score = self._analyze_task_complexity(user_prompt, context)
@@ -211,22 +540,68 @@ class PMCoordinator:
             subtasks = self._generate_complex_breakdown(user_prompt, context)
             priority = TaskPriority.CRITICAL
 
+        self._link_subtasks(subtasks)
+
         return TaskBreakdown(
             task_id=task_id,
             parent_task=user_prompt,
             subtasks=subtasks,
             agent_assignments={},  # Will be filled by _assign_agents
             priority=priority,
-            estimated_duration=sum(st.get('estimated_hours', 1) * 60 for st in subtasks),
+            estimated_duration=round(critical_path_minutes(subtasks)),  # refined once agents are assigned
             dependencies=self._extract_dependencies(subtasks),
             quality_gates=self._determine_quality_gates(subtasks),
             created_at=datetime.now()
         )
 
+    def _reuse_breakdown(self, user_prompt: str, threshold: float) -> Optional[Tuple[TaskBreakdown, Dict[str, Any]]]:
+        """
+        Breakdown of the most similar past task assignment, re-targeted at user_prompt
+
+        Subtask types, hours and dependency edges carry over; descriptions have
+        the old prompt replaced by the new one. Agents are assigned afresh.
+
+        Returns:
+            (breakdown, {'decision_log_id', 'similarity'}) or None if nothing passes threshold
+        """
+        for match in self.decision_capture.find_similar_decisions(
+            user_prompt, DecisionType.TASK_ASSIGNMENT, limit=3, min_similarity=threshold
+        ):
+            breakdown_hash = match['decision_context'].get('task_breakdown_hash')
+            if not breakdown_hash:
+                continue  # decisions captured before payload references
+            data = self.decision_capture.similarity_index.payload(breakdown_hash)
+            if data is None:
+                continue
+
+            previous_prompt = data['parent_task']
+            subtasks = [
+                {**subtask, 'description': subtask.get('description', '').replace(previous_prompt, user_prompt)}
+                for subtask in data['subtasks']
+            ]
+            self._link_subtasks(subtasks)
+            task_breakdown = TaskBreakdown(
+                task_id=new_id('task'),
+                parent_task=user_prompt,
+                subtasks=subtasks,
+                agent_assignments={},
+                priority=TaskPriority(data['priority']),
+                estimated_duration=round(critical_path_minutes(subtasks)),
+                dependencies=self._extract_dependencies(subtasks),
+                quality_gates=self._determine_quality_gates(subtasks),
+                created_at=datetime.now()
+            )
+            self.logger.info(f"Reusing breakdown of decision {match['id']} (similarity {match['similarity']:.2f})")
+            return task_breakdown, {'decision_log_id': match['id'], 'similarity': match['similarity']}
+        return None
+
     def _assign_agents(self, task_breakdown: TaskBreakdown) -> Dict[str, str]:
         """Capability-based agent assignment with load balancing"""
         assignments = {}
 
+        for agent_name, load in self.load_tracker.decay().items():
+            self._apply_agent_load(agent_name, load)
+
         for i, subtask in enumerate(task_breakdown.subtasks):
             required_capabilities = self._extract_required_capabilities(subtask)
             best_agent = self._find_best_agent(required_capabilities)
@@ -234,7 +609,7 @@ class PMCoordinator:
             if best_agent:
                 assignments[f"subtask_{i}"] = best_agent
                 # Update agent load
-                self.agent_capabilities[best_agent].current_load += 0.1
+                self._adjust_agent_load(best_agent, ASSIGNMENT_LOAD)
             else:
                 self.logger.warning(f"No suitable agent found for subtask: {subtask['description']}")
                 assignments[f"subtask_{i}"] = 'james_developer'  # Default fallback
@@ -243,160 +618,311 @@ class PMCoordinator:
 
     def _find_best_agent(self, required_capabilities: List[str]) -> Optional[str]:
         """Find the best agent based on capabilities, load, and performance"""
-        best_agent = None
-        best_score = -1
-
-        for agent_name, capability in self.agent_capabilities.items():
-            # Calculate capability match score
-            match_score = len(set(required_capabilities) & set(capability.capabilities))
-            if match_score == 0:
-                continue
-
-            # Factor in current load (prefer less loaded agents)
-            load_penalty = capability.current_load * 0.5
-
-            # Factor in success rate and response time
-            performance_score = capability.success_rate - (capability.avg_response_time / 10)
+        # Score: capability match + (success rate - response time / 10) - load * 0.5,
+        # served from the capability index so only capable agents are examined
+        return self.capability_index.best_agent(required_capabilities)
+
+    def register_agent(self, capability: AgentCapability) -> None:
+        """Register (or replace) an agent instance available for assignment"""
+        tracked_load = self.load_tracker.load(capability.agent_name)
+        if tracked_load:
+            capability.current_load = tracked_load
+        self.agent_capabilities[capability.agent_name] = capability
+        self.capability_index.add(capability)
+
+    def unregister_agent(self, agent_name: str) -> None:
+        """Remove an agent instance from assignment"""
+        self.agent_capabilities.pop(agent_name, None)
+        self.capability_index.remove(agent_name)
+
+    def _adjust_agent_load(self, agent_name: str, delta: float) -> None:
+        """Acquire (delta > 0) or release (delta < 0) agent load"""
+        if delta >= 0:
+            load = self.load_tracker.acquire(agent_name, delta)
+        else:
+            load = self.load_tracker.release(agent_name, -delta)
+        self._apply_agent_load(agent_name, load)
+
+    def _apply_agent_load(self, agent_name: str, load: float) -> None:
+        """Mirror a tracked load onto the capability matrix and index"""
+        capability = self.agent_capabilities.get(agent_name)
+        if capability is not None:
+            capability.current_load = load
+            self.capability_index.update(capability)
+        self.status_snapshot.update_agent(agent_name, {'status': self._load_status(load)})
+
+    def _load_status(self, load: float) -> str:
+        """agent_status.status value the next flush will write for a load"""
+        return 'busy' if load >= self.load_tracker.BUSY_THRESHOLD else 'available'
+
+    def _restore_agent_loads(self) -> None:
+        """Rebuild the load view from agent_status on startup"""
+        for agent_name, load in self.load_tracker.load_from_database().items():
+            self._apply_agent_load(agent_name, load)
+
+    def complete_workflow(self, workflow_id: str, status: str = 'completed') -> bool:
+        """Mark a workflow finished and release the load held by its agents"""
+        workflow = self.active_workflows.get(workflow_id)
+        if workflow is None or workflow['status'] != 'active':
+            return False
 
-            total_score = match_score + performance_score - load_penalty
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute('''
+                    UPDATE workflow_state SET status = ?, current_stage = ?, updated_at = ?
+                    WHERE id = ?
+                ''', (status, status, datetime.now().isoformat(), workflow_id))
+        except Exception as e:
+            self.logger.error(f"Failed to complete workflow {workflow_id}: {e}")
+            return False
 
-            if total_score > best_score:
-                best_score = total_score
-                best_agent = agent_name
+        workflow['status'] = status
+        self.active_workflows.discard(workflow_id)
+        self.status_snapshot.adjust('active_workflows', -1)
+        self._release_assignments(workflow['assignments'])
+        return True
 
-        return best_agent
+    def _release_assignments(self, assignments: Dict[str, str]) -> None:
+        """Release the load taken for each assignment of a finished or abandoned task"""
+        for agent_name in assignments.values():
+            self._adjust_agent_load(agent_name, -ASSIGNMENT_LOAD)
 
     def _extract_required_capabilities(self, subtask: Dict[str, Any]) -> List[str]:
         """Extract required capabilities from subtask description"""
-        description = subtask.get('description', '').lower()
-        task_type = subtask.get('type', '').lower()
-
-        capabilities = []
-
-        # Map keywords to capabilities
-        if any(word in description for word in ['implement', 'code', 'develop', 'build']):
-            capabilities.append('code_implementation')
-        if any(word in description for word in ['test', 'quality', 'validate']):
-            capabilities.append('quality_validation')
-        if any(word in description for word in ['design', 'architect', 'structure']):
-            capabilities.append('system_design')
-        if any(word in description for word in ['research', 'analyze', 'investigate']):
-            capabilities.append('research')
-        if any(word in description for word in ['ui', 'ux', 'user', 'interface']):
-            capabilities.append('user_experience')
-        if any(word in description for word in ['coordinate', 'manage', 'oversee']):
-            capabilities.append('coordination')
-
-        return capabilities or ['code_implementation']  # Default capability
+        # Keyword tables live in task_keywords.yaml; the default capability applies when none match
+        return self.keyword_matcher.capabilities(subtask.get('description', ''))
 
     def notify_agent(self, agent_name: str, message: str, context: Dict[str, Any] = None) -> bool:
         """Notify specific agent with task assignment or update"""
+        return self.notify_agents([agent_name], message, context)
+
+    def notify_agents(self, agent_names: List[str], message: str, context: Dict[str, Any] = None) -> bool:
+        """Fan a notification out to several agents in one batched outbox write"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute('''
-                    INSERT INTO coordination_log (agent, command, context, status, pm_decision)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (agent_name, 'notification', json.dumps(context or {}), 'sent', message))
+            self.notification_outbox.publish_many((agent_name, message, context) for agent_name in agent_names)
 
-            self.logger.info(f"Notification sent to {agent_name}: {message[:50]}...")
+            for agent_name in agent_names:
+                self.status_snapshot.increment_agent(agent_name, 'pending_notifications')
+            self.logger.info(f"Notification sent to {', '.join(agent_names)}: {message[:50]}...")
             return True
 
         except Exception as e:
-            self.logger.error(f"Failed to notify {agent_name}: {e}")
+            self.logger.error(f"Failed to notify {', '.join(agent_names)}: {e}")
             return False
 
-    def get_system_status(self) -> Dict[str, Any]:
-        """Get comprehensive system status for PM dashboard"""
-        try:
-            status = {
-                'timestamp': datetime.now().isoformat(),
-                'agents': {},
-                'active_workflows': len(self.active_workflows),
-                'system_health': 'healthy'
-            }
+    def fetch_notifications(
+        self,
+        agent_name: str,
+        after_cursor: Optional[int] = None,
+        max_items: int = 100,
+        timeout: float = 0.0
+    ) -> List[Dict[str, Any]]:
+        """Long-poll an agent's notifications after a cursor (see NotificationOutbox.fetch)"""
+        return self.notification_outbox.fetch(agent_name, after_cursor, max_items, timeout)
+
+    def acknowledge_notifications(self, agent_name: str, cursor: int) -> int:
+        """Durably advance an agent's notification cursor; returns the number acknowledged"""
+        acknowledged = self.notification_outbox.ack(agent_name, cursor)
+        self.status_snapshot.increment_agent(agent_name, 'pending_notifications', -acknowledged)
+        return acknowledged
+
+    def get_system_status(self, if_version: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get comprehensive system status for PM dashboard
 
-            # Get agent status from database
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute('''
-                    SELECT agent, status, current_task, last_activity, coordination_count
-                    FROM agent_status
-                ''')
-
-                for row in cursor.fetchall():
-                    agent, agent_status, current_task, last_activity, coord_count = row
-                    status['agents'][agent] = {
-                        'status': agent_status,
-                        'current_task': current_task,
-                        'last_activity': last_activity,
-                        'coordination_count': coord_count,
-                        'capabilities': self.agent_capabilities.get(agent, {}).capabilities if agent in self.agent_capabilities else []
-                    }
-
-            return status
+        Served from a versioned snapshot. Pass the 'version' of the last status
+        seen as if_version to get {'version', 'not_modified': True, 'timestamp'}
+        back when nothing changed since. Workflow cache statistics are not
+        versioned and live in get_performance_stats().
+        """
+        try:
+            return self.status_snapshot.get(if_version)
 
         except Exception as e:
             self.logger.error(f"Failed to get system status: {e}")
             return {'error': str(e), 'timestamp': datetime.now().isoformat()}
 
-    def _register_workflow(self, task_breakdown: TaskBreakdown, assignments: Dict[str, str], decision_id: str) -> str:
-        """Register workflow in database for tracking"""
-        workflow_id = f"wf_{task_breakdown.task_id}"
+    def get_performance_stats(self) -> Dict[str, Any]:
+        """
+        Per-step latency summaries for the coordination pipeline
 
+        Returns:
+            {'enabled', 'since', 'steps': {step: {'count', 'mean_ms', 'min_ms',
+            'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'}}}; steps include decompose,
+            assign, schedule, configure_gates, build_decision, capture_decision,
+            register_workflow, update_status and the coordinate_task total;
+            'workflow_cache' holds the workflow registry's hit and eviction counts
+        """
+        return {**self.metrics.stats(), 'workflow_cache': self.active_workflows.stats()}
+
+    def _load_system_status(self) -> Dict[str, Any]:
+        """Read the full status snapshot from coordination.db, plus unflushed agent state"""
+        status = {'agents': {}, 'active_workflows': 0, 'system_health': 'healthy'}
+
+        with sqlite3.connect(self.db_path) as conn:
+            # The registry only holds recently used workflows; count from the table
+            status['active_workflows'] = conn.execute(
+                "SELECT COUNT(*) FROM workflow_state WHERE status = 'active'"
+            ).fetchone()[0]
+            pending_notifications = dict(conn.execute('''
+                SELECT l.agent, COUNT(*) FROM coordination_log l
+                LEFT JOIN agent_notification_cursors c ON c.agent = l.agent
+                WHERE l.command = 'notification' AND l.id > COALESCE(c.cursor, 0)
+                GROUP BY l.agent
+            ''').fetchall())
+
+            cursor = conn.execute('''
+                SELECT agent, status, current_task, last_activity, coordination_count
+                FROM agent_status
+            ''')
+
+            for row in cursor.fetchall():
+                agent, agent_status, current_task, last_activity, coord_count = row
+                status['agents'][agent] = self._agent_status_entry(agent, {
+                    'status': agent_status,
+                    'current_task': current_task,
+                    'last_activity': last_activity,
+                    'coordination_count': coord_count,
+                    'pending_notifications': pending_notifications.get(agent, 0)
+                })
+
+        # Fold in write-behind state instead of flushing: a dashboard read never
+        # writes. A flush landing between the two reads skews one reload; the next
+        # TTL reload corrects it.
+        for agent, unflushed in self.load_tracker.pending().items():
+            entry = status['agents'].get(agent) or self._agent_status_entry(agent, {
+                'status': None,
+                'current_task': None,
+                'last_activity': None,
+                'coordination_count': 0,
+                'pending_notifications': pending_notifications.get(agent, 0)
+            })
+            entry['status'] = unflushed['status']
+            entry['coordination_count'] = (entry['coordination_count'] or 0) + unflushed['coordination_count']
+            for field in ('current_task', 'last_activity'):
+                if unflushed[field] is not None:
+                    entry[field] = unflushed[field]
+            status['agents'][agent] = entry
+        return status
+
+    def _agent_status_entry(self, agent_name: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Per-agent status entry with the agent's registered capabilities"""
+        capability = self.agent_capabilities.get(agent_name)
+        return {**fields, 'capabilities': list(capability.capabilities) if capability else []}
+
+    def _register_workflow(self, plan: PlannedTask) -> str:
+        """Register workflow in database for tracking"""
         try:
             with sqlite3.connect(self.db_path) as conn:
-                conn.execute('''
-                    INSERT INTO workflow_state (id, workflow_type, agents_involved, current_stage, status, context)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
-                    workflow_id,
-                    'pm_coordinated_task',
-                    json.dumps(list(assignments.values())),
-                    'task_assignment',
-                    'active',
-                    json.dumps({
-                        'task_breakdown': asdict(task_breakdown),
-                        'assignments': assignments,
-                        'decision_id': decision_id
-                    })
-                ))
-
-            self.active_workflows[workflow_id] = {
-                'task_breakdown': task_breakdown,
-                'assignments': assignments,
-                'status': 'active',
-                'created_at': datetime.now()
-            }
+                # The payload may still be buffered with its decision; store it here too
+                self._insert_workflow(conn, plan)
 
-            return workflow_id
+            self._track_workflow(plan.workflow_id, plan.task_breakdown, plan.assignments)
+            return plan.workflow_id
 
         except Exception as e:
             self.logger.error(f"Failed to register workflow: {e}")
             raise
 
+    def _persist_plan(self, conn: sqlite3.Connection, plan: PlannedTask) -> None:
+        """Insert a plan's decision and workflow in the caller's transaction"""
+        self.decision_capture.capture_decisions([plan.decision], conn, [plan.payload])
+        self._insert_workflow(conn, plan)
+
+    def _insert_workflow(self, conn: sqlite3.Connection, plan: PlannedTask) -> None:
+        """Insert a workflow together with the payload it references"""
+        store_payloads(conn, [plan.payload])
+        conn.execute(WORKFLOW_INSERT_SQL, self._workflow_row(plan))
+
+    def _workflow_row(self, plan: PlannedTask) -> Tuple:
+        """Build workflow_state row values; the breakdown is referenced by payload hash"""
+        return (
+            plan.workflow_id,
+            'pm_coordinated_task',
+            json.dumps(list(plan.assignments.values())),
+            'task_assignment',
+            'active',
+            json.dumps({
+                'task_breakdown_hash': plan.payload.hash,
+                'assignments': plan.assignments,
+                'decision_id': plan.decision.decision_id
+            })
+        )
+
+    def _track_workflow(self, workflow_id: str, task_breakdown: TaskBreakdown, assignments: Dict[str, str]):
+        """Track a persisted workflow in memory"""
+        self.status_snapshot.adjust('active_workflows', 1)
+        self.active_workflows[workflow_id] = {
+            'task_breakdown': task_breakdown,
+            'assignments': assignments,
+            'status': 'active',
+            'created_at': datetime.now()
+        }
+
     def _update_agent_status(self, assignments: Dict[str, str]):
-        """Update agent status in database"""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                for subtask, agent in assignments.items():
-                    conn.execute('''
-                        INSERT OR REPLACE INTO agent_status
-                        (agent, last_activity, current_task, status, coordination_count, updated_at)
-                        VALUES (
-                            ?, ?, ?, ?,
-                            COALESCE((SELECT coordination_count FROM agent_status WHERE agent = ?) + 1, 1),
-                            ?
-                        )
-                    ''', (
-                        agent,
-                        datetime.now().isoformat(),
-                        subtask,
-                        'busy',
-                        agent,
-                        datetime.now().isoformat()
-                    ))
+        """Queue agent status changes for the write-behind flush and patch the status snapshot"""
+        last_activity = self.load_tracker.record_assignments(assignments)
+        for subtask, agent_name in assignments.items():
+            self.status_snapshot.update_agent(agent_name, {
+                'status': self._load_status(self.load_tracker.load(agent_name)),
+                'current_task': subtask,
+                'last_activity': last_activity
+            }, defaults=self._agent_status_entry(agent_name, {'coordination_count': 0, 'pending_notifications': 0}))
+            self.status_snapshot.increment_agent(agent_name, 'coordination_count')
+
+    def _build_decision(
+        self,
+        user_prompt: str,
+        context: Optional[Dict[str, Any]],
+        task_breakdown: TaskBreakdown,
+        assignments: Dict[str, str],
+        breakdown_hash: str,
+        reused_from: Optional[Dict[str, Any]] = None
+    ) -> DecisionContext:
+        """Build the task assignment decision for a coordinated task"""
+        context_data = {
+            'user_prompt': user_prompt,
+            'context': context,
+            'task_breakdown_hash': breakdown_hash,
+            'agent_assignments': assignments
+        }
+        if reused_from is not None:
+            context_data['reused_from'] = reused_from
+        return DecisionContext(
+            decision_id='',
+            decision_type=DecisionType.TASK_ASSIGNMENT,
+            context_data=context_data,
+            reasoning_process=self._generate_reasoning(task_breakdown, assignments),
+            outcome=f"Task decomposed into {len(task_breakdown.subtasks)} subtasks",
+            confidence_score=self._calculate_confidence(task_breakdown),
+            agent_assignments=assignments,
+            resource_optimization={'model_assignments': self._determine_model_assignments(assignments)}
+        )
 
-        except Exception as e:
-            self.logger.error(f"Failed to update agent status: {e}")
+    def _breakdown_to_dict(self, task_breakdown: TaskBreakdown) -> Dict[str, Any]:
+        """JSON-safe dict form of a task breakdown"""
+        data = asdict(task_breakdown)
+        data['priority'] = task_breakdown.priority.value
+        data['created_at'] = task_breakdown.created_at.isoformat()
+        return data
+
+    def _breakdown_from_context(self, context: Dict[str, Any]) -> TaskBreakdown:
+        """Rebuild a workflow's task breakdown from its workflow_state context"""
+        data = context.get('task_breakdown')  # workflows stored before payload references
+        if data is None:
+            with sqlite3.connect(self.db_path) as conn:
+                data = load_payload(conn, context['task_breakdown_hash'])
+            if data is None:
+                raise KeyError(f"task payload {context['task_breakdown_hash']} not found")
+        return self._breakdown_from_dict(data)
+
+    def _breakdown_from_dict(self, data: Dict[str, Any]) -> TaskBreakdown:
+        """Rebuild a task breakdown stored by _breakdown_to_dict"""
+        return TaskBreakdown(**{
+            **data,
+            'priority': TaskPriority(data['priority']),
+            'created_at': datetime.fromisoformat(data['created_at'])
+        })
 
     # Helper methods for task analysis
     def _analyze_task_complexity(self, user_prompt: str, context: Dict[str, Any]) -> int:
@@ -410,8 +936,7 @@ class PMCoordinator:
             complexity += 1
 
         # Keyword-based complexity
-        complex_keywords = ['integrate', 'orchestrate', 'coordinate', 'multiple', 'system', 'architecture']
-        complexity += sum(1 for word in complex_keywords if word in user_prompt.lower())
+        complexity += self.keyword_matcher.complexity_score(user_prompt)
 
         # Context-based complexity
         if context.get('priority') == 'critical':
@@ -442,8 +967,52 @@ class PMCoordinator:
             {'description': f"Quality gates validation for: {user_prompt}", 'type': 'quality', 'estimated_hours': 2}
         ]
 
+    def _link_subtasks(self, subtasks: List[Dict[str, Any]]) -> None:
+        """Give each subtask an id and explicit depends_on edges by subtask type"""
+        ids_by_type: Dict[str, List[str]] = {}
+        for i, subtask in enumerate(subtasks):
+            subtask['id'] = f"subtask_{i}"  # same key as its agent assignment
+            ids_by_type.setdefault(subtask.get('type'), []).append(subtask['id'])
+
+        for subtask in subtasks:
+            subtask['depends_on'] = [
+                prerequisite_id
+                for prerequisite_type in SUBTASK_PREREQUISITES.get(subtask.get('type'), ())
+                for prerequisite_id in ids_by_type.get(prerequisite_type, ())
+            ]
+
+    def _schedule_subtasks(self, task_breakdown: TaskBreakdown, assignments: Dict[str, str]) -> Schedule:
+        """Schedule the subtask DAG on the assigned agents' spare capacity"""
+        own_load: Dict[str, float] = {}
+        for agent_name in assignments.values():
+            own_load[agent_name] = own_load.get(agent_name, 0.0) + ASSIGNMENT_LOAD
+        # Capacity before this task's own assignments, which the schedule already serializes
+        capacity = {
+            agent_name: 1.0 - max(0.0, self.load_tracker.load(agent_name) - load)
+            for agent_name, load in own_load.items()
+        }
+        return estimate_schedule(task_breakdown.subtasks, assignments, capacity)
+
+    def _schedule_summary(self, schedule: Schedule, started_at: datetime) -> Dict[str, Any]:
+        """JSON-safe schedule with per-subtask earliest start and finish times"""
+        at = lambda minutes: (started_at + timedelta(minutes=minutes)).isoformat()
+        return {
+            'makespan_minutes': round(schedule.makespan_minutes, 1),
+            'serial_minutes': round(schedule.serial_minutes, 1),
+            'critical_path': schedule.critical_path,
+            'subtasks': {
+                sid: {
+                    'agent': entry.agent,
+                    'depends_on': entry.depends_on,
+                    'earliest_start': at(entry.earliest_start),
+                    'earliest_finish': at(entry.earliest_finish)
+                }
+                for sid, entry in schedule.subtasks.items()
+            }
+        }
+
     def _extract_dependencies(self, subtasks: List[Dict[str, Any]]) -> List[str]:
-        """Extract task dependencies"""
+        """Readable stage dependencies ('design -> implementation'); edges live in depends_on"""
         dependencies = []
         task_types = [st.get('type') for st in subtasks]
 
@@ -533,8 +1102,8 @@ class PMCoordinator:
         return model_assignments
 
     def _estimate_completion_time(self, task_breakdown: TaskBreakdown) -> str:
-        """Estimate task completion time"""
-        completion_time = datetime.now() + timedelta(minutes=task_breakdown.estimated_duration)
+        """Estimate task completion time from the scheduled makespan"""
+        completion_time = task_breakdown.created_at + timedelta(minutes=task_breakdown.estimated_duration)
         return completion_time.isoformat()
 
     def _generate_next_actions(self, assignments: Dict[str, str]) -> List[str]:
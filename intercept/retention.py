@@ -0,0 +1,362 @@
+"""
+BMAD Auto Tiered Retention
+Archive old log rows to compressed, date-partitioned files
+
+pm_decision_log, coordination_log and quality_gate_executions are append-only
+and were never trimmed. archive() moves rows from days before the retention
+cutoff into gzip JSON Lines partitions, one file per table, day and run:
+
+    <archive_dir>/<table>/<YYYY-MM-DD>.<run>.jsonl.gz
+
+Each partition is written, fsynced and recorded in archive_partitions in the
+same IMMEDIATE transaction that deletes its rows, so a crash leaves either the
+rows in SQLite or a recorded partition, never both. A file left over from a
+failed run is not in the manifest and is never read.
+
+Deleting decisions fires the pm_decision_log delete triggers: the search and
+similarity indexes drop them (both cover hot rows only) and the daily rollups
+get their counts added back, so pattern analysis still spans archived days.
+Task payloads that only the archived decisions reference move to a task_payloads
+partition of the same day in the same transaction; payloads a hot decision or
+any workflow references stay. Notifications an agent has not acknowledged stay
+in coordination_log.
+
+iter_rows() is the query facade: one ordered stream over archived partitions
+and hot rows. PMDecisionCapture.iter_decision_history(include_archived=True)
+merges iter_archived() into its keyset pages the same way, which the history
+and export APIs build on.
+"""
+
+import gzip
+import heapq
+import itertools
+import json
+import os
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from . import decision_rollups
+
+RETENTION_TABLES = ('pm_decision_log', 'coordination_log', 'quality_gate_executions')
+
+ARCHIVE_SCHEMA_SQL = '''
+    CREATE TABLE IF NOT EXISTS archive_partitions (
+        id INTEGER PRIMARY KEY,
+        table_name TEXT NOT NULL,
+        day TEXT NOT NULL,               -- YYYY-MM-DD of the archived created_at values
+        path TEXT NOT NULL,
+        row_count INTEGER NOT NULL,
+        min_id INTEGER,
+        max_id INTEGER,
+        file_bytes INTEGER NOT NULL,
+        archived_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX IF NOT EXISTS idx_archive_partitions_table_day ON archive_partitions(table_name, day);
+'''
+
+# Payloads referenced by the decisions being archived and by nothing that stays ({where} twice)
+_ARCHIVED_PAYLOADS_SQL = '''
+    SELECT rowid AS id, hash, body, created_at FROM task_payloads
+    WHERE hash IN (
+        SELECT json_extract(decision_context, '$.task_breakdown_hash') FROM pm_decision_log WHERE {where}
+    )
+    AND NOT EXISTS (
+        SELECT 1 FROM pm_decision_log
+        WHERE NOT ({where}) AND json_extract(decision_context, '$.task_breakdown_hash') = task_payloads.hash
+    )
+    AND NOT EXISTS (
+        SELECT 1 FROM workflow_state WHERE json_extract(context, '$.task_breakdown_hash') = task_payloads.hash
+    )
+    ORDER BY rowid
+'''
+
+# Rows that must stay hot whatever their age
+_UNACKNOWLEDGED_NOTIFICATIONS = '''
+    command = 'notification' AND id > COALESCE(
+        (SELECT cursor FROM agent_notification_cursors c WHERE c.agent = coordination_log.agent), 0)
+'''
+
+
+def ensure_archive_schema(conn: sqlite3.Connection) -> None:
+    for statement in ARCHIVE_SCHEMA_SQL.split(';'):
+        if statement.strip():
+            conn.execute(statement)
+
+
+def default_archive_dir(db_path: str) -> str:
+    return os.path.join(os.path.dirname(os.path.abspath(db_path)), 'archive')
+
+
+class RetentionManager:
+    """Moves old rows to archive partitions and reads them back"""
+
+    def __init__(self, db_path: str, archive_dir: Optional[str] = None):
+        self.db_path = db_path
+        self.archive_dir = archive_dir or default_archive_dir(db_path)
+
+    def archive(
+        self,
+        older_than_days: int,
+        tables: Sequence[str] = RETENTION_TABLES,
+        vacuum: bool = False,
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Archive rows created on days before now - older_than_days
+
+        Args:
+            older_than_days: Whole days of history kept in SQLite
+            tables: Tables to trim (subset of RETENTION_TABLES)
+            vacuum: VACUUM afterwards so the database file shrinks; otherwise
+                freed pages are reused by later writes
+
+        Returns:
+            {'cutoff', 'tables': {table: {'rows', 'partitions'}}, 'rows_archived',
+             'archive_bytes', 'reclaimed_bytes', 'db_bytes_before', 'db_bytes_after',
+             'vacuumed'}; reclaimed_bytes is the drop in live (non-free) database pages.
+            Archiving pm_decision_log adds a task_payloads entry to 'tables'.
+        """
+        unknown = set(tables) - set(RETENTION_TABLES)
+        if unknown:
+            raise ValueError(f"Tables without a retention policy: {sorted(unknown)}")
+        if older_than_days < 0:
+            raise ValueError("older_than_days must not be negative")
+        cutoff = ((now or datetime.now()) - timedelta(days=older_than_days)).date().isoformat()
+        run = time.strftime('%Y%m%dT%H%M%S') + f'-{os.getpid()}'
+
+        report: Dict[str, Any] = {'cutoff': cutoff, 'tables': {}, 'rows_archived': 0, 'archive_bytes': 0}
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        try:
+            with conn:
+                ensure_archive_schema(conn)
+            file_before, live_before = _database_bytes(conn)
+            for table in tables:
+                keep = self._keep_clause(conn, table)
+                days = [row[0] for row in conn.execute(
+                    f"SELECT DISTINCT substr(created_at, 1, 10) FROM {table}"
+                    f" WHERE created_at < ? AND NOT ({keep}) ORDER BY 1", (cutoff,)
+                )]
+                report['tables'][table] = {'rows': 0, 'partitions': 0}
+                if table == 'pm_decision_log':
+                    report['tables']['task_payloads'] = {'rows': 0, 'partitions': 0}
+                for day in days:
+                    for archived_table, rows, file_bytes in self._archive_day(conn, table, day, keep, run):
+                        table_report = report['tables'][archived_table]
+                        table_report['rows'] += rows
+                        table_report['partitions'] += 1
+                        report['rows_archived'] += rows
+                        report['archive_bytes'] += file_bytes
+
+            if vacuum:
+                conn.execute('VACUUM')
+            file_after, live_after = _database_bytes(conn)
+        finally:
+            conn.close()
+
+        report.update(
+            reclaimed_bytes=max(0, live_before - live_after),
+            db_bytes_before=file_before,
+            db_bytes_after=file_after,
+            vacuumed=vacuum
+        )
+        return report
+
+    def _archive_day(self, conn: sqlite3.Connection, table: str, day: str, keep: str, run: str) -> List[Tuple[str, int, int]]:
+        """Move one day of a table into a new partition; returns (table, rows, file bytes) per partition written"""
+        next_day = (datetime.fromisoformat(day) + timedelta(days=1)).date().isoformat()
+        where = f"created_at >= ? AND created_at < ? AND NOT ({keep})"
+        params = (day, next_day)
+        paths = []
+
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            path = self._partition_path(table, day, run, paths)
+            partition = _write_partition(
+                conn.execute(f"SELECT * FROM {table} WHERE {where} ORDER BY created_at, id", params), path
+            )
+            if partition is None:
+                conn.execute('COMMIT')
+                return []
+            written = [(table, path, partition)]
+
+            if table == 'pm_decision_log':
+                # Payloads first: their references are read from the decisions being archived
+                payload_path = self._partition_path('task_payloads', day, run, paths)
+                payloads = _write_partition(
+                    conn.execute(_ARCHIVED_PAYLOADS_SQL.format(where=where), params * 2), payload_path
+                )
+                if payloads is not None:
+                    conn.execute(
+                        "DELETE FROM task_payloads WHERE rowid IN (SELECT value FROM json_each(?))",
+                        (json.dumps(payloads[3]),)
+                    )
+                    written.append(('task_payloads', payload_path, payloads))
+
+            rollups = decision_rollups.archived_rollups(conn, where, params) if table == 'pm_decision_log' else []
+            conn.execute(f"DELETE FROM {table} WHERE {where}", params)
+            decision_rollups.restore_rollups(conn, rollups)
+
+            archived = []
+            for archived_table, archived_path, (rows, min_id, max_id, _) in written:
+                file_bytes = os.path.getsize(archived_path)
+                conn.execute('''
+                    INSERT INTO archive_partitions (table_name, day, path, row_count, min_id, max_id, file_bytes)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', (archived_table, day, os.path.abspath(archived_path), rows, min_id, max_id, file_bytes))
+                archived.append((archived_table, rows, file_bytes))
+            conn.execute('COMMIT')
+            return archived
+        except BaseException:
+            conn.execute('ROLLBACK')
+            for path in paths:
+                if os.path.exists(path):
+                    os.remove(path)
+            raise
+
+    def _partition_path(self, table: str, day: str, run: str, paths: List[str]) -> str:
+        directory = os.path.join(self.archive_dir, table)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{day}.{run}.jsonl.gz")
+        paths.append(path)
+        return path
+
+    def _keep_clause(self, conn: sqlite3.Connection, table: str) -> str:
+        if table != 'coordination_log':
+            return '0'
+        has_cursors = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'agent_notification_cursors'"
+        ).fetchone()
+        return _UNACKNOWLEDGED_NOTIFICATIONS if has_cursors else "command = 'notification'"
+
+    def partitions(self, table: str) -> List[Dict[str, Any]]:
+        """Recorded archive partitions of a table, oldest day first"""
+        return [
+            {'day': day, 'path': path, 'row_count': row_count, 'file_bytes': file_bytes}
+            for day, path, row_count, file_bytes in self._manifest(table)
+        ]
+
+    def iter_archived(
+        self,
+        table: str,
+        first_day: Optional[str] = None,
+        last_day: Optional[str] = None,
+        newest_first: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Archived rows in (created_at, id) order, one day in memory at a time
+
+        Args:
+            first_day, last_day: Inclusive YYYY-MM-DD bounds on the partitions read
+        """
+        by_day: Dict[str, List[str]] = {}
+        for day, path, _, _ in self._manifest(table):
+            if (first_day is None or day >= first_day) and (last_day is None or day <= last_day):
+                by_day.setdefault(day, []).append(path)
+
+        for day in sorted(by_day, reverse=newest_first):
+            rows = []
+            for path in by_day[day]:
+                with gzip.open(path, 'rt', encoding='utf-8') as lines:
+                    rows.extend(json.loads(line) for line in lines)
+            rows.sort(key=_keyset, reverse=newest_first)
+            yield from rows
+
+    def iter_rows(
+        self,
+        table: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        newest_first: bool = False,
+        page_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Rows of a table from archives and SQLite as one (created_at, id) ordered stream
+
+        Args:
+            since, until: created_at range [since, until)
+        """
+        if table not in RETENTION_TABLES:
+            raise ValueError(f"Tables without a retention policy: {table}")
+        low = since.isoformat() if since else None
+        high = until.isoformat() if until else None
+        in_range = lambda row: (low is None or row['created_at'] >= low) and (high is None or row['created_at'] < high)
+
+        archived = (row for row in self.iter_archived(
+            table, low[:10] if low else None, high[:10] if high else None, newest_first
+        ) if in_range(row))
+        yield from heapq.merge(
+            archived, self._iter_hot(table, low, high, newest_first, page_size),
+            key=_keyset, reverse=newest_first
+        )
+
+    def _iter_hot(
+        self, table: str, low: Optional[str], high: Optional[str], newest_first: bool, page_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        clauses, params = ['created_at IS NOT NULL'], []
+        if low is not None:
+            clauses.append('created_at >= ?')
+            params.append(low)
+        if high is not None:
+            clauses.append('created_at < ?')
+            params.append(high)
+        direction, beyond = ('DESC', '<') if newest_first else ('ASC', '>')
+        keyset: Optional[Tuple[Any, Any]] = None
+        while True:
+            where = ' AND '.join(clauses + (['(created_at, id) ' + beyond + ' (?, ?)'] if keyset else []))
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute(
+                    f"SELECT * FROM {table} WHERE {where} ORDER BY created_at {direction}, id {direction} LIMIT ?",
+                    (*params, *(keyset or ()), page_size)
+                )
+                columns = [description[0] for description in cursor.description]
+                rows = [dict(zip(columns, row)) for row in cursor]
+            yield from rows
+            if len(rows) < page_size:
+                return
+            keyset = _keyset(rows[-1])
+
+    def _manifest(self, table: str) -> List[Tuple[str, str, int, int]]:
+        with sqlite3.connect(self.db_path) as conn:
+            if not conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'archive_partitions'"
+            ).fetchone():
+                return []
+            return conn.execute(
+                "SELECT day, path, row_count, file_bytes FROM archive_partitions WHERE table_name = ? ORDER BY day, id",
+                (table,)
+            ).fetchall()
+
+
+def _write_partition(cursor: sqlite3.Cursor, path: str) -> Optional[Tuple[int, int, int, List[int]]]:
+    """Write a query's rows to a fsynced gzip JSON Lines file; returns (rows, min id, max id, ids) or None if empty"""
+    first = cursor.fetchone()
+    if first is None:
+        return None  # no file is created
+    columns = [description[0] for description in cursor.description]
+    id_pos = columns.index('id')
+    ids = []
+    with open(path, 'wb') as raw:
+        with gzip.GzipFile(fileobj=raw, mode='wb') as out:
+            for row in itertools.chain((first,), cursor):
+                # Payload bodies are canonical UTF-8 JSON
+                record = {column: value.decode('utf-8') if isinstance(value, bytes) else value
+                          for column, value in zip(columns, row)}
+                out.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n')
+                ids.append(row[id_pos])
+        raw.flush()
+        os.fsync(raw.fileno())
+    return len(ids), min(ids), max(ids), ids
+
+
+def _keyset(row: Dict[str, Any]) -> Tuple[Any, Any]:
+    return row['created_at'], row['id']
+
+
+def _database_bytes(conn: sqlite3.Connection) -> Tuple[int, int]:
+    """(file bytes, live bytes): allocated pages and pages not on the freelist"""
+    page_size = conn.execute('PRAGMA page_size').fetchone()[0]
+    page_count = conn.execute('PRAGMA page_count').fetchone()[0]
+    free_pages = conn.execute('PRAGMA freelist_count').fetchone()[0]
+    return page_count * page_size, (page_count - free_pages) * page_size
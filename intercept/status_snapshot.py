@@ -0,0 +1,120 @@
+"""
+BMAD Auto System Status Snapshot
+Versioned in-process cache behind PMCoordinator.get_system_status
+
+The PM dashboard polls system status every second from several tabs. The
+snapshot is loaded from coordination.db once, then patched in place by the
+coordinator's own writes (assignments, load changes, notifications, workflow
+registration and completion). Each change that alters the visible status bumps
+the version. A short TTL reload picks up writes from other processes; it only
+bumps the version when the reloaded content actually differs.
+
+Callers pass the last version they saw and get a small "not modified" answer
+when nothing changed.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+
+class SystemStatusSnapshot:
+    """Versioned, incrementally updated system status"""
+
+    def __init__(self, loader: Callable[[], Dict[str, Any]], ttl_seconds: float = 2.0):
+        self.loader = loader
+        self.ttl_seconds = ttl_seconds
+        self.version = 0
+        self._status: Optional[Dict[str, Any]] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+        # Held across a reload so concurrent readers of a stale snapshot load it once;
+        # separate from _lock so incremental updates do not wait on the database
+        self._reload_lock = threading.Lock()
+
+    def get(self, if_version: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Current status, or a not-modified marker when if_version is current
+
+        Raises whatever the loader raises when a (re)load is needed and fails.
+        """
+        self._refresh_if_stale()
+        with self._lock:
+            timestamp = datetime.now().isoformat()
+            if if_version is not None and if_version == self.version:
+                return {'version': self.version, 'not_modified': True, 'timestamp': timestamp}
+            return {
+                **self._status,
+                'agents': {
+                    agent: {**info, 'capabilities': list(info.get('capabilities', []))}
+                    for agent, info in self._status['agents'].items()
+                },
+                'version': self.version,
+                'timestamp': timestamp
+            }
+
+    def invalidate(self) -> None:
+        """Force a reload on the next read"""
+        with self._lock:
+            self._loaded_at = 0.0
+
+    # Incremental updates
+
+    def update_agent(
+        self,
+        agent_name: str,
+        fields: Dict[str, Any],
+        defaults: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Patch one agent's fields; unknown agents are added from defaults when given"""
+        with self._lock:
+            if self._status is None:
+                return
+            info = self._status['agents'].get(agent_name)
+            if info is None:
+                if defaults is None:
+                    return
+                info = self._status['agents'][agent_name] = dict(defaults)
+            changed = {key: value for key, value in fields.items() if info.get(key) != value}
+            if changed:
+                info.update(changed)
+                self.version += 1
+
+    def increment_agent(self, agent_name: str, field: str, amount: int = 1) -> None:
+        """Add to a counter of a known agent"""
+        with self._lock:
+            if self._status is None or amount == 0:
+                return
+            info = self._status['agents'].get(agent_name)
+            if info is None:
+                return
+            info[field] = (info.get(field) or 0) + amount
+            self.version += 1
+
+    def adjust(self, field: str, amount: int) -> None:
+        """Adjust a top-level counter such as active_workflows"""
+        with self._lock:
+            if self._status is None or amount == 0:
+                return
+            self._status[field] = self._status.get(field, 0) + amount
+            self.version += 1
+
+    # Loading
+
+    def _is_fresh(self) -> bool:
+        with self._lock:
+            return self._status is not None and time.monotonic() - self._loaded_at < self.ttl_seconds
+
+    def _refresh_if_stale(self) -> None:
+        if self._is_fresh():
+            return
+        with self._reload_lock:
+            if self._is_fresh():
+                return  # another reader reloaded while this one waited
+            status = self.loader()
+            with self._lock:
+                if status != self._status:
+                    self._status = status
+                    self.version += 1
+                self._loaded_at = time.monotonic()
@@ -0,0 +1,200 @@
+"""
+BMAD Auto Web Bundle Index
+Byte-offset index and zero-copy access to resources embedded in web bundles
+
+Each .bmad-core/web-bundles/**/*.txt bundle concatenates many resources, each
+between marker lines:
+
+    ==================== START: .bmad-core/tasks/create-doc.md ====================
+    ...resource...
+    ==================== END: .bmad-core/tasks/create-doc.md ====================
+
+build() scans every bundle once and writes a JSON sidecar per bundle with the
+byte range of every resource and the bundle's (mtime_ns, size, inode). Sidecars
+live under index_dir, never inside .bmad-core. resource() maps the bundle and
+returns a memoryview slice of the mapping, so a fetch reads only the pages of
+that resource and copies nothing. A bundle whose stat no longer matches its
+sidecar is re-indexed on its next access.
+
+Only whole-line markers count: bundle instructions quote example markers
+inline. Views stay valid until close().
+"""
+
+import json
+import mmap
+import os
+import re
+import threading
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_BUNDLES_DIR = '.bmad-core/web-bundles'
+DEFAULT_INDEX_DIR = '.bmad-auto/web-bundle-index'
+INDEX_VERSION = 1
+
+_MARKER = re.compile(rb'^={20} (START|END): (\S+) ={20}\r?$', re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class _BundleIndex:
+    stat: Tuple[int, int, int]  # (mtime_ns, size, inode)
+    sections: Dict[str, Tuple[int, int]]  # resource path -> [start, end) byte offsets
+
+
+def _bundle_stat(path: Path) -> Tuple[int, int, int]:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def scan_sections(data) -> Dict[str, Tuple[int, int]]:
+    """Byte ranges of the resources in a bundle's bytes (or mmap), between marker lines"""
+    sections: Dict[str, Tuple[int, int]] = {}
+    open_sections: Dict[bytes, int] = {}
+    for match in _MARKER.finditer(data):
+        kind, resource = match.group(1), match.group(2)
+        if kind == b'START':
+            # Content starts after the marker's newline
+            open_sections[resource] = match.end() + 1
+        elif resource in open_sections:
+            start = open_sections.pop(resource)
+            sections.setdefault(resource.decode('utf-8'), (start, max(start, match.start())))
+    return sections
+
+
+class WebBundleIndex:
+    """
+    Random access to resources inside web bundles
+
+    Thread-safe. Bundle names are paths relative to bundles_dir without .txt,
+    e.g. 'agents/dev' or 'teams/team-fullstack'.
+    """
+
+    def __init__(self, bundles_dir: str = DEFAULT_BUNDLES_DIR, index_dir: Optional[str] = None):
+        self.bundles_dir = Path(bundles_dir)
+        self.index_dir = Path(index_dir or DEFAULT_INDEX_DIR)
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._indexes: Dict[str, _BundleIndex] = {}
+        self._maps: Dict[str, Tuple[Tuple[int, int, int], mmap.mmap]] = {}
+
+    def bundles(self) -> List[str]:
+        """Names of all bundles under bundles_dir"""
+        return sorted(path.relative_to(self.bundles_dir).with_suffix('').as_posix()
+                      for path in self.bundles_dir.rglob('*.txt'))
+
+    def build(self, force: bool = False) -> Dict[str, int]:
+        """
+        Index every bundle whose sidecar is missing or stale (all of them with force)
+
+        Returns:
+            {bundle: sections indexed} for the bundles (re)indexed
+        """
+        indexed = {}
+        with self._lock:
+            for bundle in self.bundles():
+                if force or self._read_sidecar(bundle) is None:
+                    indexed[bundle] = len(self._index_bundle(bundle).sections)
+        return indexed
+
+    def sections(self, bundle: str) -> List[str]:
+        """Resource paths embedded in a bundle, in file order"""
+        with self._lock:
+            index = self._index(bundle)
+            return sorted(index.sections, key=index.sections.get)
+
+    def resource(self, bundle: str, resource: str) -> memoryview:
+        """
+        Zero-copy view of one embedded resource's bytes
+
+        Raises:
+            KeyError: if the bundle does not embed the resource
+            FileNotFoundError: if the bundle does not exist
+        """
+        with self._lock:
+            index = self._index(bundle)
+            start, end = index.sections[resource]
+            return memoryview(self._map(bundle, index.stat))[start:end]
+
+    def resource_text(self, bundle: str, resource: str) -> str:
+        """Decoded copy of one embedded resource"""
+        with self.resource(bundle, resource) as view:
+            return str(view, 'utf-8')
+
+    def close(self) -> None:
+        """Unmap every bundle; views handed out must be released first"""
+        with self._lock:
+            for _, mapped in self._maps.values():
+                try:
+                    mapped.close()
+                except BufferError:
+                    pass  # a view is still held: the mapping goes when it is collected
+            self._maps.clear()
+
+    def _bundle_path(self, bundle: str) -> Path:
+        return self.bundles_dir / f"{bundle}.txt"
+
+    def _sidecar_path(self, bundle: str) -> Path:
+        return self.index_dir / f"{bundle}.json"
+
+    def _index(self, bundle: str) -> _BundleIndex:
+        stat = _bundle_stat(self._bundle_path(bundle))
+        index = self._indexes.get(bundle)
+        if index is not None and index.stat == stat:
+            return index
+        index = self._read_sidecar(bundle, stat)
+        if index is None:
+            index = self._index_bundle(bundle)
+        self._indexes[bundle] = index
+        return index
+
+    def _read_sidecar(self, bundle: str, stat: Optional[Tuple[int, int, int]] = None) -> Optional[_BundleIndex]:
+        """Sidecar index if it matches the bundle as it is now"""
+        try:
+            with open(self._sidecar_path(bundle), 'r', encoding='utf-8') as f:
+                sidecar = json.load(f)
+        except (OSError, ValueError):
+            return None
+        stat = stat or _bundle_stat(self._bundle_path(bundle))
+        if sidecar.get('version') != INDEX_VERSION or tuple(sidecar.get('stat', ())) != stat:
+            return None
+        return _BundleIndex(stat=stat, sections={path: tuple(span) for path, span in sidecar['sections'].items()})
+
+    def _index_bundle(self, bundle: str) -> _BundleIndex:
+        """Scan a bundle once and write its sidecar"""
+        path = self._bundle_path(bundle)
+        stat = _bundle_stat(path)
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if stat[1] else None
+        try:
+            sections = scan_sections(mapped) if mapped is not None else {}
+        finally:
+            if mapped is not None:
+                mapped.close()
+
+        index = _BundleIndex(stat=stat, sections=sections)
+        sidecar_path = self._sidecar_path(bundle)
+        sidecar_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = sidecar_path.with_name(f"{sidecar_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': INDEX_VERSION, 'bundle': bundle, 'stat': list(stat),
+                       'sections': {resource: list(span) for resource, span in sections.items()}}, f)
+        os.replace(tmp_path, sidecar_path)
+        self._indexes[bundle] = index
+        self.logger.info(f"Indexed {len(sections)} resources in web bundle {bundle}")
+        return index
+
+    def _map(self, bundle: str, stat: Tuple[int, int, int]) -> mmap.mmap:
+        mapped = self._maps.get(bundle)
+        if mapped is not None and mapped[0] == stat:
+            return mapped[1]
+        if mapped is not None:
+            try:
+                mapped[1].close()
+            except BufferError:
+                pass  # replaced bundle: old views keep the old mapping alive
+        with open(self._bundle_path(bundle), 'rb') as f:
+            new_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps[bundle] = (stat, new_map)
+        return new_map
@@ -0,0 +1,161 @@
+"""
+BMAD Auto Workflow Registry
+Bounded in-memory view of active PM workflows backed by workflow_state
+
+PMCoordinator used to keep every registered workflow in a plain dict for the life
+of the process. The registry keeps at most `max_entries` recently used active
+workflows, evicting least recently used entries first and any entry untouched for
+`ttl_seconds`. Workflows leaving the 'active' status are pruned immediately.
+
+A lookup that misses memory reloads the workflow from workflow_state, so eviction
+never loses information; it only costs a primary-key read. Counts of active
+workflows must therefore come from the database, not from len() of the registry.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+class WorkflowRegistry:
+    """LRU/TTL-bounded cache of workflow entries with workflow_state read-through"""
+
+    def __init__(
+        self,
+        db_path: str,
+        decode_breakdown: Callable[[Dict[str, Any]], Any],  # workflow context -> TaskBreakdown
+        max_entries: int = 1024,
+        ttl_seconds: Optional[float] = 3600.0
+    ):
+        self.db_path = db_path
+        self.decode_breakdown = decode_breakdown
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.logger = logging.getLogger(__name__)
+
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._touched: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # Mapping-style access
+
+    def __setitem__(self, workflow_id: str, entry: Dict[str, Any]) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._entries[workflow_id] = entry
+            self._entries.move_to_end(workflow_id)
+            self._touched[workflow_id] = now
+            self._evict(now)
+
+    def __getitem__(self, workflow_id: str) -> Dict[str, Any]:
+        entry = self.get(workflow_id)
+        if entry is None:
+            raise KeyError(workflow_id)
+        return entry
+
+    def __contains__(self, workflow_id: object) -> bool:
+        return isinstance(workflow_id, str) and self.get(workflow_id) is not None
+
+    def __len__(self) -> int:
+        """Number of workflows resident in memory (not the active total)"""
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def get(self, workflow_id: str, default: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Return a workflow entry, reloading it from workflow_state on a miss"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(workflow_id)
+            if entry is not None and self._expired(workflow_id, now):
+                self._drop(workflow_id)
+                self.evictions += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(workflow_id)
+                self._touched[workflow_id] = now
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        entry = self._load(workflow_id)
+        if entry is None:
+            return default
+        if entry['status'] == 'active':
+            self[workflow_id] = entry
+        return entry
+
+    def discard(self, workflow_id: str) -> None:
+        """Prune a workflow from memory, e.g. once it leaves the active state"""
+        with self._lock:
+            self._drop(workflow_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'resident': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+    # Eviction
+
+    def _expired(self, workflow_id: str, now: float) -> bool:
+        return self.ttl_seconds is not None and now - self._touched[workflow_id] > self.ttl_seconds
+
+    def _evict(self, now: float) -> None:
+        # Entries are in access order, so expired ones sit at the front
+        while self._entries:
+            oldest = next(iter(self._entries))
+            if len(self._entries) <= self.max_entries and not self._expired(oldest, now):
+                break
+            self._drop(oldest)
+            self.evictions += 1
+
+    def _drop(self, workflow_id: str) -> None:
+        self._entries.pop(workflow_id, None)
+        self._touched.pop(workflow_id, None)
+
+    # Read-through
+
+    def _load(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT status, context, created_at FROM workflow_state WHERE id = ?",
+                    (workflow_id,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to load workflow {workflow_id}: {e}")
+            return None
+        if row is None:
+            return None
+
+        status, context, created_at = row
+        try:
+            context = json.loads(context or '{}')
+            return {
+                'task_breakdown': self.decode_breakdown(context),
+                'assignments': context.get('assignments', {}),
+                'status': status,
+                'created_at': datetime.fromisoformat(created_at) if created_at else None
+            }
+        except (KeyError, TypeError, ValueError) as e:
+            self.logger.error(f"Workflow {workflow_id} has an unreadable context: {e}")
+            return None
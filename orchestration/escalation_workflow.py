@@ -15,6 +15,8 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
 
+from database.id_generator import new_id
+
 logger = logging.getLogger(__name__)
 
 
@@ -113,7 +115,7 @@ class EscalationWorkflowManager:
 
     def create_escalation(self, deliverable_id: str, issue_description: str, level: EscalationLevel, requested_by: str) -> str:
         """Create new escalation request"""
-        escalation_id = f"ESC_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{deliverable_id[:8]}"
+        escalation_id = f"{new_id('ESC')}_{deliverable_id[:8]}"
 
         # Calculate resolution target based on level
         target_hours = self._get_target_resolution_hours(level)
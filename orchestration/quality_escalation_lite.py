@@ -14,6 +14,8 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 
+from database.id_generator import new_id
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,7 +56,7 @@ class QualityEscalationLite:
     def create_escalation(self, deliverable_id: str, quality_score: float, description: str) -> str:
         """Create new escalation based on quality score"""
         level = self._determine_level(quality_score)
-        escalation_id = f"ESC_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{deliverable_id[:8]}"
+        escalation_id = f"{new_id('ESC')}_{deliverable_id[:8]}"
 
         escalation = SimpleEscalation(
             escalation_id=escalation_id,
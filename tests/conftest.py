@@ -0,0 +1,34 @@
+"""
+Shared test fixtures for BMAD Auto
+Provides a throwaway coordination.db with core + extension schema applied
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# Add repository root to path for imports
+sys.path.insert(0, str(REPO_ROOT))
+
+SCHEMA_FILES = [
+    REPO_ROOT / "intercept" / "coordination_core.sql",
+    REPO_ROOT / "intercept" / "coordination_extensions.sql",
+]
+
+
+def create_coordination_db(db_path: Path) -> str:
+    """Create a coordination.db with all schema files applied"""
+    with sqlite3.connect(str(db_path)) as conn:
+        for schema_file in SCHEMA_FILES:
+            conn.executescript(schema_file.read_text())
+    return str(db_path)
+
+
+@pytest.fixture
+def coordination_db(tmp_path):
+    """Path to a fresh coordination.db for a single test"""
+    return create_coordination_db(tmp_path / "coordination.db")
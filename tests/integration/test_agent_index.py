@@ -0,0 +1,108 @@
+"""
+Tests for AgentCapabilityIndex
+The index must pick exactly the agent the original linear scan picked
+"""
+
+import random
+from datetime import datetime
+
+from intercept.agent_index import AgentCapabilityIndex
+from intercept.pm_coordinator import AgentCapability, PMCoordinator
+
+CAPABILITIES = ['code_implementation', 'quality_validation', 'system_design',
+                'research', 'user_experience', 'coordination', 'testing']
+
+
+def linear_best_agent(agents, required_capabilities):
+    """Reference implementation: the original full scan"""
+    best_agent = None
+    best_score = -1
+    for agent in agents:
+        match_score = len(set(required_capabilities) & set(agent.capabilities))
+        if match_score == 0:
+            continue
+        performance_score = agent.success_rate - (agent.avg_response_time / 10)
+        total_score = match_score + (performance_score - agent.current_load * 0.5)
+        if total_score > best_score:
+            best_score = total_score
+            best_agent = agent.agent_name
+    return best_agent
+
+
+def make_agent(name, rng, capabilities=None, identical=False):
+    return AgentCapability(
+        agent_name=name,
+        capabilities=capabilities or rng.sample(CAPABILITIES, rng.randint(1, 3)),
+        current_load=0.0 if identical else rng.choice([0.0, 0.1, 0.5, 1.2, 3.0]),
+        avg_response_time=2.0 if identical else rng.uniform(0.5, 4.0),
+        success_rate=0.9 if identical else rng.uniform(0.7, 1.0),
+        last_activity=datetime.now()
+    )
+
+
+class TestAgentCapabilityIndex:
+
+    def test_matches_linear_scan_with_load_changes(self):
+        rng = random.Random(7)
+        agents = [make_agent(f"agent_{i}", rng) for i in range(200)]
+        index = AgentCapabilityIndex(agents)
+        by_name = {agent.agent_name: agent for agent in agents}
+
+        for _ in range(500):
+            required = rng.sample(CAPABILITIES, rng.randint(1, 3))
+            expected = linear_best_agent(agents, required)
+            assert index.best_agent(required) == expected
+
+            if expected:
+                by_name[expected].current_load += 0.1
+                index.update(by_name[expected])
+
+    def test_ties_go_to_first_registered_agent(self):
+        rng = random.Random(1)
+        agents = [make_agent(f"clone_{i}", rng, ['code_implementation'], identical=True) for i in range(50)]
+        index = AgentCapabilityIndex(agents)
+
+        assert index.best_agent(['code_implementation']) == 'clone_0'
+
+        agents[0].current_load += 0.1
+        index.update(agents[0])
+        assert index.best_agent(['code_implementation']) == 'clone_1'
+
+    def test_unknown_capability_returns_none(self):
+        index = AgentCapabilityIndex([make_agent("a", random.Random(0), ['research'])])
+        assert index.best_agent(['quantum_computing']) is None
+
+    def test_saturated_agents_are_not_assigned(self):
+        agent = make_agent("tired", random.Random(0), ['research'], identical=True)
+        agent.current_load = 10.0
+        assert AgentCapabilityIndex([agent]).best_agent(['research']) is None
+
+    def test_removed_agent_is_skipped(self):
+        rng = random.Random(3)
+        first = make_agent("first", rng, ['research'], identical=True)
+        second = make_agent("second", rng, ['research'], identical=True)
+        index = AgentCapabilityIndex([first, second])
+
+        index.remove("first")
+        assert index.best_agent(['research']) == 'second'
+        assert "first" not in index
+
+
+class TestCoordinatorAgentRegistration:
+
+    def test_registered_agent_receives_work(self, coordination_db):
+        coordinator = PMCoordinator(coordination_db, load_flush_interval=None)
+        coordinator.register_agent(AgentCapability(
+            agent_name='ace_researcher',
+            capabilities=['research'],
+            current_load=0.0,
+            avg_response_time=0.1,
+            success_rate=1.0,
+            last_activity=datetime.now()
+        ))
+
+        assert coordinator._find_best_agent(['research']) == 'ace_researcher'
+
+        coordinator.unregister_agent('ace_researcher')
+        assert coordinator._find_best_agent(['research']) == 'mary_analyst'
+        coordinator.close()
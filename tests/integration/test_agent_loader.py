@@ -0,0 +1,399 @@
+"""
+Integration tests for AgentExtensionLoader
+Loads agents from a throwaway .bmad-core tree
+"""
+
+import os
+import threading
+
+import pytest
+
+from intercept.agent_definition import AgentDefinition
+from intercept.agent_loader import AgentExtensionLoader, AgentLoadError, BMadCorePreservationError
+
+EXTENSION_YAML = """
+agent_name: pm
+extension_type: orchestration
+spec_kit_enabled: true
+extension_config:
+  capabilities: [autonomous_task_breakdown]
+  spec_kit_commands: [/specify]
+"""
+
+QA_AGENT = """# qa
+
+```yaml
+agent:
+  name: Quinn
+  id: qa
+  title: Test Architect
+persona:
+  role: Test architect
+  core_principles:
+    - Risk-based testing
+commands:
+  - help: Show numbered list of the following commands
+  - review {story}: run the review-story task
+  - gate {story}: Write/update quality gate decision via qa-gate.md
+  - trace:
+      - step: map requirements with trace-requirements.md
+  - exit: Say goodbye
+dependencies:
+  tasks:
+    - review-story.md
+    - qa-gate.md
+    - trace-requirements.md
+  templates:
+    - qa-gate-tmpl.yaml
+```
+"""
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """.bmad-core with pm and dev agents; only pm has an extension"""
+    core = tmp_path / ".bmad-core" / "agents"
+    core.mkdir(parents=True)
+    (core / "pm.md").write_text("# pm\n\nProduct manager\n")
+    (core / "dev.md").write_text("# dev\n\nDeveloper\n")
+    auto = tmp_path / "auto" / "agents"
+    auto.mkdir(parents=True)
+    (auto / "pm_extension.yaml").write_text(EXTENSION_YAML)
+    return tmp_path
+
+
+@pytest.fixture
+def loader(tree):
+    return AgentExtensionLoader(str(tree / ".bmad-core"), str(tree / "auto"))
+
+
+def _touch(path, delta_ns=1_000_000):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + delta_ns))
+
+
+class TestStatCache:
+    """Stat-keyed file, extension and merged-config caches"""
+
+    def test_unchanged_files_are_not_reread(self, loader, monkeypatch):
+        first = loader.load_agent_with_extensions("pm")
+        assert first['spec_kit_commands'] == ['/specify']
+
+        import builtins
+        opened = []
+        real_open = builtins.open
+        monkeypatch.setattr(builtins, "open", lambda *a, **k: opened.append(a[0]) or real_open(*a, **k))
+        for _ in range(10):
+            agent = loader.load_agent_with_extensions("pm", {'task': 't'})
+        assert opened == []
+        assert agent['task_context'] == {'task': 't'}
+        assert 'task_context' not in loader.load_agent_with_extensions("pm")
+
+        stats = loader.cache_stats()
+        assert stats['merged'] == {'hits': 11, 'misses': 1, 'hit_rate': round(11 / 12, 4)}
+        assert stats['file']['misses'] == 1
+
+    def test_base_change_is_rehashed_and_rejected(self, loader, tree):
+        loader.load_agent_with_extensions("pm")
+        agent_file = tree / ".bmad-core" / "agents" / "pm.md"
+
+        # A touch changes the stat key; same contents still pass integrity
+        _touch(agent_file)
+        assert loader.load_agent_with_extensions("pm")['base_definition'] == "# pm\n\nProduct manager\n"
+        assert loader.cache_stats()['file']['misses'] == 2
+
+        agent_file.write_text("# pm\n\nEdited\n")
+        with pytest.raises(BMadCorePreservationError):
+            loader.load_agent_with_extensions("pm")
+
+    def test_extension_edit_invalidates_merged_config(self, loader, tree):
+        assert loader.load_agent_with_extensions("pm")['enhanced_capabilities'] == ['autonomous_task_breakdown']
+        extension_file = tree / "auto" / "agents" / "pm_extension.yaml"
+        extension_file.write_text(EXTENSION_YAML.replace("autonomous_task_breakdown", "quality_gate_management"))
+        _touch(extension_file)
+
+        assert loader.load_agent_with_extensions("pm")['enhanced_capabilities'] == ['quality_gate_management']
+        assert loader.cache_stats()['extension'] == {'hits': 0, 'misses': 2, 'hit_rate': 0.0}
+
+    def test_agent_without_extension_and_missing_agent(self, loader):
+        for _ in range(3):
+            assert loader.load_agent_with_extensions("dev")['extension_type'] == 'basic'
+        assert loader.cache_stats()['extension']['hits'] == 2
+        with pytest.raises(AgentLoadError):
+            loader.load_agent_with_extensions("nobody")
+
+    def test_reload_extension_forces_reread(self, loader):
+        loader.load_agent_with_extensions("pm")
+        assert loader.reload_extension("pm") is True
+        assert loader.cache_stats()['file']['misses'] == 2
+
+
+class TestPreload:
+    """Thread-pool warm-up and the marshal snapshot"""
+
+    def _loader(self, tree, snapshot):
+        return AgentExtensionLoader(str(tree / ".bmad-core"), str(tree / "auto"), snapshot_path=str(snapshot))
+
+    def test_preload_then_restore_from_snapshot(self, tree, tmp_path, monkeypatch):
+        snapshot = tmp_path / "cache" / "agents.snapshot"
+        first = self._loader(tree, snapshot).preload_all()
+        assert first['loaded'] == ['dev', 'pm'] and first['restored'] == [] and first['snapshot_written']
+        expected = self._loader(tree, tmp_path / "unused").load_agent_with_extensions("pm")
+
+        import builtins
+        opened = []
+        real_open = builtins.open
+        monkeypatch.setattr(builtins, "open", lambda *a, **k: opened.append(a[0]) or real_open(*a, **k))
+        loader = self._loader(tree, snapshot)
+        second = loader.preload_all()
+        agent = loader.load_agent_with_extensions("pm")
+
+        assert second['restored'] == ['dev', 'pm'] and second['loaded'] == []
+        assert second['snapshot_written'] is False
+        assert opened == []  # the snapshot is read with Path.read_bytes, agents not at all
+        assert {k: v for k, v in agent.items() if k != 'loaded_at'} == \
+            {k: v for k, v in expected.items() if k != 'loaded_at'}
+
+    def test_changed_files_are_reloaded(self, tree, tmp_path):
+        snapshot = tmp_path / "agents.snapshot"
+        self._loader(tree, snapshot).preload_all()
+
+        _touch(tree / ".bmad-core" / "agents" / "dev.md")  # same contents: hash still matches
+        (tree / "auto" / "agents" / "pm_extension.yaml").write_text(EXTENSION_YAML.replace("/specify", "/plan"))
+        (tree / ".bmad-core" / "agents" / "qa.md").write_text("# qa\n")
+
+        loader = self._loader(tree, snapshot)
+        result = loader.preload_all()
+        assert result['restored'] == ['dev']
+        assert sorted(result['loaded']) == ['pm', 'qa'] and result['snapshot_written']
+        assert loader.load_agent_with_extensions("pm")['spec_kit_commands'] == ['/plan']
+        assert self._loader(tree, snapshot).preload_all()['restored'] == ['dev', 'pm', 'qa']
+
+    def test_unmarshallable_extension_is_left_out(self, tree, tmp_path):
+        (tree / "auto" / "agents" / "dev_extension.yaml").write_text(
+            "extension_type: basic\nextension_config:\n  capabilities: [coding]\n  released: 2025-09-29\n"
+        )
+        snapshot = tmp_path / "agents.snapshot"
+        first = self._loader(tree, snapshot).preload_all()
+        assert first['loaded'] == ['dev', 'pm'] and first['failed'] == {} and first['snapshot_written']
+
+        loader = self._loader(tree, snapshot)
+        second = loader.preload_all()
+        assert second['restored'] == ['pm'] and second['loaded'] == ['dev']
+        assert loader.load_agent_with_extensions("dev")['enhanced_capabilities'] == ['coding']
+
+    def test_corrupt_snapshot_is_ignored(self, tree, tmp_path):
+        snapshot = tmp_path / "agents.snapshot"
+        snapshot.write_bytes(b"BMADAGT1\x01\x00\x00\x00garbage")
+        result = self._loader(tree, snapshot).preload_all()
+        assert result['loaded'] == ['dev', 'pm'] and result['failed'] == {}
+        assert self._loader(tree, snapshot).preload_all()['restored'] == ['dev', 'pm']
+
+
+class TestWatcher:
+    """Change detection that lets unchanged agents skip the filesystem (polling backend)"""
+
+    @pytest.fixture
+    def watcher(self, loader):
+        # Long interval: tests drive scans with poll() unless they wait on the thread
+        watcher = loader.watch(poll_interval=3600, use_inotify=False)
+        yield watcher
+        loader.unwatch()
+
+    def test_unchanged_agents_skip_stat(self, loader, watcher, monkeypatch):
+        assert watcher.backend == 'polling' and loader.watcher is watcher
+        loader.load_agent_with_extensions("pm")
+
+        stats = []
+        real_stat = os.stat
+        monkeypatch.setattr(os, "stat", lambda *a, **k: stats.append(a[0]) or real_stat(*a, **k))
+        for _ in range(10):
+            agent = loader.load_agent_with_extensions("pm", {'task': 't'})
+        assert stats == []
+        assert agent['task_context'] == {'task': 't'}
+        assert watcher.poll() == []
+
+    def test_extension_change_invalidates_only_that_agent(self, loader, watcher, tree):
+        events = []
+        watcher.subscribe(events.append)
+        loader.load_agent_with_extensions("pm")
+        dev = loader.load_agent_with_extensions("dev")
+
+        extension_file = tree / "auto" / "agents" / "pm_extension.yaml"
+        extension_file.write_text(EXTENSION_YAML.replace("/specify", "/plan"))
+        _touch(extension_file)
+        changed = watcher.poll()
+
+        assert [(e.agent_name, e.kind, e.change, e.valid) for e in changed] == [('pm', 'extension', 'modified', True)]
+        assert events == changed
+        assert loader.load_agent_with_extensions("pm")['spec_kit_commands'] == ['/plan']
+        assert loader._hot['dev'][0]['base_definition'] == dev['base_definition']
+
+    def test_validation_results_are_maintained(self, loader, watcher, tree, monkeypatch):
+        assert loader.validate_all_extensions() == {'pm': True}
+
+        extension_file = tree / "auto" / "agents" / "dev_extension.yaml"
+        extension_file.write_text("extension_type: basic\nextension_config: {}\n")
+        [created] = watcher.poll()
+        assert (created.agent_name, created.change, created.valid) == ('dev', 'created', False)
+
+        from pathlib import Path
+        monkeypatch.setattr(Path, "glob", lambda *a: pytest.fail("validate_all_extensions re-globbed"))
+        assert loader.validate_all_extensions() == {'pm': True, 'dev': False}
+
+        extension_file.unlink()
+        [deleted] = watcher.poll()
+        assert (deleted.change, deleted.valid) == ('deleted', None)
+        assert loader.validate_all_extensions() == {'pm': True}
+
+    def test_base_edit_is_reported_and_rejected(self, loader, watcher, tree):
+        loader.load_agent_with_extensions("pm")
+        (tree / ".bmad-core" / "agents" / "pm.md").write_text("# pm\n\nEdited in place\n")
+
+        [event] = watcher.poll()
+        assert (event.agent_name, event.kind, event.change, event.valid) == ('pm', 'base', 'modified', False)
+        with pytest.raises(BMadCorePreservationError):
+            loader.load_agent_with_extensions("pm")
+
+    def test_background_thread_publishes_changes(self, loader, tree):
+        watcher = loader.watch(poll_interval=0.02, use_inotify=False)
+        seen = threading.Event()
+        watcher.subscribe(lambda event: event.agent_name == 'qa' and seen.set())
+        try:
+            (tree / ".bmad-core" / "agents" / "qa.md").write_text("# qa\n")
+            assert seen.wait(5)
+            assert loader.load_agent_with_extensions("qa")['extension_type'] == 'basic'
+        finally:
+            loader.unwatch()
+        assert loader.watcher is None and loader._hot == {}
+
+    def test_invalidation_during_load_is_not_overwritten(self, loader, watcher, monkeypatch):
+        # The watcher thread invalidates pm after this load read its files...
+        real_merge = loader._merge_configurations
+        def merge_then_invalidate(*args):
+            merged = real_merge(*args)
+            loader.clear_cache("pm")
+            return merged
+        monkeypatch.setattr(loader, "_merge_configurations", merge_then_invalidate)
+        loader.load_agent_with_extensions("pm")
+        assert 'pm' not in loader._hot
+
+    def test_invalidation_racing_hot_store_wins(self, loader, watcher):
+        # ...or between this load's generation check and its store
+        invalidations = []
+
+        class RacingHot(dict):
+            def __setitem__(self, key, value):
+                invalidation = threading.Thread(target=loader.clear_cache, args=(key,))
+                invalidation.start()
+                invalidation.join(0.2)
+                invalidations.append(invalidation)
+                super().__setitem__(key, value)
+
+        loader._hot = RacingHot()
+        loader.load_agent_with_extensions("pm")
+        for invalidation in invalidations:
+            invalidation.join()
+        assert invalidations and 'pm' not in loader._hot
+
+    def test_concurrent_loads_and_invalidations(self, loader, watcher):
+        errors = []
+        stop = threading.Event()
+
+        def load():
+            try:
+                while not stop.is_set():
+                    for agent_name in ("pm", "dev"):
+                        loader.load_agent_with_extensions(agent_name)
+                        loader.validate_all_extensions()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=load) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for _ in range(300):
+            loader.clear_cache("pm")
+            loader.clear_cache()
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert loader.load_agent_with_extensions("pm")['spec_kit_commands'] == ['/specify']
+
+    def test_stats_and_cache_stores_hold_the_lock(self, loader, watcher):
+        loader.load_agent_with_extensions("pm")
+        threads = [
+            threading.Thread(target=lambda: [loader.load_agent_with_extensions("pm") for _ in range(2000)])
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        merged = loader.cache_stats()['merged']
+        assert merged['hits'] + merged['misses'] == 16001
+
+        # A store waits for an invalidation in progress on the watcher thread
+        loader.clear_cache()
+        with loader._lock:
+            store = threading.Thread(target=loader._load_extension_config, args=("dev",))
+            store.start()
+            store.join(0.2)
+            assert store.is_alive()
+        store.join()
+        assert loader._extension_cache
+
+
+class TestAgentDefinition:
+    """YAML block parsed once into an indexed, immutable definition"""
+
+    def test_commands_and_dependencies_are_indexed(self):
+        definition = AgentDefinition.parse("qa", QA_AGENT)
+        assert (definition.name, definition.title) == ("Quinn", "Test Architect")
+        assert list(definition.commands) == ['help', 'review', 'gate', 'trace', 'exit']
+        assert definition.command("*review").args == ('story',)
+        assert definition.command("review").references == ('review-story.md',)
+        assert definition.command("gate").references == ('qa-gate.md',)
+        assert definition.command("trace").description == ''
+        assert definition.command("trace").references == ('trace-requirements.md',)
+        assert definition.depends_on('tasks') == ('review-story.md', 'qa-gate.md', 'trace-requirements.md')
+        assert definition.depends_on('checklists') == ()
+        assert definition.dependency_types['qa-gate-tmpl.yaml'] == ('templates',)
+        assert definition.persona['core_principles'] == ('Risk-based testing',)
+        with pytest.raises(TypeError):
+            definition.dependencies['tasks'] = ()
+        with pytest.raises(LookupError):
+            definition.raw_text
+
+    def test_file_without_yaml_block_and_malformed_block(self):
+        assert AgentDefinition.parse("pm", "# pm\n").commands == {}
+        with pytest.raises(ValueError):
+            AgentDefinition.parse("pm", "```yaml\ncommands: [unclosed\n```\n")
+
+    def test_loader_parses_once_and_reads_text_lazily(self, loader, tree):
+        (tree / ".bmad-core" / "agents" / "qa.md").write_text(QA_AGENT)
+        definition = loader.agent_definition("qa")
+        assert loader.agent_definition("qa") is definition
+        assert loader.cache_stats()['definition'] == {'hits': 1, 'misses': 1, 'hit_rate': 0.5}
+
+        loader.load_agent_with_extensions("qa")
+        assert loader.agent_definition("qa") is definition
+        assert loader.cache_stats()['definition']['misses'] == 1
+        assert definition.raw_text == QA_AGENT
+
+    def test_changed_definition_is_rejected(self, loader, tree):
+        agent_file = tree / ".bmad-core" / "agents" / "qa.md"
+        agent_file.write_text(QA_AGENT)
+        definition = loader.agent_definition("qa")
+        agent_file.write_text(QA_AGENT.replace("Quinn", "Someone else"))
+        with pytest.raises(BMadCorePreservationError):
+            loader.agent_definition("qa")
+        with pytest.raises(BMadCorePreservationError):
+            definition.raw_text
+
+    def test_malformed_agent_fails_to_load(self, loader, tree):
+        (tree / ".bmad-core" / "agents" / "qa.md").write_text("```yaml\n- just\n- a list\n```\n")
+        with pytest.raises(AgentLoadError):
+            loader.agent_definition("qa")
@@ -0,0 +1,411 @@
+"""
+Integration tests for PMDecisionCapture
+Runs decision capture against a throwaway coordination.db
+"""
+
+import csv
+import gzip
+import io
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from database.group_commit import WriteQueueFull
+from intercept.decision_capture import DecisionAnalytics, DecisionContext, DecisionType, PMDecisionCapture
+from intercept.maintenance import main as maintenance_main
+from intercept.payload_store import Payload
+from intercept.pm_coordinator import PMCoordinator
+
+
+def _decision(i: int = 0, **overrides) -> DecisionContext:
+    fields = dict(
+        decision_id='',
+        decision_type=DecisionType.TASK_ASSIGNMENT,
+        context_data={'user_prompt': f"Implement feature {i}"},
+        reasoning_process=f"Capability matching for feature {i}",
+        outcome="Task decomposed into 4 subtasks",
+        confidence_score=8,
+        agent_assignments={'subtask_0': 'james_developer'}
+    )
+    fields.update(overrides)
+    return DecisionContext(**fields)
+
+
+def _count(db_path, table):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+class TestBufferedCapture:
+    """Group-committed capture_decision"""
+
+    @pytest.mark.parametrize('durability', ['sync', 'group'])
+    def test_decision_is_committed_on_return(self, coordination_db, durability):
+        capture = PMDecisionCapture(coordination_db, durability=durability)
+        try:
+            payload = Payload.of({'task_id': 't1'})
+            capture.capture_decision(_decision(), [payload])
+            assert _count(coordination_db, 'pm_decision_log') == 1
+            assert _count(coordination_db, 'task_payloads') == 1
+        finally:
+            capture.close()
+
+    def test_async_decisions_visible_after_flush(self, coordination_db):
+        capture = PMDecisionCapture(coordination_db, durability='async')
+        try:
+            threads = [
+                threading.Thread(target=lambda base=base: [capture.capture_decision(_decision(base + i)) for i in range(50)])
+                for base in range(0, 200, 50)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            capture.capture_decisions([_decision(i) for i in range(200, 210)], payloads=[Payload.of([1])])
+
+            capture.flush()
+            assert _count(coordination_db, 'pm_decision_log') == 210
+            assert _count(coordination_db, 'task_payloads') == 1
+        finally:
+            capture.close()
+
+    def test_full_queue_applies_backpressure(self, coordination_db):
+        capture = PMDecisionCapture(coordination_db, durability='async', max_batch=1, max_queue=1, put_timeout=0.05)
+        writer_lock = capture.writer._write_lock
+        writer_lock.acquire()  # stall the writer thread mid-batch
+        try:
+            with pytest.raises(WriteQueueFull):
+                for i in range(10):
+                    capture.capture_decision(_decision(i))
+        finally:
+            writer_lock.release()
+            capture.close()
+        assert 1 <= _count(coordination_db, 'pm_decision_log') < 10
+
+    def test_coordinator_reads_buffered_workflow_payload(self, coordination_db):
+        coordinator = PMCoordinator(coordination_db, load_flush_interval=None, decision_durability='async')
+        try:
+            result = coordinator.coordinate_task("Implement feature")
+            coordinator.active_workflows.discard(result['workflow_id'])
+            assert coordinator.active_workflows[result['workflow_id']]['task_breakdown'].task_id
+        finally:
+            coordinator.close()
+        assert _count(coordination_db, 'pm_decision_log') == 1
+
+
+class TestDecisionHistory:
+    """Keyset-paginated history"""
+
+    def _capture(self, coordination_db, count):
+        capture = PMDecisionCapture(coordination_db)
+        # Shared timestamps exercise the id tie-breaker across page boundaries
+        created = datetime.now()
+        capture.capture_decisions([
+            _decision(i, created_at=created - timedelta(minutes=i // 3), confidence_score=1 + i % 10)
+            for i in range(count)
+        ])
+        return capture
+
+    def test_pages_cover_every_row_once_newest_first(self, coordination_db):
+        capture = self._capture(coordination_db, 50)
+
+        records = list(capture.iter_decision_history(page_size=7))
+        keys = [(record['created_at'], record['id']) for record in records]
+        assert len(records) == 50
+        assert keys == sorted(keys, reverse=True)
+        assert len(set(keys)) == 50
+
+    def test_projection_and_lazy_json(self, coordination_db):
+        capture = self._capture(coordination_db, 5)
+
+        record = next(capture.iter_decision_history(columns=['decision_context', 'confidence_score']))
+        assert set(record) == {'decision_context', 'confidence_score'}
+        assert record._decoded == {}
+        assert record['decision_context']['user_prompt'].startswith("Implement feature")
+        assert 'id' not in record
+        with pytest.raises(ValueError):
+            next(capture.iter_decision_history(columns=['no_such_column']))
+
+    def test_list_api_wraps_iterator(self, coordination_db):
+        capture = self._capture(coordination_db, 20)
+
+        history = capture.get_decision_history(min_confidence=6)
+        assert len(history) == 10
+        assert all(isinstance(row['model_assignments'], dict) for row in history)
+        assert [row['id'] for row in history] == [
+            record['id'] for record in capture.iter_decision_history(min_confidence=6, page_size=3)
+        ]
+
+
+class TestDecisionRollups:
+    """Trigger-maintained daily rollups"""
+
+    def _rollups(self, db_path):
+        with sqlite3.connect(db_path) as conn:
+            return conn.execute('''
+                SELECT day, decision_type, decision_count, confidence_sum, confidence_count, low_confidence_count
+                FROM pm_decision_daily_rollup ORDER BY day, decision_type
+            ''').fetchall()
+
+    def _recomputed(self, db_path):
+        with sqlite3.connect(db_path) as conn:
+            return conn.execute('''
+                SELECT DATE(created_at), decision_type, COUNT(*), SUM(confidence_score), COUNT(confidence_score),
+                       SUM(confidence_score < 7)
+                FROM pm_decision_log GROUP BY 1, 2 ORDER BY 1, 2
+            ''').fetchall()
+
+    def test_triggers_track_inserts_updates_and_deletes(self, coordination_db):
+        capture = PMDecisionCapture(coordination_db)
+        today = datetime.now()
+        capture.capture_decisions([
+            _decision(i, created_at=today - timedelta(days=i % 3), confidence_score=4 + i % 6,
+                      decision_type=list(DecisionType)[i % 2])
+            for i in range(30)
+        ])
+        with sqlite3.connect(coordination_db) as conn:
+            conn.execute("UPDATE pm_decision_log SET confidence_score = 10 WHERE id % 4 = 0")
+            conn.execute("DELETE FROM pm_decision_log WHERE id % 5 = 0")
+
+        assert self._rollups(coordination_db) == self._recomputed(coordination_db)
+
+    def test_existing_history_is_backfilled(self, coordination_db):
+        with sqlite3.connect(coordination_db) as conn:
+            conn.executescript('''
+                DROP TRIGGER trg_pm_decision_rollup_insert;
+                DROP TRIGGER trg_pm_decision_rollup_delete;
+                DROP TRIGGER trg_pm_decision_rollup_update;
+                DROP TABLE pm_decision_daily_rollup;
+            ''')
+            conn.executemany(
+                "INSERT INTO pm_decision_log (decision_context, decision_type, confidence_score) VALUES ('{}', ?, ?)",
+                [('quality_gate', 5), ('quality_gate', 9), ('escalation', 6)]
+            )
+
+        capture = PMDecisionCapture(coordination_db)
+        assert self._rollups(coordination_db) == self._recomputed(coordination_db)
+
+        patterns = capture.analyze_decision_patterns()
+        assert patterns['confidence_by_type']['quality_gate'] == {
+            'average_confidence': 7.0, 'total_decisions': 2, 'low_confidence_decisions': 1
+        }
+        assert patterns['total_decisions_analyzed'] == 3
+        assert patterns['daily_trends'][0]['decisions_count'] == 3
+        assert [d['confidence'] for d in patterns['low_confidence_decisions']] == [5, 6]
+
+    def test_maintenance_command_rebuilds_drifted_rollups(self, coordination_db, capsys):
+        PMDecisionCapture(coordination_db).capture_decisions([_decision(i) for i in range(3)])
+        with sqlite3.connect(coordination_db) as conn:
+            conn.execute("UPDATE pm_decision_daily_rollup SET decision_count = 99")
+
+        assert maintenance_main(['--db', coordination_db, 'rollups']) == 0
+        assert "Rebuilt 1 decision rollup rows" in capsys.readouterr().out
+        assert self._rollups(coordination_db) == self._recomputed(coordination_db)
+
+
+class TestDecisionExport:
+    """Streaming JSON Lines / CSV export"""
+
+    AWKWARD = 'Chose "dev", then QA,\nbecause: reasons'
+
+    @pytest.fixture
+    def analytics(self, coordination_db):
+        capture = PMDecisionCapture(coordination_db)
+        start = datetime(2026, 1, 1, 9, 0)
+        capture.capture_decisions([
+            _decision(i, created_at=start + timedelta(hours=i), reasoning_process=f"{self.AWKWARD} {i}")
+            for i in range(10)
+        ])
+        return DecisionAnalytics(capture)
+
+    def test_jsonl_gzip_path_round_trips(self, analytics, tmp_path):
+        path = tmp_path / "decisions.jsonl.gz"
+        result = analytics.export_decisions(path)
+
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            rows = [json.loads(line) for line in f]
+        assert result['rows'] == 10 and result['complete'] is True
+        assert [row['reasoning_process'] for row in rows] == [f"{self.AWKWARD} {i}" for i in range(10)]
+        assert rows[0]['decision_context'] == {'user_prompt': "Implement feature 0"}
+        assert rows[0]['model_assignments']['agent_assignments'] == {'subtask_0': 'james_developer'}
+
+    def test_csv_is_quoted_and_time_filtered(self, analytics):
+        out = io.StringIO()
+        result = analytics.export_decisions(
+            out, 'csv', since=datetime(2026, 1, 1, 11, 0), until=datetime(2026, 1, 1, 14, 0)
+        )
+
+        header, *rows = list(csv.reader(io.StringIO(out.getvalue())))
+        assert result['rows'] == 3
+        reasoning = header.index('reasoning_process')
+        assert [row[reasoning] for row in rows] == [f"{self.AWKWARD} {i}" for i in (2, 3, 4)]
+
+    def test_resume_token_continues_without_duplicates(self, analytics, tmp_path):
+        path = tmp_path / "decisions.csv.gz"
+        first = analytics.export_decisions(path, 'csv', max_rows=4)
+        assert (first['rows'], first['complete']) == (4, False)
+
+        second = analytics.export_decisions(path, 'csv', resume_token=first['resume_token'])
+        assert (second['rows'], second['complete']) == (6, True)
+
+        with gzip.open(path, 'rt', encoding='utf-8', newline='') as f:
+            header, *rows = list(csv.reader(f))
+        assert [int(row[0]) for row in rows] == list(range(1, 11))
+
+    def test_binary_file_object_with_gzip(self, analytics):
+        buffer = io.BytesIO()
+        analytics.export_decisions(buffer, compress=True)
+        assert not buffer.closed
+        assert len(gzip.decompress(buffer.getvalue()).decode('utf-8').splitlines()) == 10
+
+    def test_legacy_csv_export_escapes_fields(self, coordination_db):
+        capture = PMDecisionCapture(coordination_db)
+        capture.capture_decision(_decision(outcome='Assigned 2 tasks, "urgent"'))
+
+        rows = list(csv.reader(io.StringIO(DecisionAnalytics(capture).export_decision_data('csv'))))
+        assert rows[1][3] == 'Assigned 2 tasks, "urgent"'
+
+
+class TestDecisionSearch:
+    """FTS5 search over decision reasoning"""
+
+    @pytest.fixture
+    def capture(self, coordination_db):
+        capture = PMDecisionCapture(coordination_db)
+        capture.capture_decisions([
+            _decision(1, reasoning_process="Routed the schema migration to the architect", outcome="Escalated"),
+            _decision(2, reasoning_process="Developer handles the login bug", outcome="Assigned schema review",
+                      decision_type=DecisionType.QUALITY_GATE),
+            _decision(3, reasoning_process="Load balancing across QA agents", learning_notes="migration checklist helped"),
+        ])
+        return capture
+
+    def test_ranked_results_with_snippets(self, capture):
+        results = capture.search_decisions("schema")
+
+        assert len(results) == 2
+        # Outcome matches weigh double
+        assert results[0]['outcome'] == "Assigned schema review"
+        assert results[0]['score'] <= results[1]['score']
+        assert all('[schema]' in result['snippet'] for result in results)
+
+    def test_decision_type_filter_and_fts_syntax(self, capture):
+        assert [r['decision_type'] for r in capture.search_decisions("schema", DecisionType.QUALITY_GATE)] == ['quality_gate']
+        assert len(capture.search_decisions("migrat*")) == 2
+        assert len(capture.search_decisions('"login bug" OR checklist')) == 2
+        assert capture.search_decisions('ratio: "unbalanced') == []
+
+    def test_triggers_keep_index_in_sync(self, capture, coordination_db):
+        with sqlite3.connect(coordination_db) as conn:
+            conn.execute("UPDATE pm_decision_log SET reasoning_process = 'Rewritten plan' WHERE reasoning_process LIKE 'Routed%'")
+            conn.execute("DELETE FROM pm_decision_log WHERE outcome = 'Assigned schema review'")
+
+        assert capture.search_decisions("schema") == []
+        assert len(capture.search_decisions("rewritten")) == 1
+
+    @pytest.mark.parametrize('durability', [None, 'sync'])
+    def test_concurrent_captures_do_not_fail_on_trigger_reads(self, capture, coordination_db, durability):
+        concurrent = PMDecisionCapture(coordination_db, durability=durability)
+        errors = []
+
+        def worker(base):
+            for i in range(base, base + 25):
+                try:
+                    if i % 5:
+                        concurrent.capture_decision(_decision(i))
+                    else:
+                        concurrent.capture_decisions([_decision(i, reasoning_process=f"Batched schema work {i}")])
+                except Exception as e:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(base,)) for base in range(100, 300, 25)]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            concurrent.close()
+
+        assert errors == []
+        assert _count(coordination_db, 'pm_decision_log') == 203
+        assert len(capture.search_decisions("batched", limit=100)) == 40
+
+    def test_maintenance_rebuild_and_optimize(self, capture, coordination_db, capsys):
+        assert maintenance_main(['--db', coordination_db, 'search-index', 'rebuild']) == 0
+        assert maintenance_main(['--db', coordination_db, 'search-index', 'optimize']) == 0
+        assert "3 decisions" in capsys.readouterr().out
+        assert len(capture.search_decisions("migration")) == 2
+
+
+class TestDecisionSimilarity:
+    """MinHash/LSH near-duplicate lookup"""
+
+    PROMPTS = [
+        "Add OAuth login with Google and GitHub to the customer portal",
+        "Migrate the billing database schema to support multi-currency invoices",
+        "Write integration tests for the notification outbox retry logic",
+    ]
+
+    @pytest.fixture
+    def capture(self, coordination_db):
+        capture = PMDecisionCapture(coordination_db)
+        capture.capture_decisions([
+            _decision(i, context_data={'user_prompt': prompt}) for i, prompt in enumerate(self.PROMPTS)
+        ])
+        yield capture
+        capture.close()
+
+    def test_near_duplicate_ranks_first_with_outcome(self, capture):
+        analytics = DecisionAnalytics(capture)
+        results = analytics.similar_decisions(
+            "Add OAuth login with Google and GitHub to the customer portal quickly", min_similarity=0.3
+        )
+
+        assert results[0]['decision_context']['user_prompt'] == self.PROMPTS[0]
+        assert 0.6 <= results[0]['similarity'] < 1.0
+        assert results[0]['confidence_score'] == 8
+        assert results[0]['outcome'] == "Task decomposed into 4 subtasks"
+        assert analytics.similar_decisions("Refactor the keyword matcher cache") == []
+
+    def test_index_is_incremental_and_persistent(self, capture, coordination_db):
+        assert capture.find_similar_decisions(self.PROMPTS[1])[0]['similarity'] == 1.0
+        capture.capture_decision(_decision(context_data={'user_prompt': "Profile slow agent assignment queries"}))
+        assert capture.find_similar_decisions("Profile slow agent assignment queries")
+        capture.close()
+        assert _count(coordination_db, 'decision_minhash') == 4
+
+        reopened = PMDecisionCapture(coordination_db)
+        try:
+            assert reopened.similarity_index.refresh() == 4
+            assert reopened.find_similar_decisions(self.PROMPTS[2])[0]['similarity'] == 1.0
+        finally:
+            reopened.close()
+
+    def test_deleted_and_filtered_decisions_are_excluded(self, capture, coordination_db):
+        assert capture.find_similar_decisions(self.PROMPTS[0], DecisionType.QUALITY_GATE) == []
+        capture.close()
+        with sqlite3.connect(coordination_db) as conn:
+            conn.execute("DELETE FROM pm_decision_log WHERE decision_context LIKE '%OAuth%'")
+
+        assert capture.find_similar_decisions(self.PROMPTS[0]) == []
+        assert _count(coordination_db, 'decision_minhash') == 2
+
+    def test_deleted_matches_do_not_shrink_limit(self, capture, coordination_db):
+        capture.capture_decisions([
+            _decision(context_data={'user_prompt': self.PROMPTS[0]}) for _ in range(3)
+        ])
+        assert len(capture.find_similar_decisions(self.PROMPTS[0], limit=2)) == 2
+        # The best-ranked matches (highest ids) go away behind the index's back
+        with sqlite3.connect(coordination_db) as conn:
+            conn.execute(
+                "DELETE FROM pm_decision_log WHERE id IN"
+                " (SELECT id FROM pm_decision_log WHERE decision_context LIKE '%OAuth%' ORDER BY id DESC LIMIT 2)"
+            )
+
+        results = capture.find_similar_decisions(self.PROMPTS[0], limit=2)
+        assert [result['similarity'] for result in results] == [1.0, 1.0]
+        assert len(capture.find_similar_decisions(self.PROMPTS[0], limit=5)) == 2
@@ -0,0 +1,130 @@
+"""
+Integration tests for DependencyResolver
+Resolves agents and teams over a throwaway .bmad-core tree
+"""
+
+import os
+
+import pytest
+
+from intercept.agent_loader import AgentExtensionLoader, AgentLoadError
+from intercept.dependency_resolver import DependencyResolver
+
+DEV_AGENT = """# dev
+
+```yaml
+agent:
+  id: dev
+commands:
+  - develop-story: run execute-checklist.md
+dependencies:
+  tasks:
+    - execute-checklist.md
+  checklists:
+    - story-dod-checklist.md
+```
+"""
+
+PM_AGENT = """# pm
+
+```yaml
+agent:
+  id: pm
+dependencies:
+  tasks:
+    - create-doc.md
+  templates:
+    - prd-tmpl.yaml
+```
+"""
+
+FILES = {
+    "agents/dev.md": DEV_AGENT,
+    "agents/pm.md": PM_AGENT,
+    "tasks/execute-checklist.md": "Run a checklist; see .bmad-core/data/checklist-guide\n",
+    "tasks/create-doc.md": "Render {root}/templates/prd-tmpl.yaml, then {root}/tasks/create-doc.md again\n",
+    "checklists/story-dod-checklist.md": "- [ ] done\n",
+    "templates/prd-tmpl.yaml": "template: {id: prd}\n",
+    "data/checklist-guide.md": "Guide\n",
+    "workflows/greenfield.yaml": "workflow:\n  id: greenfield\n",
+    "agent-teams/team-dev.yaml": "agents: [dev]\nworkflows: [greenfield.yaml]\n",
+    "agent-teams/team-all.yaml": "agents: ['*']\n",
+}
+
+
+@pytest.fixture
+def core(tmp_path):
+    core = tmp_path / ".bmad-core"
+    for name, content in FILES.items():
+        (core / name).parent.mkdir(parents=True, exist_ok=True)
+        (core / name).write_text(content)
+    return core
+
+
+@pytest.fixture
+def resolver(core, tmp_path):
+    return DependencyResolver(AgentExtensionLoader(str(core), str(tmp_path)))
+
+
+def _relative(core, closure):
+    return [os.path.relpath(path, core) for path in closure.paths]
+
+
+class TestDependencyResolver:
+    """Memoized agent and team closures"""
+
+    def test_agent_closure_is_transitive(self, core, resolver):
+        closure = resolver.resolve_agent("dev")
+        assert _relative(core, closure) == [
+            'agents/dev.md', 'checklists/story-dod-checklist.md', 'data/checklist-guide.md', 'tasks/execute-checklist.md'
+        ]
+        assert closure.total_bytes == sum(os.path.getsize(path) for path in closure.paths)
+        assert closure.missing == ()
+
+        # Self-references do not loop
+        assert _relative(core, resolver.resolve_agent("pm")) == ['agents/pm.md', 'tasks/create-doc.md', 'templates/prd-tmpl.yaml']
+
+    def test_repeat_lookups_are_memoized(self, resolver, monkeypatch):
+        first = resolver.resolve_team("team-dev")
+        import builtins
+        monkeypatch.setattr(builtins, "open", lambda *a, **k: pytest.fail(f"re-read {a[0]}"))
+        assert resolver.resolve_team("team-dev") is first
+        assert resolver.cache_stats()['closure'] == {'hits': 1, 'misses': 1, 'hit_rate': 0.5}
+
+    def test_team_closure_covers_agents_and_workflows(self, core, resolver):
+        closure = resolver.resolve_team("team-dev")
+        assert _relative(core, closure)[:2] == ['agent-teams/team-dev.yaml', 'agents/dev.md']
+        assert 'workflows/greenfield.yaml' in _relative(core, closure)
+        assert set(resolver.resolve_agent("dev").paths) < set(closure.paths)
+        assert resolver.teams() == ['team-all', 'team-dev']
+
+    def test_changes_invalidate_affected_closures(self, core, resolver):
+        dev = resolver.resolve_agent("dev")
+        pm = resolver.resolve_agent("pm")
+
+        (core / "data" / "checklist-guide.md").write_text("A much longer guide\n")
+        changed = resolver.resolve_agent("dev")
+        assert changed is not dev and changed.total_bytes == dev.total_bytes + 14
+        assert resolver.resolve_agent("pm") is pm
+        # Only the edited file was re-read
+        assert resolver.cache_stats()['node']['misses'] == 8
+
+    def test_missing_references_resolve_once_created(self, core, resolver):
+        (core / "data" / "checklist-guide.md").unlink()
+        assert resolver.resolve_agent("dev").missing == (str((core / "data" / "checklist-guide").as_posix()),)
+
+        (core / "data" / "checklist-guide.md").write_text("Back\n")
+        closure = resolver.resolve_agent("dev")
+        assert closure.missing == ()
+        assert 'data/checklist-guide.md' in _relative(core, closure)
+
+    def test_wildcard_team_picks_up_new_agents(self, core, resolver):
+        assert 'agents/qa.md' not in _relative(core, resolver.resolve_team("team-all"))
+        (core / "agents" / "qa.md").write_text("# qa\n")
+        assert 'agents/qa.md' in _relative(core, resolver.resolve_team("team-all"))
+
+    def test_unknown_agent_or_team(self, resolver):
+        with pytest.raises(AgentLoadError):
+            resolver.resolve_agent("nobody")
+        with pytest.raises(AgentLoadError):
+            resolver.resolve_team("team-nobody")
@@ -0,0 +1,47 @@
+"""
+Tests for the shared time-ordered ID generator
+"""
+
+import threading
+
+from database.id_generator import IdGenerator, new_id
+from intercept.pm_coordinator import PMCoordinator
+
+
+class TestIdGenerator:
+
+    def test_ids_are_unique_and_strictly_increasing(self):
+        generator = IdGenerator()
+        ids = [generator.new_id() for _ in range(20000)]
+
+        assert len(set(ids)) == len(ids)
+        assert ids == sorted(ids)
+        assert all(len(i) == 26 for i in ids)
+
+    def test_prefix(self):
+        assert new_id('task').startswith('task_')
+        assert len(new_id('ESC')) == len('ESC_') + 26
+
+    def test_unique_across_threads(self):
+        generator = IdGenerator()
+        results = []
+
+        def worker():
+            results.extend(generator.new_id() for _ in range(2000))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(results)) == 8000
+
+    def test_coordinate_task_no_longer_collides_within_a_second(self, coordination_db):
+        coordinator = PMCoordinator(coordination_db, load_flush_interval=None)
+        try:
+            workflow_ids = {coordinator.coordinate_task("Implement feature")['workflow_id'] for _ in range(20)}
+        finally:
+            coordinator.close()
+
+        assert len(workflow_ids) == 20
@@ -0,0 +1,105 @@
+"""
+Tests for TaskKeywordMatcher
+The compiled matcher must return exactly what the original keyword scans returned
+"""
+
+import os
+import random
+import threading
+
+from intercept.keyword_matcher import TaskKeywordMatcher
+
+CAPABILITY_KEYWORDS = [
+    ('code_implementation', ['implement', 'code', 'develop', 'build']),
+    ('quality_validation', ['test', 'quality', 'validate']),
+    ('system_design', ['design', 'architect', 'structure']),
+    ('research', ['research', 'analyze', 'investigate']),
+    ('user_experience', ['ui', 'ux', 'user', 'interface']),
+    ('coordination', ['coordinate', 'manage', 'oversee']),
+]
+COMPLEX_KEYWORDS = ['integrate', 'orchestrate', 'coordinate', 'multiple', 'system', 'architecture']
+PREFIXES = ["Research and analysis for: ", "System architecture design for: ", "Core implementation for: ",
+            "Integration testing for: ", "UX validation for: ", "Quality gates validation for: "]
+
+
+def original_capabilities(description):
+    """Reference implementation: the original per-table any() scans"""
+    description = description.lower()
+    capabilities = [capability for capability, words in CAPABILITY_KEYWORDS
+                    if any(word in description for word in words)]
+    return capabilities or ['code_implementation']
+
+
+def original_complexity(user_prompt):
+    return sum(1 for word in COMPLEX_KEYWORDS if word in user_prompt.lower())
+
+
+def random_text(rng, length):
+    vocabulary = [word for _, words in CAPABILITY_KEYWORDS for word in words] + COMPLEX_KEYWORDS
+    vocabulary += ['the', 'api', 'payment', 'Build', 'ARCHITECTURE', 'buildesign', 'rebuild', 'UI', 'quick']
+    words, size = [], 0
+    while size < length:
+        words.append(rng.choice(vocabulary) if rng.random() < 0.2 else rng.choice(['alpha', 'beta', 'gamma', 'x']))
+        size += len(words[-1]) + 1
+    return rng.choice([' ', '']).join(words)
+
+
+class TestTaskKeywordMatcher:
+
+    def test_matches_original_scans(self):
+        rng = random.Random(5)
+        matcher = TaskKeywordMatcher()
+        for _ in range(300):
+            text = random_text(rng, rng.choice([5, 40, 200]))
+            assert matcher.capabilities(text) == original_capabilities(text)
+            assert matcher.complexity_score(text) == original_complexity(text)
+
+    def test_tricky_overlaps(self):
+        matcher = TaskKeywordMatcher()
+        for text in ["buildesign", "ARCHITECTURE", "a UI", "architect", "guide", "", "oversee users"]:
+            assert matcher.capabilities(text) == original_capabilities(text)
+            assert matcher.complexity_score(text) == original_complexity(text)
+
+    def test_memoized_prompt_suffix_matches_full_scan(self):
+        rng = random.Random(9)
+        matcher = TaskKeywordMatcher()
+        for _ in range(20):
+            prompt = random_text(rng, 2000)
+            assert matcher.complexity_score(prompt) == original_complexity(prompt)
+            for prefix in PREFIXES:
+                description = prefix + prompt
+                assert matcher.capabilities(description) == original_capabilities(description)
+
+    def test_shared_memo_under_concurrent_use(self):
+        matcher = TaskKeywordMatcher()
+        prompts = [random_text(random.Random(seed), 1000) for seed in range(64)]
+        errors = []
+
+        def match(offset):
+            try:
+                for i in range(200):
+                    description = PREFIXES[i % len(PREFIXES)] + prompts[(offset + i) % len(prompts)]
+                    assert matcher.capabilities(description) == original_capabilities(description)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=match, args=(offset,)) for offset in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+
+    def test_reloads_when_config_changes(self, tmp_path):
+        config = tmp_path / "keywords.yaml"
+        config.write_text("capability_keywords:\n  research: [survey]\ndefault_capability: general\n")
+        matcher = TaskKeywordMatcher(str(config))
+        assert matcher.capabilities("run a survey") == ['research']
+        assert matcher.capabilities("research it") == ['general']
+
+        config.write_text("capability_keywords:\n  research: [survey, research]\ndefault_capability: general\n"
+                          "complexity_keywords: [system]\n")
+        stat = config.stat()
+        os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert matcher.capabilities("research it") == ['research']
+        assert matcher.complexity_score("system") == 1
@@ -0,0 +1,98 @@
+"""
+Tests for latency spans and histograms
+"""
+
+import sqlite3
+import time
+
+from intercept.latency_metrics import LatencyHistogram, LatencyRecorder
+
+
+class TestLatencyHistogram:
+
+    def test_percentiles_within_bucket_error(self):
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.add(ms * 1_000_000)
+
+        summary = histogram.summary()
+        assert summary['count'] == 1000
+        assert summary['min_ms'] == 1 and summary['max_ms'] == 1000
+        for key, expected in (('p50_ms', 500), ('p95_ms', 950), ('p99_ms', 990)):
+            assert expected <= summary[key] <= expected * 1.05
+
+    def test_window_since_previous_copy(self):
+        histogram = LatencyHistogram()
+        histogram.add(1_000_000)
+        earlier = histogram.copy()
+        histogram.add(50_000_000)
+        histogram.add(50_000_000)
+
+        window = histogram.since(earlier)
+        assert window.count == 2
+        assert 45 <= window.percentile(0.5) <= 50
+        assert window.min_ns > 1_000_000
+
+
+class TestLatencyRecorder:
+
+    def test_span_records_on_error(self):
+        recorder = LatencyRecorder()
+        try:
+            with recorder.span('failing'):
+                raise ValueError
+        except ValueError:
+            pass
+        assert recorder.stats()['steps']['failing']['count'] == 1
+
+    def test_disabled_span_overhead_under_one_microsecond(self):
+        recorder = LatencyRecorder(enabled=False)
+        iterations = 100_000
+
+        def run():
+            span = recorder.span
+            started = time.perf_counter()
+            for _ in range(iterations):
+                with span('step'):
+                    pass
+            return (time.perf_counter() - started) / iterations
+
+        assert min(run() for _ in range(5)) < 1e-6
+        assert recorder.stats()['steps'] == {}
+
+    def test_flush_writes_only_new_samples(self, coordination_db):
+        recorder = LatencyRecorder(coordination_db, flush_interval=60.0)
+        recorder.record('decompose', 0.002)
+        assert recorder.flush() == 1
+        assert recorder.flush() == 0
+        recorder.record('decompose', 0.004)
+        recorder.record('assign', 0.001)
+        assert recorder.flush() == 2
+
+        with sqlite3.connect(coordination_db) as conn:
+            rows = conn.execute("SELECT step, count FROM pm_step_metrics ORDER BY id").fetchall()
+        assert rows == [('decompose', 1), ('assign', 1), ('decompose', 1)]
+        assert recorder.stats()['steps']['decompose']['count'] == 2
+
+    def test_reset_keeps_unflushed_samples_for_flush(self, coordination_db):
+        recorder = LatencyRecorder(coordination_db, flush_interval=60.0)
+        recorder.record('decompose', 0.002)
+        recorder.record('decompose', 0.003)
+        recorder.reset()
+        recorder.record('decompose', 0.004)
+
+        assert recorder.stats()['steps']['decompose']['count'] == 1
+        assert recorder.flush() == 1
+        with sqlite3.connect(coordination_db) as conn:
+            assert conn.execute("SELECT SUM(count) FROM pm_step_metrics").fetchone()[0] == 3
+
+    def test_failed_flush_retries_window(self, tmp_path):
+        recorder = LatencyRecorder(str(tmp_path / 'missing' / 'metrics.db'), flush_interval=None)
+        recorder.record('assign', 0.001)
+        assert recorder.flush() == 0
+
+        recorder.db_path = str(tmp_path / 'metrics.db')
+        recorder.record('assign', 0.002)
+        assert recorder.flush() == 1
+        with sqlite3.connect(recorder.db_path) as conn:
+            assert conn.execute("SELECT count FROM pm_step_metrics").fetchall() == [(2,)]
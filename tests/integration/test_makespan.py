@@ -0,0 +1,62 @@
+"""
+Tests for the subtask DAG makespan estimator
+"""
+
+import pytest
+
+from intercept.makespan import critical_path_minutes, estimate_schedule
+
+
+def _subtask(sid, hours, *depends_on):
+    return {'id': sid, 'estimated_hours': hours, 'depends_on': list(depends_on)}
+
+
+DIAMOND = [
+    _subtask('build', 2),
+    _subtask('test', 3, 'build'),
+    _subtask('docs', 1, 'build'),
+    _subtask('release', 1, 'test', 'docs'),
+]
+
+
+class TestEstimateSchedule:
+
+    def test_independent_branches_run_in_parallel(self):
+        assignments = {'build': 'dev', 'test': 'qa', 'docs': 'writer', 'release': 'dev'}
+        schedule = estimate_schedule(DIAMOND, assignments)
+
+        assert schedule.serial_minutes == 420
+        assert schedule.makespan_minutes == 360
+        assert schedule.critical_path == ['build', 'test', 'release']
+        assert schedule.subtasks['docs'].earliest_start == 120
+        assert schedule.subtasks['release'].earliest_start == 300
+
+    def test_shared_agent_serializes_work(self):
+        assignments = dict.fromkeys(['build', 'test', 'docs', 'release'], 'dev')
+        schedule = estimate_schedule(DIAMOND, assignments)
+
+        assert schedule.makespan_minutes == 420
+        # The longer branch goes first so the critical chain is not delayed by slack work
+        assert schedule.subtasks['test'].earliest_start == 120
+        assert schedule.subtasks['docs'].earliest_start == 300
+
+    def test_busy_agents_take_longer(self):
+        assignments = {'build': 'dev', 'test': 'qa', 'docs': 'writer', 'release': 'dev'}
+        schedule = estimate_schedule(DIAMOND, assignments, capacity={'qa': 0.5})
+
+        assert schedule.subtasks['test'].duration_minutes == 360
+        assert schedule.makespan_minutes == 540
+
+    def test_critical_path_ignores_agents(self):
+        assert critical_path_minutes(DIAMOND) == 360
+
+    def test_cycles_and_unknown_dependencies_are_rejected(self):
+        with pytest.raises(ValueError, match="cycle"):
+            estimate_schedule([_subtask('a', 1, 'b'), _subtask('b', 1, 'a')], {})
+        with pytest.raises(ValueError, match="unknown"):
+            estimate_schedule([_subtask('a', 1, 'missing')], {})
+
+    def test_legacy_subtasks_without_ids_or_edges(self):
+        schedule = estimate_schedule([{'estimated_hours': 2}, {'estimated_hours': 1}], {})
+        assert set(schedule.subtasks) == {'subtask_0', 'subtask_1'}
+        assert schedule.makespan_minutes == 120
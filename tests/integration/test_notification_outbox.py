@@ -0,0 +1,153 @@
+"""
+Tests for NotificationOutbox and the GroupCommitWriter behind it
+"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from database.group_commit import GroupCommitWriter, WriteQueueFull
+from intercept.maintenance import main as maintenance_main
+from intercept.notification_outbox import NotificationOutbox
+
+
+@pytest.fixture
+def outbox(coordination_db):
+    outbox = NotificationOutbox(coordination_db)
+    yield outbox
+    outbox.close()
+
+
+class TestNotificationOutbox:
+
+    def test_fetch_after_cursor_and_ack(self, outbox):
+        first = outbox.publish('james_developer', "first", {'task': 1})
+        outbox.publish('quinn_qa', "other agent")
+        second = outbox.publish('james_developer', "second")
+
+        items = outbox.fetch('james_developer')
+        assert [item['message'] for item in items] == ["first", "second"]
+        assert items[0]['context'] == {'task': 1}
+        assert [item['cursor'] for item in items] == [first, second]
+
+        assert outbox.ack('james_developer', first) == 1
+        assert [item['message'] for item in outbox.fetch('james_developer')] == ["second"]
+        assert outbox.ack('james_developer', first) == 0  # cursors never move backwards
+        assert outbox.fetch('james_developer', after_cursor=0, max_items=1)[0]['cursor'] == first
+
+    def test_long_poll_wakes_on_publish(self, outbox):
+        threading.Timer(0.1, lambda: outbox.publish('mary_analyst', "wake up")).start()
+
+        started = time.monotonic()
+        items = outbox.fetch('mary_analyst', timeout=5.0)
+
+        assert [item['message'] for item in items] == ["wake up"]
+        assert time.monotonic() - started < 2.0
+
+    def test_long_poll_times_out_empty(self, outbox):
+        assert outbox.fetch('mary_analyst', timeout=0.05) == []
+
+    def test_fan_out_is_one_batch(self, outbox):
+        commits = []
+        outbox.writer.on_commit = lambda rows, results: commits.append(len(rows))
+
+        cursors = outbox.publish_many((f"agent_{i}", "deploy", None) for i in range(50))
+
+        assert len(cursors) == 50
+        assert commits == [50]
+
+    def test_trim_deletes_only_acknowledged(self, outbox, coordination_db):
+        delivered = outbox.publish('quinn_qa', "done")
+        outbox.publish('quinn_qa', "pending")
+        outbox.ack('quinn_qa', delivered)
+
+        assert outbox.trim_delivered(older_than_seconds=0) == 1
+        assert [item['message'] for item in outbox.fetch('quinn_qa', after_cursor=0)] == ["pending"]
+
+    def test_maintenance_outbox_trim_command(self, outbox, coordination_db, capsys):
+        delivered = outbox.publish('quinn_qa', "done")
+        outbox.ack('quinn_qa', delivered)
+
+        assert maintenance_main(['--db', coordination_db, 'outbox-trim']) == 0
+        assert "Trimmed 0 delivered notifications older than 7 days" in capsys.readouterr().out
+
+        assert maintenance_main(['--db', coordination_db, 'outbox-trim', '--older-than-days', '0']) == 0
+        assert "Trimmed 1 delivered notifications" in capsys.readouterr().out
+        assert outbox.fetch('quinn_qa', after_cursor=0) == []
+
+
+class TestGroupCommitWriter:
+
+    def _writer(self, db_path, **kwargs):
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS items (value INTEGER)")
+
+        def write(conn, rows):
+            conn.executemany("INSERT INTO items (value) VALUES (?)", [(row,) for row in rows])
+            return rows
+
+        return GroupCommitWriter(db_path, write, **kwargs)
+
+    @pytest.mark.parametrize('durability', ['sync', 'group', 'async'])
+    def test_durability_modes_persist_after_flush(self, coordination_db, durability):
+        writer = self._writer(coordination_db, durability=durability)
+        threads = [threading.Thread(target=writer.submit, args=([i],)) for i in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writer.flush()
+
+        with sqlite3.connect(coordination_db) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 20
+        writer.close()
+
+    def test_backpressure_when_queue_is_full(self, coordination_db):
+        writer = self._writer(coordination_db, durability='async', max_batch=1, max_queue=1, put_timeout=0.05)
+        blocker = sqlite3.connect(coordination_db, isolation_level=None)
+        blocker.execute('BEGIN IMMEDIATE')
+        try:
+            with pytest.raises(WriteQueueFull):
+                for i in range(10):
+                    writer.submit([i])
+        finally:
+            blocker.execute('ROLLBACK')
+            blocker.close()
+        writer.close()
+
+    def test_bad_row_fails_only_its_submit(self, coordination_db):
+        with sqlite3.connect(coordination_db) as conn:
+            conn.execute("CREATE TABLE checked_items (value INTEGER CHECK (value >= 0))")
+
+        def write(conn, rows):
+            conn.executemany("INSERT INTO checked_items (value) VALUES (?)", [(row,) for row in rows])
+            return rows
+
+        commits = []
+        writer = GroupCommitWriter(coordination_db, write, max_delay=0.5,
+                                   on_commit=lambda rows, results: commits.append(sorted(rows)))
+        outcomes = {}
+
+        def submit(value):
+            try:
+                outcomes[value] = writer.submit([value])
+            except sqlite3.IntegrityError:
+                outcomes[value] = 'failed'
+
+        threads = [threading.Thread(target=submit, args=(value,)) for value in (1, 2, -3, 4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writer.close()
+
+        assert outcomes == {1: [1], 2: [2], -3: 'failed', 4: [4]}
+        assert commits == [[1, 2, 4]]
+        with sqlite3.connect(coordination_db) as conn:
+            assert conn.execute("SELECT value FROM checked_items ORDER BY value").fetchall() == [(1,), (2,), (4,)]
+
+    def test_rejects_unknown_durability(self, coordination_db):
+        with pytest.raises(ValueError):
+            self._writer(coordination_db, durability='eventually')
@@ -0,0 +1,76 @@
+"""
+Tests for serialize-once task breakdown payloads
+"""
+
+import json
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from intercept.payload_store import Payload, decode, encode, ensure_payload_schema, load_payload, store_payloads
+from intercept.pm_coordinator import PMCoordinator
+
+
+class TestPayload:
+
+    def test_encoding_is_canonical(self):
+        first = Payload.of({'b': [1, 2], 'a': {'y': 1, 'x': 'é'}})
+        second = Payload.of({'a': {'x': 'é', 'y': 1}, 'b': [1, 2]})
+
+        assert first == second
+        assert decode(first.body) == {'a': {'x': 'é', 'y': 1}, 'b': [1, 2]}
+        assert b' ' not in encode({'a': 1, 'b': 2})
+
+    def test_encoding_does_not_depend_on_backend(self):
+        # Bytes json produces whether or not orjson is installed
+        assert encode({2: 'b', 1: 'a'}) == b'{"1":"a","2":"b"}'
+        assert encode([1e16, 1e-05]) == b'[1e+16,1e-05]'
+        with pytest.raises(TypeError):
+            encode({'at': datetime(2026, 1, 1)})
+        with pytest.raises(ValueError):
+            encode({'score': float('nan')})
+
+    def test_store_and_load_round_trip(self):
+        payload = Payload.of({'task_id': 't1', 'subtasks': []})
+        with sqlite3.connect(':memory:') as conn:
+            ensure_payload_schema(conn)
+            store_payloads(conn, [payload, payload])
+
+            assert conn.execute("SELECT COUNT(*) FROM task_payloads").fetchone()[0] == 1
+            assert load_payload(conn, payload.hash) == {'task_id': 't1', 'subtasks': []}
+            assert load_payload(conn, 'missing') is None
+
+
+class TestCoordinatorPayloads:
+
+    def test_breakdown_is_stored_once_and_referenced_by_hash(self, coordination_db):
+        coordinator = PMCoordinator(coordination_db, load_flush_interval=None)
+        try:
+            result = coordinator.coordinate_task("Design the system architecture for billing")
+        finally:
+            coordinator.close()
+
+        with sqlite3.connect(coordination_db) as conn:
+            payloads = conn.execute("SELECT hash, body FROM task_payloads").fetchall()
+            decision_context = json.loads(conn.execute("SELECT decision_context FROM pm_decision_log").fetchone()[0])
+            workflow_context = json.loads(conn.execute("SELECT context FROM workflow_state").fetchone()[0])
+
+        assert len(payloads) == 1
+        payload_hash, body = payloads[0]
+        assert decision_context['task_breakdown_hash'] == payload_hash
+        assert workflow_context['task_breakdown_hash'] == payload_hash
+        assert 'task_breakdown' not in decision_context and 'task_breakdown' not in workflow_context
+        assert decode(body) == result['task_breakdown']
+
+    def test_evicted_workflow_reloads_from_payload(self, coordination_db):
+        coordinator = PMCoordinator(coordination_db, load_flush_interval=None)
+        try:
+            result = coordinator.coordinate_task("Implement feature")
+            coordinator.active_workflows.discard(result['workflow_id'])
+
+            entry = coordinator.active_workflows[result['workflow_id']]
+            assert entry['task_breakdown'].task_id == result['task_breakdown']['task_id']
+            assert entry['task_breakdown'].subtasks == result['task_breakdown']['subtasks']
+        finally:
+            coordinator.close()
@@ -0,0 +1,486 @@
+"""
+Integration tests for PMCoordinator
+Runs coordination against a throwaway coordination.db
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from intercept.pm_coordinator import PMCoordinator, TaskBreakdown, TaskPriority
+
+
+@pytest.fixture
+def coordinator(coordination_db):
+    """Create PMCoordinator on a fresh database"""
+    coordinator = PMCoordinator(coordination_db, load_flush_interval=None)
+    yield coordinator
+    coordinator.close()
+
+
+def _count(db_path, table):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def _total_load(coordinator):
+    return sum(coordinator.load_tracker.load(agent) for agent in coordinator.agent_capabilities)
+
+
+def _held_load(coordinator):
+    """Load the tracked workflows should hold: one assignment's worth per subtask"""
+    return 0.1 * sum(len(coordinator.active_workflows[workflow_id]['assignments'])
+                     for workflow_id in list(coordinator.active_workflows))
+
+
+class TestCoordinateTask:
+    """Single prompt coordination"""
+
+    def test_coordinate_task_persists_decision_and_workflow(self, coordinator, coordination_db):
+        result = coordinator.coordinate_task("Design the system architecture for billing")
+
+        assert result['workflow_id'].startswith('wf_task_')
+        assert result['agent_assignments']
+        assert _count(coordination_db, 'pm_decision_log') == 1
+        assert _count(coordination_db, 'workflow_state') == 1
+
+    def test_failed_registration_releases_load(self, coordinator, monkeypatch):
+        def fail(plan):
+            raise sqlite3.OperationalError("database is locked")
+        monkeypatch.setattr(coordinator, '_register_workflow', fail)
+
+        with pytest.raises(sqlite3.OperationalError):
+            coordinator.coordinate_task("Design the system architecture for billing")
+        assert _total_load(coordinator) == 0.0
+
+
+class TestCoordinateTaskAsync:
+    """Async coordination with concurrent persistence"""
+
+    def test_async_persists_decision_and_workflow(self, coordinator, coordination_db):
+        result = asyncio.run(coordinator.coordinate_task_async("Implement feature"))
+
+        assert result['workflow_id'] in coordinator.active_workflows
+        assert _count(coordination_db, 'pm_decision_log') == 1
+        assert _count(coordination_db, 'workflow_state') == 1
+
+    def test_async_timeout_propagates_and_rolls_back(self, coordinator, coordination_db):
+        blocker = sqlite3.connect(coordination_db, isolation_level=None)
+        blocker.execute('BEGIN IMMEDIATE')
+        started = time.monotonic()
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                asyncio.run(coordinator.coordinate_task_async("Implement feature", timeout=0.2))
+        finally:
+            blocker.execute('ROLLBACK')
+            blocker.close()
+
+        assert time.monotonic() - started < 5
+        assert _count(coordination_db, 'pm_decision_log') == 0
+        assert _count(coordination_db, 'workflow_state') == 0
+        assert not coordinator.active_workflows
+        assert _total_load(coordinator) == 0.0
+
+    def test_async_cancellation_propagates(self, coordinator, coordination_db):
+        blocker = sqlite3.connect(coordination_db, isolation_level=None)
+        blocker.execute('BEGIN IMMEDIATE')
+
+        async def cancel_midway():
+            task = asyncio.create_task(coordinator.coordinate_task_async("Implement feature"))
+            await asyncio.sleep(0.1)
+            task.cancel()
+            await task
+
+        try:
+            with pytest.raises(asyncio.CancelledError):
+                asyncio.run(cancel_midway())
+        finally:
+            blocker.execute('ROLLBACK')
+            blocker.close()
+
+        assert _count(coordination_db, 'pm_decision_log') == 0
+        assert _total_load(coordinator) == 0.0
+
+    def test_async_failed_workflow_rolls_back_decision(self, coordinator, coordination_db, monkeypatch):
+        def fail(conn, plan):
+            raise sqlite3.IntegrityError("workflow rejected")
+        monkeypatch.setattr(coordinator, '_insert_workflow', fail)
+
+        with pytest.raises(sqlite3.IntegrityError):
+            asyncio.run(coordinator.coordinate_task_async("Implement feature"))
+        assert _count(coordination_db, 'pm_decision_log') == 0
+        assert _count(coordination_db, 'task_payloads') == 0
+
+
+class TestCoordinateTasksBulk:
+    """Bulk coordination in a single transaction"""
+
+    def test_bulk_persists_every_prompt(self, coordinator, coordination_db):
+        prompts = [f"Implement feature {i}" for i in range(25)]
+
+        summary = coordinator.coordinate_tasks_bulk(prompts)
+
+        assert summary['coordinated'] == 25
+        assert summary['failed'] == 0
+        assert summary['prompts_per_second'] > 0
+        assert all(r['status'] == 'coordinated' for r in summary['results'])
+        assert _count(coordination_db, 'pm_decision_log') == 25
+        assert _count(coordination_db, 'workflow_state') == 25
+        assert len(coordinator.active_workflows) == 25
+
+    def test_bulk_aggregates_agent_status(self, coordinator, coordination_db):
+        coordinator.coordinate_tasks_bulk(["Implement feature"] * 4)
+
+        with sqlite3.connect(coordination_db) as conn:
+            rows = conn.execute("SELECT agent, coordination_count FROM agent_status").fetchall()
+
+        assert sum(count for _, count in rows) == 4
+
+    def test_bulk_reports_partial_failures(self, coordinator, coordination_db):
+        original = coordinator._decompose_task
+        task_ids = iter(['task_a', 'task_b', 'task_c', 'task_a'])
+
+        def decompose(user_prompt, context):
+            breakdown = original(user_prompt, context)
+            breakdown.task_id = next(task_ids)
+            return breakdown
+
+        coordinator._decompose_task = decompose
+        coordinator.coordinate_tasks_bulk(["Implement feature", "Implement feature"])
+
+        # Second prompt clashes with wf_task_a from the first batch
+        summary = coordinator.coordinate_tasks_bulk(["Implement other feature", "Implement feature"])
+
+        assert summary['coordinated'] == 1
+        assert summary['failed'] == 1
+        assert summary['failures'][0]['index'] == 1
+        assert summary['failures'][0]['stage'] == 'persistence'
+        assert summary['results'][0]['status'] == 'coordinated'
+        assert summary['results'][1]['status'] == 'failed'
+        assert _count(coordination_db, 'workflow_state') == 3
+        assert _count(coordination_db, 'pm_decision_log') == 3
+        # Only the three persisted workflows hold load
+        assert _total_load(coordinator) == pytest.approx(_held_load(coordinator))
+
+    def test_failed_commit_keeps_pending_agent_status(self, coordinator, coordination_db, monkeypatch):
+        result = coordinator.coordinate_task("Implement feature")
+        counts = {}
+        for agent in result['agent_assignments'].values():
+            counts[agent] = counts.get(agent, 0) + 1
+
+        class FailingCommit(sqlite3.Connection):
+            def execute(self, sql, *args):
+                if sql == 'COMMIT':
+                    raise sqlite3.OperationalError("disk I/O error")
+                return super().execute(sql, *args)
+
+        connect = sqlite3.connect
+        monkeypatch.setattr(sqlite3, 'connect', lambda *a, **k: connect(*a, factory=FailingCommit, **k))
+        summary = coordinator.coordinate_tasks_bulk(["Implement other feature"] * 3)
+        monkeypatch.setattr(sqlite3, 'connect', connect)
+
+        assert summary['failed'] == 3
+        assert _count(coordination_db, 'agent_status') == 0
+        assert _total_load(coordinator) == pytest.approx(_held_load(coordinator))
+        # The earlier assignment is flushed; the rolled-back batch is not counted
+        coordinator.load_tracker.flush()
+        with sqlite3.connect(coordination_db) as conn:
+            assert dict(conn.execute("SELECT agent, coordination_count FROM agent_status")) == counts
+
+    def test_bulk_rejects_mismatched_contexts(self, coordinator):
+        with pytest.raises(ValueError):
+            coordinator.coordinate_tasks_bulk(["a", "b"], contexts=[{}])
+
+
+class TestAgentLoadAccounting:
+    """Decaying, write-behind agent load"""
+
+    def test_assignment_status_is_written_behind(self, coordinator, coordination_db):
+        result = coordinator.coordinate_task("Implement feature")
+        agent = next(iter(result['agent_assignments'].values()))
+
+        assert _count(coordination_db, 'agent_status') == 0
+
+        coordinator.load_tracker.flush()
+        with sqlite3.connect(coordination_db) as conn:
+            row = conn.execute(
+                "SELECT coordination_count, current_load, status FROM agent_status WHERE agent = ?", (agent,)
+            ).fetchone()
+
+        assert row == (1, pytest.approx(0.1), 'busy')
+
+    def test_complete_workflow_releases_load(self, coordinator, coordination_db):
+        result = coordinator.coordinate_task("Implement feature")
+        agent = next(iter(result['agent_assignments'].values()))
+        assert coordinator.agent_capabilities[agent].current_load == pytest.approx(0.1)
+
+        assert coordinator.complete_workflow(result['workflow_id']) is True
+        assert coordinator.agent_capabilities[agent].current_load == 0.0
+        assert coordinator.complete_workflow(result['workflow_id']) is False
+
+        with sqlite3.connect(coordination_db) as conn:
+            status = conn.execute(
+                "SELECT status FROM workflow_state WHERE id = ?", (result['workflow_id'],)
+            ).fetchone()[0]
+        assert status == 'completed'
+
+    def test_stale_load_decays(self, coordinator):
+        tracker = coordinator.load_tracker
+        tracker.acquire('quinn_qa', 1.0)
+
+        changed = tracker.decay(now=tracker._last_decay + tracker.half_life_seconds)
+
+        assert changed['quinn_qa'] == pytest.approx(0.5)
+
+    def test_load_is_rebuilt_on_startup(self, coordinator, coordination_db):
+        coordinator.coordinate_task("Research the market")
+        coordinator.close()
+
+        restarted = PMCoordinator(coordination_db, load_flush_interval=None)
+        try:
+            loads = {name: cap.current_load for name, cap in restarted.agent_capabilities.items()}
+            assert sum(loads.values()) == pytest.approx(0.1, rel=0.01)
+        finally:
+            restarted.close()
+
+
+class TestWorkflowRegistry:
+    """Bounded active_workflows with workflow_state read-through"""
+
+    def test_lru_eviction_and_reload_on_miss(self, coordination_db):
+        coordinator = PMCoordinator(coordination_db, load_flush_interval=None, workflow_cache_size=3)
+        try:
+            summary = coordinator.coordinate_tasks_bulk([f"Implement feature {i}" for i in range(5)])
+            workflow_ids = [r['workflow_id'] for r in summary['results']]
+            registry = coordinator.active_workflows
+
+            assert len(registry) == 3
+            assert registry.stats()['evictions'] == 2
+
+            entry = registry[workflow_ids[0]]
+            assert isinstance(entry['task_breakdown'], TaskBreakdown)
+            assert isinstance(entry['task_breakdown'].priority, TaskPriority)
+            assert entry['status'] == 'active'
+            assert registry.stats()['misses'] == 1
+
+            assert workflow_ids[0] in registry
+            assert registry.stats()['hits'] == 1
+            assert len(registry) == 3
+        finally:
+            coordinator.close()
+
+    def test_ttl_expiry(self, coordination_db):
+        coordinator = PMCoordinator(coordination_db, load_flush_interval=None, workflow_ttl_seconds=0.01)
+        try:
+            workflow_id = coordinator.coordinate_task("Implement feature")['workflow_id']
+            time.sleep(0.02)
+
+            assert workflow_id in coordinator.active_workflows
+            stats = coordinator.active_workflows.stats()
+            assert (stats['evictions'], stats['misses']) == (1, 1)
+        finally:
+            coordinator.close()
+
+    def test_completed_workflows_are_pruned_and_counted_from_database(self, coordinator):
+        summary = coordinator.coordinate_tasks_bulk(["Implement feature"] * 3)
+        workflow_id = summary['results'][0]['workflow_id']
+        coordinator.active_workflows.discard(summary['results'][1]['workflow_id'])
+
+        assert coordinator.complete_workflow(workflow_id) is True
+        assert len(coordinator.active_workflows) == 1
+        assert coordinator.get_system_status()['active_workflows'] == 2
+        assert coordinator.active_workflows.get(workflow_id)['status'] == 'completed'
+        assert len(coordinator.active_workflows) == 1
+
+    def test_restarted_coordinator_completes_persisted_workflow(self, coordinator, coordination_db):
+        result = coordinator.coordinate_task("Implement feature")
+        coordinator.close()
+
+        restarted = PMCoordinator(coordination_db, load_flush_interval=None)
+        try:
+            agent = next(iter(result['agent_assignments'].values()))
+            assert restarted.complete_workflow(result['workflow_id']) is True
+            assert restarted.agent_capabilities[agent].current_load == 0.0
+        finally:
+            restarted.close()
+
+
+class TestSystemStatusSnapshot:
+    """Versioned get_system_status"""
+
+    def test_unchanged_status_is_not_modified(self, coordinator):
+        status = coordinator.get_system_status()
+        again = coordinator.get_system_status(if_version=status['version'])
+
+        assert again['not_modified'] is True
+        assert again['version'] == status['version']
+        assert 'agents' not in again
+
+    def test_incremental_updates_match_database_reload(self, coordinator, coordination_db):
+        before = coordinator.get_system_status()
+        result = coordinator.coordinate_task("Implement feature")
+        agent = next(iter(result['agent_assignments'].values()))
+        coordinator.notify_agent(agent, "Start work")
+
+        patched = coordinator.get_system_status(if_version=before['version'])
+        assert patched['version'] > before['version']
+        assert patched['active_workflows'] == 1
+        assert patched['agents'][agent]['coordination_count'] == 1
+        assert patched['agents'][agent]['status'] == 'busy'
+        assert patched['agents'][agent]['pending_notifications'] == 1
+
+        coordinator.status_snapshot.invalidate()
+        reloaded = coordinator.get_system_status()
+        assert reloaded['version'] == patched['version']
+        assert reloaded['agents'] == patched['agents']
+        # The reload folded in write-behind state rather than flushing it
+        assert _count(coordination_db, 'agent_status') == 0
+        assert 'workflow_cache' not in reloaded
+
+        coordinator.complete_workflow(result['workflow_id'])
+        completed = coordinator.get_system_status(if_version=patched['version'])
+        assert completed['active_workflows'] == 0
+        assert completed['agents'][agent]['status'] == 'available'
+
+    def test_concurrent_stale_reads_reload_once(self, coordinator):
+        loads = []
+        loader = coordinator.status_snapshot.loader
+        def slow_loader():
+            loads.append(1)
+            time.sleep(0.05)
+            return loader()
+        coordinator.status_snapshot.loader = slow_loader
+
+        threads = [threading.Thread(target=coordinator.get_system_status) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(loads) == 1
+
+    def test_external_writes_are_picked_up_after_ttl(self, coordination_db):
+        coordinator = PMCoordinator(coordination_db, load_flush_interval=None, status_ttl_seconds=0.5)
+        try:
+            status = coordinator.get_system_status()
+            with sqlite3.connect(coordination_db) as conn:
+                conn.execute("INSERT INTO agent_status (agent, status) VALUES ('external_agent', 'available')")
+
+            assert coordinator.get_system_status(if_version=status['version'])['not_modified'] is True
+            time.sleep(0.6)
+            refreshed = coordinator.get_system_status(if_version=status['version'])
+            assert 'external_agent' in refreshed['agents']
+        finally:
+            coordinator.close()
+
+
+class TestNotifications:
+    """notify_agent through the notification outbox"""
+
+    def test_fan_out_fetch_and_acknowledge(self, coordinator):
+        coordinator.coordinate_task("Implement feature")
+        assert coordinator.notify_agents(['james_developer', 'quinn_qa'], "Sprint starts", {'sprint': 3})
+
+        items = coordinator.fetch_notifications('quinn_qa')
+        assert [(item['message'], item['context']) for item in items] == [("Sprint starts", {'sprint': 3})]
+
+        assert coordinator.acknowledge_notifications('quinn_qa', items[-1]['cursor']) == 1
+        assert coordinator.fetch_notifications('quinn_qa') == []
+        assert len(coordinator.fetch_notifications('james_developer')) == 1
+
+
+class TestPerformanceStats:
+    """Per-step latency spans"""
+
+    STEPS = {'decompose', 'assign', 'configure_gates', 'build_decision',
+             'capture_decision', 'register_workflow', 'update_status', 'coordinate_task'}
+
+    def test_each_step_is_timed(self, coordinator):
+        for i in range(5):
+            coordinator.coordinate_task(f"Implement feature {i}")
+
+        stats = coordinator.get_performance_stats()
+        assert stats['enabled'] is True
+        assert self.STEPS <= set(stats['steps'])
+        total = stats['steps']['coordinate_task']
+        assert total['count'] == 5
+        assert total['min_ms'] <= total['p50_ms'] <= total['p95_ms'] <= total['p99_ms'] <= total['max_ms']
+
+    def test_disabled_metrics_record_nothing(self, coordination_db):
+        coordinator = PMCoordinator(coordination_db, load_flush_interval=None, metrics_enabled=False)
+        try:
+            coordinator.coordinate_task("Implement feature")
+            assert coordinator.get_performance_stats()['steps'] == {}
+        finally:
+            coordinator.close()
+
+    def test_metrics_flushed_on_close(self, coordination_db):
+        coordinator = PMCoordinator(coordination_db, load_flush_interval=None, metrics_flush_interval=60.0)
+        coordinator.coordinate_task("Implement feature")
+        coordinator.close()
+
+        with sqlite3.connect(coordination_db) as conn:
+            steps = dict(conn.execute("SELECT step, count FROM pm_step_metrics").fetchall())
+        assert steps['coordinate_task'] == 1
+        assert self.STEPS <= set(steps)
+
+
+class TestScheduleEstimate:
+    """Dependency-aware completion estimates"""
+
+    def test_complex_breakdown_overlaps_independent_subtasks(self, coordinator):
+        coordinator._analyze_task_complexity = lambda user_prompt, context: 9
+        result = coordinator.coordinate_task("Build the billing platform")
+
+        subtasks = {subtask['id']: subtask for subtask in result['task_breakdown']['subtasks']}
+        by_type = {subtask['type']: subtask['id'] for subtask in subtasks.values()}
+        assert subtasks[by_type['testing']]['depends_on'] == [by_type['implementation']]
+
+        schedule = result['schedule']
+        assert schedule['makespan_minutes'] < schedule['serial_minutes']
+        assert result['task_breakdown']['estimated_duration'] == round(schedule['makespan_minutes'])
+        testing = schedule['subtasks'][by_type['testing']]
+        implementation = schedule['subtasks'][by_type['implementation']]
+        assert testing['earliest_start'] >= implementation['earliest_finish']
+        assert result['estimated_completion'] == max(entry['earliest_finish'] for entry in schedule['subtasks'].values())
+
+
+class TestBreakdownReuse:
+    """Starting from the breakdown of a near-duplicate past task"""
+
+    PROMPT = "Build the billing platform with invoices, refunds and usage metering"
+
+    def test_similar_prompt_reuses_breakdown(self, coordination_db):
+        coordinator = PMCoordinator(coordination_db, load_flush_interval=None, reuse_threshold=0.6)
+        try:
+            coordinator._analyze_task_complexity = lambda user_prompt, context: 9
+            first = coordinator.coordinate_task(self.PROMPT)
+            assert first['reused_from'] is None
+
+            # A simple-looking prompt would normally get a single subtask
+            coordinator._analyze_task_complexity = lambda user_prompt, context: 1
+            prompt = self.PROMPT + " for EU customers"
+            second = coordinator.coordinate_task(prompt)
+        finally:
+            coordinator.close()
+
+        with sqlite3.connect(coordination_db) as conn:
+            reused_prompt = conn.execute(
+                "SELECT json_extract(decision_context, '$.user_prompt') FROM pm_decision_log WHERE id = ?",
+                (second['reused_from']['decision_log_id'],)
+            ).fetchone()[0]
+        assert reused_prompt == self.PROMPT
+        assert second['reused_from']['similarity'] >= 0.6
+        subtasks = second['task_breakdown']['subtasks']
+        assert [s['type'] for s in subtasks] == [s['type'] for s in first['task_breakdown']['subtasks']]
+        assert all(prompt in s['description'] for s in subtasks)
+        assert second['task_breakdown']['task_id'] != first['task_breakdown']['task_id']
+
+    def test_reuse_disabled_or_below_threshold(self, coordinator):
+        coordinator.coordinate_task(self.PROMPT)
+        assert coordinator.coordinate_task(self.PROMPT)['reused_from'] is None
+
+        coordinator.reuse_threshold = 0.9
+        assert coordinator.coordinate_task("Write the onboarding guide for new agents")['reused_from'] is None
@@ -0,0 +1,205 @@
+"""
+Integration tests for tiered retention
+Archives a throwaway coordination.db into a temporary partition directory
+"""
+
+import gzip
+import io
+import json
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from intercept.decision_capture import DecisionAnalytics, DecisionContext, DecisionType, PMDecisionCapture
+from intercept.maintenance import main as maintenance_main
+from intercept.payload_store import Payload
+from intercept.retention import RetentionManager
+
+NOW = datetime(2026, 6, 30, 12, 0, 0)
+
+
+def _decision(i: int, days_ago: int) -> DecisionContext:
+    return DecisionContext(
+        decision_id='',
+        decision_type=list(DecisionType)[i % 2],
+        context_data={'user_prompt': f"Ship billing feature {i}"},
+        reasoning_process=f"Routed billing feature {i}",
+        outcome=f"Outcome {i}",
+        confidence_score=5 + i % 5,
+        created_at=NOW - timedelta(days=days_ago, minutes=i)
+    )
+
+
+def _count(db_path, table):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+@pytest.fixture
+def history(coordination_db):
+    """40 decisions over 40 days, plus old coordination log and quality gate rows"""
+    capture = PMDecisionCapture(coordination_db)
+    capture.capture_decisions([_decision(i, days_ago=i) for i in range(40)])
+    old = (NOW - timedelta(days=60)).isoformat(sep=' ')
+    with sqlite3.connect(coordination_db) as conn:
+        conn.executemany(
+            "INSERT INTO coordination_log (agent, command, context, status, created_at) VALUES (?, ?, '{}', 'sent', ?)",
+            [('james_developer', 'assign', old), ('james_developer', 'notification', old),
+             ('quinn_qa', 'notification', old)]
+        )
+        conn.execute("INSERT OR REPLACE INTO agent_notification_cursors (agent, cursor) VALUES ('james_developer', 2)")
+        conn.execute(
+            "INSERT INTO quality_gate_executions (deliverable_id, quality_stage, quality_score, created_at)"
+            " VALUES ('d1', 'review', 8, ?)", (old,)
+        )
+    yield capture
+    capture.close()
+
+
+class TestArchive:
+    """Moving old rows to partitions"""
+
+    def test_old_rows_move_to_daily_partitions(self, history, coordination_db, tmp_path):
+        before = history.analyze_decision_patterns()
+        manager = RetentionManager(coordination_db, str(tmp_path / 'archive'))
+        report = manager.archive(older_than_days=10, now=NOW)
+
+        assert report['cutoff'] == '2026-06-20'
+        assert report['tables']['pm_decision_log'] == {'rows': 29, 'partitions': 29}
+        # The unacknowledged notification to quinn_qa stays hot
+        assert report['tables']['coordination_log'] == {'rows': 2, 'partitions': 1}
+        assert report['tables']['quality_gate_executions'] == {'rows': 1, 'partitions': 1}
+        assert report['rows_archived'] == 32
+        assert report['reclaimed_bytes'] >= 0 and report['archive_bytes'] > 0
+
+        assert _count(coordination_db, 'pm_decision_log') == 11
+        assert _count(coordination_db, 'coordination_log') == 1
+        partitions = manager.partitions('pm_decision_log')
+        assert [p['day'] for p in partitions] == sorted(p['day'] for p in partitions)
+        with gzip.open(partitions[0]['path'], 'rt') as lines:
+            row = json.loads(lines.readline())
+        assert row['decision_type'] in {t.value for t in DecisionType}
+        assert json.loads(row['decision_context'])['user_prompt'].startswith("Ship billing feature")
+
+        # Rollups still count the archived decisions; the search index drops them
+        assert history.analyze_decision_patterns()['confidence_by_type'] == before['confidence_by_type']
+        assert history.search_decisions("feature") and len(history.search_decisions("feature", limit=100)) == 11
+
+    def test_second_run_appends_new_partitions(self, history, coordination_db, tmp_path):
+        manager = RetentionManager(coordination_db, str(tmp_path))
+        manager.archive(older_than_days=30, now=NOW, tables=['pm_decision_log'])
+        report = manager.archive(older_than_days=10, now=NOW, tables=['pm_decision_log'], vacuum=True)
+
+        assert report['tables']['pm_decision_log']['rows'] == 20
+        assert report['db_bytes_after'] <= report['db_bytes_before']
+        assert sum(p['row_count'] for p in manager.partitions('pm_decision_log')) == 29
+
+    def test_rollup_rebuild_keeps_archived_days(self, history, coordination_db, tmp_path):
+        RetentionManager(coordination_db, str(tmp_path)).archive(older_than_days=10, now=NOW, tables=['pm_decision_log'])
+        # A late decision lands on an archived day, leaving it partly hot
+        history.capture_decisions([_decision(100, days_ago=20)])
+        rollup_sql = "SELECT * FROM pm_decision_daily_rollup ORDER BY day, decision_type"
+        with sqlite3.connect(coordination_db) as conn:
+            expected = conn.execute(rollup_sql).fetchall()
+            conn.execute("UPDATE pm_decision_daily_rollup SET decision_count = decision_count + 5")
+
+        assert maintenance_main(['--db', coordination_db, 'rollups']) == 0
+        with sqlite3.connect(coordination_db) as conn:
+            rebuilt = conn.execute(rollup_sql).fetchall()
+        archived_days = {day for day, *_ in expected if day < '2026-06-20'} - {'2026-06-10'}
+        assert [row for row in rebuilt if row[0] not in archived_days] == \
+            [row for row in expected if row[0] not in archived_days]
+        assert len(rebuilt) == len(expected)
+
+
+    def test_payloads_move_with_their_last_decision(self, coordination_db, tmp_path):
+        only_old, also_hot, in_workflow = (Payload.of({'task_id': name}) for name in ('old', 'hot', 'workflow'))
+
+        def decision(payload, days_ago):
+            return DecisionContext(
+                decision_id='', decision_type=DecisionType.TASK_ASSIGNMENT,
+                context_data={'user_prompt': payload.hash, 'task_breakdown_hash': payload.hash},
+                reasoning_process='', outcome='', confidence_score=5,
+                created_at=NOW - timedelta(days=days_ago)
+            )
+
+        capture = PMDecisionCapture(coordination_db)
+        try:
+            capture.capture_decisions(
+                [decision(only_old, 30), decision(also_hot, 30), decision(also_hot, 1), decision(in_workflow, 30)],
+                payloads=[only_old, also_hot, in_workflow]
+            )
+        finally:
+            capture.close()
+        with sqlite3.connect(coordination_db) as conn:
+            conn.execute(
+                "INSERT INTO workflow_state (id, workflow_type, context) VALUES ('wf_1', 'task_coordination', ?)",
+                (json.dumps({'task_breakdown_hash': in_workflow.hash}),)
+            )
+
+        manager = RetentionManager(coordination_db, str(tmp_path))
+        report = manager.archive(older_than_days=10, now=NOW, tables=['pm_decision_log'])
+
+        assert report['tables']['pm_decision_log'] == {'rows': 3, 'partitions': 1}
+        assert report['tables']['task_payloads'] == {'rows': 1, 'partitions': 1}
+        with sqlite3.connect(coordination_db) as conn:
+            kept = {row[0] for row in conn.execute("SELECT hash FROM task_payloads")}
+        assert kept == {also_hot.hash, in_workflow.hash}
+        [archived] = manager.iter_archived('task_payloads')
+        assert archived['hash'] == only_old.hash and json.loads(archived['body']) == {'task_id': 'old'}
+
+
+class TestArchiveFacade:
+    """Reading hot and archived rows as one history"""
+
+    def test_history_spans_hot_and_cold_in_order(self, history, coordination_db, tmp_path):
+        expected = [r.keyset for r in history.iter_decision_history(days_back=None, oldest_first=True)]
+        RetentionManager(coordination_db, str(tmp_path)).archive(older_than_days=10, now=NOW)
+
+        assert len(list(history.iter_decision_history(days_back=None))) == 11
+        merged = list(history.iter_decision_history(days_back=None, include_archived=True, page_size=4))
+        assert [r.keyset for r in merged] == expected[::-1]
+        assert merged[-1]['decision_context']['user_prompt'] == "Ship billing feature 39"
+
+        filtered = list(history.iter_decision_history(
+            DecisionType.QUALITY_GATE, days_back=None, min_confidence=8, include_archived=True,
+            since=NOW - timedelta(days=25), oldest_first=True
+        ))
+        assert filtered and all(
+            r['decision_type'] == 'quality_gate' and r['confidence_score'] >= 8
+            and r['created_at'] >= (NOW - timedelta(days=25)).isoformat() for r in filtered
+        )
+
+    def test_export_resumes_across_tiers(self, history, coordination_db, tmp_path):
+        RetentionManager(coordination_db, str(tmp_path)).archive(older_than_days=10, now=NOW)
+        analytics = DecisionAnalytics(history)
+
+        first, rest = io.StringIO(), io.StringIO()
+        page = analytics.export_decisions(first, max_rows=25, include_archived=True)
+        done = analytics.export_decisions(rest, resume_token=page['resume_token'], include_archived=True)
+
+        ids = [json.loads(line)['id'] for line in (first.getvalue() + rest.getvalue()).splitlines()]
+        assert page['rows'] == 25 and done['complete'] is True
+        assert sorted(ids) == list(range(1, 41)) and len(ids) == 40
+
+    def test_generic_table_facade(self, history, coordination_db, tmp_path):
+        manager = RetentionManager(coordination_db, str(tmp_path))
+        manager.archive(older_than_days=10, now=NOW)
+
+        rows = list(manager.iter_rows('coordination_log'))
+        assert [(r['agent'], r['command']) for r in rows] == [
+            ('james_developer', 'assign'), ('james_developer', 'notification'), ('quinn_qa', 'notification')
+        ]
+        assert len(list(manager.iter_rows('quality_gate_executions', since=NOW - timedelta(days=90)))) == 1
+        assert list(manager.iter_rows('quality_gate_executions', until=NOW - timedelta(days=90))) == []
+
+
+def test_maintenance_archive_command(history, coordination_db, tmp_path, capsys):
+    assert maintenance_main([
+        '--db', coordination_db, 'archive', '--older-than-days', '0',
+        '--archive-dir', str(tmp_path), '--tables', 'pm_decision_log', '--vacuum'
+    ]) == 0
+    out = capsys.readouterr().out
+    assert "pm_decision_log: 40 rows" in out and "reclaimed" in out
+    assert _count(coordination_db, 'pm_decision_log') == 0
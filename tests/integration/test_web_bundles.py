@@ -0,0 +1,86 @@
+"""
+Integration tests for WebBundleIndex
+Indexes throwaway web bundles into a temporary sidecar directory
+"""
+
+import json
+import os
+
+import pytest
+
+from intercept.web_bundles import WebBundleIndex, scan_sections
+
+
+def _section(path, body):
+    return (f"==================== START: {path} ====================\n{body}"
+            f"==================== END: {path} ====================\n\n")
+
+
+PREAMBLE = ("# Web Agent Bundle Instructions\n\n"
+            "- `==================== START: .bmad-core/folder/filename.md ====================`\n\n")
+DEV_BUNDLE = (PREAMBLE
+              + _section(".bmad-core/agents/dev.md", "# dev\n")
+              + _section(".bmad-core/tasks/apply-qa-fixes.md", "Apply fixes ✓\n")
+              + _section(".bmad-core/tasks/apply-qa-fixes.md", "Apply fixes ✓\n"))
+
+
+@pytest.fixture
+def bundles(tmp_path):
+    root = tmp_path / "web-bundles"
+    (root / "agents").mkdir(parents=True)
+    (root / "teams").mkdir()
+    (root / "agents" / "dev.txt").write_text(DEV_BUNDLE, encoding='utf-8')
+    (root / "teams" / "team-dev.txt").write_text(_section(".bmad-core/agent-teams/team-dev.yaml", "agents: [dev]\n"))
+    return root
+
+
+@pytest.fixture
+def index(bundles, tmp_path):
+    index = WebBundleIndex(str(bundles), str(tmp_path / "index"))
+    yield index
+    index.close()
+
+
+class TestWebBundleIndex:
+    """Sidecar offsets and mmap-backed resource views"""
+
+    def test_build_writes_sidecars_once(self, index, tmp_path):
+        assert index.build() == {'agents/dev': 2, 'teams/team-dev': 1}
+        sidecar = json.loads((tmp_path / "index" / "agents" / "dev.json").read_text())
+        assert sidecar['version'] == 1 and len(sidecar['sections']) == 2
+        assert index.build() == {}
+        assert index.build(force=True) == {'agents/dev': 2, 'teams/team-dev': 1}
+
+    def test_resources_are_zero_copy_slices(self, index):
+        index.build()
+        view = index.resource("agents/dev", ".bmad-core/tasks/apply-qa-fixes.md")
+        assert isinstance(view, memoryview) and view.readonly
+        assert bytes(view) == "Apply fixes ✓\n".encode('utf-8')
+        view.release()
+        assert index.resource_text("agents/dev", ".bmad-core/agents/dev.md") == "# dev\n"
+        # Quoted example markers are not sections
+        assert index.sections("agents/dev") == [".bmad-core/agents/dev.md", ".bmad-core/tasks/apply-qa-fixes.md"]
+
+    def test_sidecar_is_used_without_rescanning(self, index, bundles, tmp_path, monkeypatch):
+        index.build()
+        fresh = WebBundleIndex(str(bundles), str(tmp_path / "index"))
+        import intercept.web_bundles as web_bundles
+        monkeypatch.setattr(web_bundles, "scan_sections", lambda data: pytest.fail("rescanned"))
+        assert fresh.resource_text("teams/team-dev", ".bmad-core/agent-teams/team-dev.yaml") == "agents: [dev]\n"
+        fresh.close()
+
+    def test_changed_bundle_is_reindexed(self, index, bundles):
+        assert index.resource_text("agents/dev", ".bmad-core/agents/dev.md") == "# dev\n"
+        bundle = bundles / "agents" / "dev.txt"
+        replacement = bundle.with_suffix(".new")
+        replacement.write_text(_section(".bmad-core/agents/dev.md", "# dev, rebuilt\n"))
+        os.replace(replacement, bundle)
+
+        assert index.resource_text("agents/dev", ".bmad-core/agents/dev.md") == "# dev, rebuilt\n"
+        with pytest.raises(KeyError):
+            index.resource("agents/dev", ".bmad-core/tasks/apply-qa-fixes.md")
+
+    def test_unterminated_section_is_skipped(self):
+        data = (_section(".bmad-core/data/kb.md", "kb\n") + "==================== START: .bmad-core/data/cut.md "
+                "====================\ntruncated\n").encode()
+        assert list(scan_sections(data)) == [".bmad-core/data/kb.md"]